@@ -3,6 +3,15 @@ Custom sorting and searching algorithms.
 
 Provided:
     - merge_sort
+    - natural_merge_sort — iterative, key-cached, run-adaptive merge sort
+    - kway_merge         — heap-based merge of many sorted streams
+    - top_k, top_k_indices — bounded-heap / partition-based top-k selection
+    - counting_sort, radix_sort — stable integer-key sorts returning
+      permutation indices
+    - parallel_merge_sort — multi-process sort over shared-memory arrays
+    - batch_binary_search, batch_lower_bound, batch_upper_bound,
+      batch_range_search — vectorized lookups over a sorted key array
+    - IntervalIndex      — interval tree for point / range overlap queries
     - benchmark_sort
 
 Students must implement:
@@ -15,10 +24,17 @@ Use timeit to measure execution times.
 Document the Big-O complexity of each algorithm.
 """
 
+import heapq
+import os
 import timeit
-from collections.abc import Callable
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 from typing import Any
 
+import numpy as np
+
 
 # ---------------------------------------------------------------------------
 # Sorting — Merge Sort
@@ -68,6 +84,263 @@ def _merge(
     return result
 
 
+# ---------------------------------------------------------------------------
+# Sorting — Natural Merge Sort (production variant)
+# ---------------------------------------------------------------------------
+
+MIN_RUN = 32
+
+
+def natural_merge_sort(data: list[Any], key: Callable = lambda x: x) -> list[Any]:
+    """Sort *data* with a bottom-up, run-adaptive merge sort.
+
+    Differences from merge_sort:
+        - key() is called exactly once per item (decorate–sort–undecorate).
+        - No recursion and no slicing: merges ping-pong between the working
+          lists and a single auxiliary buffer allocated up front.
+        - Existing ascending runs (and strictly descending runs, which are
+          reversed in place) are detected first; short runs are extended to
+          MIN_RUN items with binary insertion. Adjacent runs that are
+          already in order are copied without comparing elements.
+
+    Args:
+        data: List of items to sort.
+        key: Function that extracts a comparison key from each item.
+
+    Returns:
+        A new sorted list. The sort is stable.
+
+    Complexity:
+        Time  — O(n log r) for r initial runs; O(n) on already-sorted input,
+                O(n log n) worst case
+        Space — O(n)
+    """
+    n = len(data)
+    items = list(data)
+    if n <= 1:
+        return items
+    keys = [key(x) for x in items]
+
+    # --- Pass 1: find natural runs, extend short ones to MIN_RUN ---
+    bounds = [0]
+    lo = 0
+    while lo < n:
+        hi = lo + 1
+        if hi < n and keys[hi] < keys[lo]:
+            while hi < n and keys[hi] < keys[hi - 1]:
+                hi += 1
+            keys[lo:hi] = keys[lo:hi][::-1]
+            items[lo:hi] = items[lo:hi][::-1]
+        else:
+            while hi < n and keys[hi] >= keys[hi - 1]:
+                hi += 1
+        end = min(n, lo + MIN_RUN)
+        while hi < end:
+            k, v = keys[hi], items[hi]
+            pos = bisect_right(keys, k, lo, hi)
+            keys[pos + 1:hi + 1] = keys[pos:hi]
+            items[pos + 1:hi + 1] = items[pos:hi]
+            keys[pos], items[pos] = k, v
+            hi += 1
+        bounds.append(hi)
+        lo = hi
+
+    # --- Pass 2: merge adjacent runs bottom-up through one aux buffer ---
+    src_k, src_v = keys, items
+    dst_k, dst_v = [None] * n, [None] * n
+    while len(bounds) > 2:
+        new_bounds = [0]
+        for r in range(0, len(bounds) - 1, 2):
+            lo, mid = bounds[r], bounds[r + 1]
+            hi = bounds[r + 2] if r + 2 < len(bounds) else mid
+            if mid == hi or src_k[mid - 1] <= src_k[mid]:
+                dst_k[lo:hi] = src_k[lo:hi]
+                dst_v[lo:hi] = src_v[lo:hi]
+            else:
+                _merge_runs(src_k, src_v, dst_k, dst_v, lo, mid, hi)
+            new_bounds.append(hi)
+        bounds = new_bounds
+        src_k, dst_k = dst_k, src_k
+        src_v, dst_v = dst_v, src_v
+
+    return src_v
+
+
+def _merge_runs(
+    src_k: list, src_v: list, dst_k: list, dst_v: list,
+    lo: int, mid: int, hi: int,
+) -> None:
+    """Stable merge of src[lo:mid] and src[mid:hi] into dst[lo:hi].
+
+    The prefix of the left run that precedes every right item and the
+    suffix of the right run that follows every left item are located by
+    binary search and copied as slices; only the overlap is merged
+    element by element.
+    """
+    i = bisect_right(src_k, src_k[mid], lo, mid)
+    end = bisect_left(src_k, src_k[mid - 1], mid, hi)
+    dst_k[lo:i] = src_k[lo:i]
+    dst_v[lo:i] = src_v[lo:i]
+    dst_k[end:hi] = src_k[end:hi]
+    dst_v[end:hi] = src_v[end:hi]
+    j, out, hi = mid, i, end
+    while i < mid and j < hi:
+        if src_k[j] < src_k[i]:
+            dst_k[out] = src_k[j]
+            dst_v[out] = src_v[j]
+            j += 1
+        else:
+            dst_k[out] = src_k[i]
+            dst_v[out] = src_v[i]
+            i += 1
+        out += 1
+    if i < mid:
+        dst_k[out:hi] = src_k[i:mid]
+        dst_v[out:hi] = src_v[i:mid]
+    else:
+        dst_k[out:hi] = src_k[j:hi]
+        dst_v[out:hi] = src_v[j:hi]
+
+
+# ---------------------------------------------------------------------------
+# Merging — k-way merge
+# ---------------------------------------------------------------------------
+
+def kway_merge(runs: list[Iterable[tuple[Any, Any]]]) -> Iterator[tuple[Any, Any]]:
+    """Merge k sorted streams of (key, item) pairs into one sorted stream.
+
+    A heap holds the current head of every run, so each output pair costs
+    O(log k). Ties are broken by run position, which keeps the merge
+    stable when runs are given in input order; items themselves are never
+    compared.
+
+    Args:
+        runs: Iterables, each yielding (key, item) pairs in ascending key order.
+
+    Yields:
+        (key, item) pairs in ascending key order.
+
+    Complexity:
+        Time  — O(n log k)
+        Space — O(k)
+    """
+    iters = [iter(run) for run in runs]
+    heap = []
+    for idx, it in enumerate(iters):
+        for key, item in it:
+            heap.append((key, idx, item))
+            break
+    heapq.heapify(heap)
+
+    while heap:
+        key, idx, item = heap[0]
+        yield key, item
+        for next_key, next_item in iters[idx]:
+            heapq.heapreplace(heap, (next_key, idx, next_item))
+            break
+        else:
+            heapq.heappop(heap)
+
+
+# ---------------------------------------------------------------------------
+# Selection — Top-k
+# ---------------------------------------------------------------------------
+
+def top_k(items: Iterable[Any], k: int, key: Callable = lambda x: x) -> list[Any]:
+    """Return the *k* items with the largest keys from any iterable.
+
+    Keeps a min-heap of at most *k* entries, so a stream is consumed in
+    one pass with O(k) memory. Ties go to the item seen first, and items
+    themselves are never compared.
+
+    Args:
+        items: Any iterable (list, generator, file reader …).
+        k: Number of items to keep.
+        key: Function that extracts a comparison key from each item.
+
+    Returns:
+        Up to *k* items, largest key first; equal keys in arrival order.
+
+    Complexity:
+        Time  — O(n log k)
+        Space — O(k)
+    """
+    if k <= 0:
+        return []
+    # (key, -seq) orders later arrivals below earlier ones on equal keys,
+    # so the heap root is always the entry to evict next.
+    heap: list[tuple[Any, int, Any]] = []
+    for seq, item in enumerate(items):
+        entry = (key(item), -seq, item)
+        if len(heap) < k:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+    heap.sort(key=lambda e: e[:2], reverse=True)
+    return [item for _, _, item in heap]
+
+
+def top_k_indices(
+    values: Any,
+    k: int,
+    key: Callable | None = None,
+    tiebreak: Any = None,
+) -> np.ndarray:
+    """Return the positions of the *k* largest values of an array.
+
+    np.partition finds the k-th largest score in O(n); everything above
+    it is selected outright and only the entries equal to it are ranked
+    to fill the remaining slots. Only the k winners are then sorted.
+
+    Args:
+        values: 1-D array-like.
+        k: Number of positions to return.
+        key: Optional vectorized function mapping *values* to scores.
+        tiebreak: Optional array aligned with *values* (e.g. labels);
+            equal scores are ordered by ascending tiebreak, then position.
+
+    Returns:
+        Index array of length min(k, n), highest score first.
+
+    Complexity:
+        Time  — O(n + k log k) (plus sorting the entries tied at the cut)
+        Space — O(n)
+    """
+    scores = np.asarray(values if key is None else key(np.asarray(values)))
+    n = len(scores)
+    k = min(max(k, 0), n)
+    if k == 0:
+        return np.zeros(0, dtype=np.intp)
+    order = None if tiebreak is None else np.asarray(tiebreak)
+
+    def ranked(idx: np.ndarray) -> np.ndarray:
+        """Sort idx by tiebreak then position (stable argsort keeps position)."""
+        if order is None:
+            return idx
+        return idx[np.argsort(order[idx], kind="stable")]
+
+    if k < n:
+        threshold = np.partition(scores, n - k)[n - k]
+        above = np.flatnonzero(scores > threshold)
+        tied = ranked(np.flatnonzero(scores == threshold))
+        chosen = np.concatenate((above, tied[:k - len(above)]))
+    else:
+        chosen = np.arange(n)
+
+    # Final order: score desc, then tiebreak asc, then position asc.
+    chosen = ranked(np.sort(chosen))
+    return chosen[np.argsort(-_rank_scores(scores[chosen]), kind="stable")]
+
+
+def _rank_scores(scores: np.ndarray) -> np.ndarray:
+    """Map scores to integers preserving order, so they can be negated."""
+    if np.issubdtype(scores.dtype, np.number) and not np.issubdtype(
+        scores.dtype, np.unsignedinteger
+    ):
+        return scores
+    return np.unique(scores, return_inverse=True)[1]
+
+
 # ---------------------------------------------------------------------------
 # Sorting — Insertion Sort (TODO)
 # ---------------------------------------------------------------------------
@@ -156,6 +429,599 @@ def binary_search(
     return None
 
 
+# ---------------------------------------------------------------------------
+# Sorting — Counting / Radix Sort (integer keys, NumPy)
+# ---------------------------------------------------------------------------
+
+# Widest key span counting_sort accepts; one radix digit is this many values.
+COUNTING_SORT_MAX_RANGE = 1 << 16
+RADIX_BITS = 16
+
+
+def _integer_keys(keys: Any) -> np.ndarray:
+    """Return *keys* as a 1-D int64 array, rejecting non-integer input."""
+    arr = np.asarray(keys)
+    if arr.ndim != 1:
+        raise ValueError("keys must be one-dimensional")
+    if arr.size and not (np.issubdtype(arr.dtype, np.integer)
+                         or np.issubdtype(arr.dtype, np.bool_)):
+        raise ValueError(f"keys must be integers, got dtype {arr.dtype}")
+    return arr.astype(np.int64, copy=False)
+
+
+def _digit_argsort(digits: np.ndarray) -> np.ndarray:
+    """Stable argsort of one digit pass.
+
+    NumPy sorts 8- and 16-bit integers with kind='stable' by counting /
+    radix sort (a histogram, a prefix sum and one scatter), so narrowing
+    the digit dtype is what makes each pass O(n).
+    """
+    dtype = np.uint8 if digits.size == 0 or digits.max() < 256 else np.uint16
+    return np.argsort(digits.astype(dtype, copy=False), kind="stable")
+
+
+def counting_sort(keys: Any) -> np.ndarray:
+    """Return the stable sorting permutation of small-range integer keys.
+
+    Keys are shifted by their minimum, so negative values are fine; the
+    span max - min must fit in COUNTING_SORT_MAX_RANGE (station codes,
+    hour of day, weekday, user type codes).
+
+    Args:
+        keys: 1-D integer array-like.
+
+    Returns:
+        Index array ``perm`` such that ``keys[perm]`` is sorted and equal
+        keys keep their original order.
+
+    Raises:
+        ValueError: If keys are not integers or their span is too wide
+            (use radix_sort instead).
+
+    Complexity:
+        Time  — O(n + k) for k = max - min + 1
+        Space — O(n + k)
+    """
+    arr = _integer_keys(keys)
+    if arr.size == 0:
+        return np.zeros(0, dtype=np.intp)
+    low = arr.min()
+    span = int(arr.max()) - int(low) + 1
+    if span > COUNTING_SORT_MAX_RANGE:
+        raise ValueError(
+            f"Key range {span} exceeds {COUNTING_SORT_MAX_RANGE}; use radix_sort"
+        )
+    return _digit_argsort(arr - low)
+
+
+def radix_sort(keys: Any, bits: int = RADIX_BITS) -> np.ndarray:
+    """Return the stable sorting permutation of integer keys (LSD radix).
+
+    Each pass stably reorders the current permutation by the next *bits*
+    bits of (key - min), least significant digit first. Epoch seconds for
+    a year of trips span ~25 bits, i.e. two 16-bit passes.
+
+    Args:
+        keys: 1-D integer array-like (any int64 values).
+        bits: Digit width, 1–16.
+
+    Returns:
+        Index array ``perm`` such that ``keys[perm]`` is sorted and equal
+        keys keep their original order.
+
+    Raises:
+        ValueError: If keys are not integers or *bits* is out of range.
+
+    Complexity:
+        Time  — O(d · n) for d = ceil(log2(max - min + 1) / bits) passes
+        Space — O(n)
+    """
+    if not 1 <= bits <= 16:
+        raise ValueError("bits must be between 1 and 16")
+    arr = _integer_keys(keys)
+    if arr.size == 0:
+        return np.zeros(0, dtype=np.intp)
+    # Work on unsigned offsets so the shifts below see no sign bit.
+    offsets = (arr - arr.min()).view(np.uint64)
+    width = max(int(offsets.max()).bit_length(), 1)
+    mask = np.uint64((1 << bits) - 1)
+
+    perm = None
+    for shift in range(0, width, bits):
+        current = offsets if perm is None else offsets[perm]
+        order = _digit_argsort((current >> np.uint64(shift)) & mask)
+        perm = order if perm is None else perm[order]
+    return perm
+
+
+# ---------------------------------------------------------------------------
+# Sorting — Parallel Merge Sort (processes + shared memory)
+# ---------------------------------------------------------------------------
+
+# Below this many keys, parallel_merge_sort sorts in the calling process.
+PARALLEL_SORT_MIN_KEYS = 100_000
+
+# Per-process views of the shared sort buffers, set by _attach_sort_buffers().
+# Keys and permutation are double-buffered: each merge round reads one
+# side and writes the other.
+_SORT_BUFFERS: dict[str, list] = {}
+
+
+def _attach_sort_buffers(names: tuple[str, ...], n: int, dtype: str) -> None:
+    """Map the four shared sort buffers (2 × keys, 2 × perm) into this process."""
+    _detach_sort_buffers()
+    handles = [shared_memory.SharedMemory(name=name) for name in names]
+    dtypes = (dtype, dtype, "int64", "int64")
+    arrays = [np.ndarray(n, dtype=d, buffer=h.buf) for d, h in zip(dtypes, handles)]
+    _SORT_BUFFERS.update(handles=handles, keys=arrays[:2], perm=arrays[2:])
+
+
+def _detach_sort_buffers() -> None:
+    handles = _SORT_BUFFERS.get("handles", [])
+    _SORT_BUFFERS.clear()  # drop the array views before closing the mappings
+    for handle in handles:
+        handle.close()
+
+
+def _sort_partition(bounds: tuple[int, int]) -> None:
+    """Stably sort keys[0][lo:hi] in place, recording original positions."""
+    lo, hi = bounds
+    keys, perm = _SORT_BUFFERS["keys"][0], _SORT_BUFFERS["perm"][0]
+    order = np.argsort(keys[lo:hi], kind="stable")
+    keys[lo:hi] = keys[lo:hi][order]
+    perm[lo:hi] = order + lo
+
+
+def _merge_segment(task: tuple[int, int, int, int, int, int]) -> None:
+    """Merge src[a_lo:a_hi] and src[b_lo:b_hi] into the other buffer at out_lo.
+
+    Each element's output slot is its own index plus the number of
+    elements of the other run placed before it — searchsorted 'left' for
+    the left run, 'right' for the right run — so ties keep the left run
+    first and the merge is stable.
+    """
+    src, a_lo, a_hi, b_lo, b_hi, out_lo = task
+    keys, perm = _SORT_BUFFERS["keys"], _SORT_BUFFERS["perm"]
+    a, b = keys[src][a_lo:a_hi], keys[src][b_lo:b_hi]
+    pos_a = np.arange(len(a)) + np.searchsorted(b, a, side="left") + out_lo
+    pos_b = np.arange(len(b)) + np.searchsorted(a, b, side="right") + out_lo
+    keys[1 - src][pos_a] = a
+    keys[1 - src][pos_b] = b
+    perm[1 - src][pos_a] = perm[src][a_lo:a_hi]
+    perm[1 - src][pos_b] = perm[src][b_lo:b_hi]
+
+
+def _plan_merge_round(
+    bounds: list[int], src: int, workers: int
+) -> tuple[list[tuple[int, ...]], list[int]]:
+    """Plan one round merging adjacent runs pairwise.
+
+    When there are fewer pairs than workers, each pair is cut into
+    independent segments: the left run is split evenly and the matching
+    split points in the right run are found by binary search. This keeps
+    every worker busy even for the final two-run merge.
+
+    Returns:
+        (tasks for _merge_segment, run bounds after the round)
+    """
+    keys = _SORT_BUFFERS["keys"][src]
+    n_pairs = len(bounds) // 2
+    pieces = max(1, -(-workers // n_pairs))
+    tasks = []
+    new_bounds = [bounds[0]]
+    for i in range(0, len(bounds) - 1, 2):
+        a_lo, a_hi = bounds[i], bounds[i + 1]
+        b_hi = bounds[i + 2] if i + 2 < len(bounds) else a_hi
+        cuts_a = np.unique(np.linspace(a_lo, a_hi, pieces + 1).astype(np.int64))
+        inner = cuts_a[1:-1]
+        cuts_b = np.concatenate((
+            [a_hi],
+            np.searchsorted(keys[a_hi:b_hi], keys[inner], side="left") + a_hi,
+            [b_hi],
+        ))
+        if len(cuts_a) == 1:  # empty left run
+            cuts_a = np.array([a_lo, a_hi])
+        for k in range(len(cuts_a) - 1):
+            sa_lo, sa_hi = int(cuts_a[k]), int(cuts_a[k + 1])
+            sb_lo, sb_hi = int(cuts_b[k]), int(cuts_b[k + 1])
+            tasks.append((src, sa_lo, sa_hi, sb_lo, sb_hi, sa_lo + sb_lo - a_hi))
+        new_bounds.append(b_hi)
+    return tasks, new_bounds
+
+
+def parallel_merge_sort(keys: Any, max_workers: int | None = None) -> np.ndarray:
+    """Return the stable sorting permutation of *keys* using several processes.
+
+    The keys are copied once into multiprocessing.shared_memory buffers
+    mapped by every worker, so no array data is pickled — tasks are just
+    index bounds. The input is cut into one contiguous partition per
+    worker and each partition is sorted in its own process; sorted runs
+    are then merged pairwise in rounds, with the merges themselves split
+    into segments spread over the pool (see _plan_merge_round).
+
+    Args:
+        keys: 1-D numeric array-like.
+        max_workers: Worker processes (default os.cpu_count()). With one
+            worker, or fewer than PARALLEL_SORT_MIN_KEYS keys, the same
+            partition / merge steps run in the calling process.
+
+    Returns:
+        Index array ``perm`` such that ``keys[perm]`` is sorted and equal
+        keys keep their original order.
+
+    Raises:
+        ValueError: If keys are not a 1-D numeric array or max_workers < 1.
+
+    Complexity:
+        Time  — O((n log n) / p + n log p) for p workers
+        Space — O(n) shared (two key buffers, two permutation buffers)
+    """
+    arr = np.asarray(keys)
+    if arr.ndim != 1 or not (np.issubdtype(arr.dtype, np.number)
+                             or np.issubdtype(arr.dtype, np.bool_)):
+        raise ValueError("keys must be a one-dimensional numeric array")
+    if max_workers is not None and max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    n = len(arr)
+    if n < 2:
+        return np.arange(n, dtype=np.intp)
+    workers = max_workers or os.cpu_count() or 1
+    if n < PARALLEL_SORT_MIN_KEYS:
+        workers = 1
+
+    sizes = (arr.itemsize, arr.itemsize, 8, 8)
+    segments = [shared_memory.SharedMemory(create=True, size=n * s) for s in sizes]
+    names = tuple(shm.name for shm in segments)
+    try:
+        _attach_sort_buffers(names, n, arr.dtype.str)
+        _SORT_BUFFERS["keys"][0][:] = arr
+        bounds = np.linspace(0, n, workers + 1).astype(np.int64).tolist()
+        partitions = list(zip(bounds[:-1], bounds[1:]))
+
+        if workers == 1:
+            src = _sort_rounds(map, partitions, bounds, workers)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_attach_sort_buffers,
+                initargs=(names, n, arr.dtype.str),
+            ) as pool:
+                src = _sort_rounds(pool.map, partitions, bounds, workers)
+        return _SORT_BUFFERS["perm"][src].astype(np.intp)
+    finally:
+        _detach_sort_buffers()
+        for shm in segments:
+            shm.close()
+            shm.unlink()
+
+
+def _sort_rounds(
+    run: Callable, partitions: list[tuple[int, int]], bounds: list[int], workers: int
+) -> int:
+    """Sort every partition, then merge until one run remains.
+
+    *run* is ``map`` or ``pool.map``. Returns the buffer index (0 or 1)
+    holding the result.
+    """
+    list(run(_sort_partition, partitions))
+    src = 0
+    while len(bounds) > 2:
+        tasks, bounds = _plan_merge_round(bounds, src, workers)
+        list(run(_merge_segment, tasks))
+        src = 1 - src
+    return src
+
+
+# ---------------------------------------------------------------------------
+# Searching — Batched Binary Search (NumPy)
+# ---------------------------------------------------------------------------
+
+def batch_lower_bound(sorted_keys: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """Return, for each target, the first index i with sorted_keys[i] >= target.
+
+    Args:
+        sorted_keys: 1-D array sorted in ascending order (precomputed keys).
+        targets: Array of values to look up.
+
+    Returns:
+        Integer array of insertion positions, same shape as *targets*.
+
+    Complexity:
+        Time  — O(m log n) for m targets, in a single vectorized call
+        Space — O(m)
+    """
+    return np.searchsorted(sorted_keys, targets, side="left")
+
+
+def batch_upper_bound(sorted_keys: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """Return, for each target, the first index i with sorted_keys[i] > target."""
+    return np.searchsorted(sorted_keys, targets, side="right")
+
+
+def batch_binary_search(
+    sorted_keys: np.ndarray, targets: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Look up many targets at once in a sorted key array.
+
+    Batched counterpart of binary_search: instead of calling key() on list
+    items at every probe, the keys are precomputed once into an array.
+
+    Args:
+        sorted_keys: 1-D array sorted in ascending order.
+        targets: Array of values to look up.
+
+    Returns:
+        (positions, found) — positions holds the index of the first
+        matching key, or -1 where *found* is False.
+
+    Complexity:
+        Time  — O(m log n)
+        Space — O(m)
+    """
+    sorted_keys = np.asarray(sorted_keys)
+    targets = np.asarray(targets)
+    pos = np.searchsorted(sorted_keys, targets, side="left")
+    in_range = pos < len(sorted_keys)
+    found = np.zeros(pos.shape, dtype=bool)
+    found[in_range] = sorted_keys[pos[in_range]] == targets[in_range]
+    return np.where(found, pos, -1), found
+
+
+def batch_range_search(
+    sorted_keys: np.ndarray, lows: np.ndarray, highs: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Find the slice of keys in the closed range [low, high] for each pair.
+
+    Returns:
+        (starts, ends) — sorted_keys[starts[i]:ends[i]] are exactly the keys
+        with lows[i] <= key <= highs[i]; ends - starts gives the counts.
+    """
+    starts = np.searchsorted(sorted_keys, lows, side="left")
+    ends = np.searchsorted(sorted_keys, highs, side="right")
+    return starts, np.maximum(starts, ends)
+
+
+# ---------------------------------------------------------------------------
+# Searching — Interval Index (centered interval tree, NumPy)
+# ---------------------------------------------------------------------------
+
+def _ragged_arange(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Concatenate arange(s, s + n) for every (s, n) pair without a loop."""
+    total = int(lengths.sum())
+    if total == 0:
+        return np.zeros(0, dtype=np.int64)
+    run_starts = np.cumsum(lengths) - lengths
+    return np.repeat(starts - run_starts, lengths) + np.arange(total)
+
+
+class IntervalIndex:
+    """Centered interval tree over closed intervals [start, end].
+
+    Every node stores the intervals containing its center twice — sorted by
+    start and sorted by end — in flat NumPy arrays, so a stabbing query
+    reports a node's matches with one binary search plus a slice. Intervals
+    entirely left / right of the center go to the child subtrees; small
+    subtrees become leaves that are scanned with a vectorized mask.
+
+    Works on numbers or datetime64 values (e.g. trip start_time / end_time):
+
+        index = IntervalIndex(trips["start_time"], trips["end_time"])
+        in_progress = index.overlap_point(np.datetime64("2024-03-01T08:15"))
+        out_during = index.overlap_range(window_start, window_end)
+
+    Query results are positions into the original arrays.
+
+    Complexity:
+        Build — O(n log n) time, O(n) space
+        Query — O(log n + k) per point / range for k matches
+        Count — O(log n) per query (two binary searches)
+    """
+
+    LEAF_SIZE = 64
+    # Queries scanned against a leaf at once (bounds the mask size).
+    _LEAF_QUERY_BLOCK = 65_536
+
+    def __init__(self, starts: Any, ends: Any, leaf_size: int = LEAF_SIZE) -> None:
+        starts, ends = np.asarray(starts), np.asarray(ends)
+        if starts.ndim != 1 or starts.shape != ends.shape:
+            raise ValueError("starts and ends must be 1-D arrays of equal length")
+        if leaf_size < 1:
+            raise ValueError("leaf_size must be at least 1")
+        self._time_dtype = None
+        if np.issubdtype(starts.dtype, np.datetime64):
+            self._time_dtype = np.result_type(starts.dtype, ends.dtype)
+        self._starts = self._coerce(starts)
+        self._ends = self._coerce(ends)
+        bad = np.flatnonzero(self._ends < self._starts)
+        if len(bad):
+            raise ValueError(f"end before start at rows {bad[:5].tolist()}")
+        self._leaf_size = leaf_size
+        self._sorted_starts = np.sort(self._starts)
+        self._sorted_ends = np.sort(self._ends)
+        self._build()
+
+    def _coerce(self, values: Any) -> np.ndarray:
+        """Convert endpoints or query values to the internal numeric keys."""
+        if self._time_dtype is not None:
+            return np.asarray(values, dtype=self._time_dtype).view(np.int64)
+        return np.asarray(values, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    def _build(self) -> None:
+        centers: list = []
+        children: list[list[int]] = []
+        segments: list[tuple[int, int]] = []
+        leaves: list[bool] = []
+        by_start: list[np.ndarray] = []
+        by_end: list[np.ndarray] = []
+        offset = 0
+
+        stack: list[tuple[int, int, np.ndarray]] = []  # (parent, side, ids)
+
+        def add_node(ids: np.ndarray, center: Any, leaf: bool) -> int:
+            nonlocal offset
+            node = len(centers)
+            centers.append(center)
+            children.append([-1, -1])
+            leaves.append(leaf)
+            s_order = ids[np.argsort(self._starts[ids], kind="stable")]
+            e_order = ids[np.argsort(self._ends[ids], kind="stable")]
+            by_start.append(s_order)
+            by_end.append(e_order)
+            segments.append((offset, len(ids)))
+            offset += len(ids)
+            return node
+
+        stack.append((-1, 0, np.arange(len(self._starts))))
+        while stack:
+            parent, side, ids = stack.pop()
+            if len(ids) <= self._leaf_size:
+                node = add_node(ids, 0, leaf=True)
+            else:
+                s, e = self._starts[ids], self._ends[ids]
+                endpoints = np.concatenate((s, e))
+                center = np.partition(endpoints, len(ids))[len(ids)]
+                left, right = e < center, s > center
+                mid = ~(left | right)
+                node = add_node(ids[mid], center, leaf=False)
+                if left.any():
+                    stack.append((node, 0, ids[left]))
+                if right.any():
+                    stack.append((node, 1, ids[right]))
+            if parent >= 0:
+                children[parent][side] = node
+
+        self._centers = np.array(centers, dtype=self._starts.dtype)
+        self._children = np.array(children, dtype=np.int64).reshape(-1, 2)
+        self._segments = np.array(segments, dtype=np.int64).reshape(-1, 2)
+        self._leaves = np.array(leaves, dtype=bool)
+        self._by_start = np.concatenate(by_start) if by_start else np.zeros(0, np.int64)
+        self._by_end = np.concatenate(by_end) if by_end else np.zeros(0, np.int64)
+        self._by_start_keys = self._starts[self._by_start]
+        self._by_end_keys = self._ends[self._by_end]
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def overlap_point(self, point: Any) -> np.ndarray:
+        """Return positions of intervals containing *point*, ascending."""
+        return self.overlap_range(point, point)
+
+    def overlap_range(self, lo: Any, hi: Any) -> np.ndarray:
+        """Return positions of intervals overlapping [lo, hi], ascending."""
+        _, ids = self.overlap_ranges([lo], [hi])
+        return ids
+
+    def overlap_points(self, points: Any) -> tuple[np.ndarray, np.ndarray]:
+        """Batched overlap_point; see overlap_ranges for the result layout."""
+        return self.overlap_ranges(points, points)
+
+    def overlap_ranges(self, los: Any, his: Any) -> tuple[np.ndarray, np.ndarray]:
+        """Answer many range queries in one traversal of the tree.
+
+        Each node is visited once with every query routed to it, and its
+        matches for all of them are gathered with vectorized slicing.
+
+        Returns:
+            (offsets, ids) in CSR layout: the matches of query i are
+            ids[offsets[i]:offsets[i + 1]], in ascending order.
+        """
+        los, his = self._coerce(los).ravel(), self._coerce(his).ravel()
+        if los.shape != his.shape:
+            raise ValueError("los and his must have the same length")
+        out_q: list[np.ndarray] = []
+        out_ids: list[np.ndarray] = []
+
+        stack = [(0, np.arange(len(los)))] if len(self._centers) else []
+        while stack:
+            node, q = stack.pop()
+            lo, hi = los[q], his[q]
+            off, cnt = self._segments[node]
+            if self._leaves[node]:
+                self._scan_leaf(node, q, lo, hi, out_q, out_ids)
+                continue
+
+            c = self._centers[node]
+            go_left, go_right = hi < c, lo > c
+            spans = ~(go_left | go_right)
+            keys_s = self._by_start_keys[off:off + cnt]
+            keys_e = self._by_end_keys[off:off + cnt]
+            # hi < c: every node interval reaches c, so match iff start <= hi.
+            n_left = np.searchsorted(keys_s, hi[go_left], side="right")
+            self._emit(q[go_left], off, np.zeros_like(n_left), n_left,
+                       self._by_start, out_q, out_ids)
+            # lo > c: match iff end >= lo, a suffix of the end order.
+            first = np.searchsorted(keys_e, lo[go_right], side="left")
+            self._emit(q[go_right], off, first, cnt - first,
+                       self._by_end, out_q, out_ids)
+            # lo <= c <= hi: every node interval matches.
+            n_all = np.full(int(spans.sum()), cnt)
+            self._emit(q[spans], off, np.zeros_like(n_all), n_all,
+                       self._by_start, out_q, out_ids)
+
+            left, right = self._children[node]
+            if left >= 0 and (go_left | spans).any():
+                stack.append((left, q[go_left | spans]))
+            if right >= 0 and (go_right | spans).any():
+                stack.append((right, q[go_right | spans]))
+
+        return self._to_csr(len(los), out_q, out_ids)
+
+    def count_points(self, points: Any) -> np.ndarray:
+        """Number of intervals containing each point (vectorized)."""
+        return self.count_ranges(points, points)
+
+    def count_ranges(self, los: Any, his: Any) -> np.ndarray:
+        """Number of intervals overlapping each [lo, hi] (vectorized).
+
+        Overlapping = started by hi minus those already ended before lo;
+        the latter are a subset of the former, so two binary searches
+        per query suffice.
+        """
+        los, his = self._coerce(los), self._coerce(his)
+        started = np.searchsorted(self._sorted_starts, his, side="right")
+        ended = np.searchsorted(self._sorted_ends, los, side="left")
+        return np.maximum(started - ended, 0)
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _emit(q, off, begin, length, order, out_q, out_ids) -> None:
+        if len(q):
+            out_q.append(np.repeat(q, length))
+            out_ids.append(order[off + _ragged_arange(begin, length)])
+
+    def _scan_leaf(self, node, q, lo, hi, out_q, out_ids) -> None:
+        off, cnt = self._segments[node]
+        ids = self._by_start[off:off + cnt]
+        s, e = self._starts[ids], self._ends[ids]
+        for b in range(0, len(q), self._LEAF_QUERY_BLOCK):
+            block = slice(b, b + self._LEAF_QUERY_BLOCK)
+            mask = (s[None, :] <= hi[block, None]) & (e[None, :] >= lo[block, None])
+            rows, cols = np.nonzero(mask)
+            out_q.append(q[block][rows])
+            out_ids.append(ids[cols])
+
+    @staticmethod
+    def _to_csr(n_queries, out_q, out_ids) -> tuple[np.ndarray, np.ndarray]:
+        if not out_q:
+            return np.zeros(n_queries + 1, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        q, ids = np.concatenate(out_q), np.concatenate(out_ids)
+        order = np.lexsort((ids, q))
+        offsets = np.zeros(n_queries + 1, dtype=np.int64)
+        np.cumsum(np.bincount(q, minlength=n_queries), out=offsets[1:])
+        return offsets, ids[order].astype(np.int64)
+
+
 # ---------------------------------------------------------------------------
 # Searching — Linear Search (TODO)
 # ---------------------------------------------------------------------------
@@ -195,48 +1061,180 @@ def linear_search(
 # ---------------------------------------------------------------------------
 
 def benchmark_sort(data: list, key: Callable = lambda x: x, repeats: int = 5) -> dict:
-    """Compare custom merge_sort vs. built-in sorted().
+    """Compare custom merge_sort and natural_merge_sort vs. built-in sorted().
+
+    When every key is an int, the benchmark_integer_sort timings
+    (counting / radix sort vs. np.argsort) are included as well.
 
     Returns:
-        A dict with 'merge_sort_ms' and 'builtin_sorted_ms' timings.
+        A dict with 'merge_sort_ms', 'natural_merge_sort_ms' and
+        'builtin_sorted_ms' timings.
     """
     custom_time = timeit.timeit(
         lambda: merge_sort(data, key=key), number=repeats
     )
+    natural_time = timeit.timeit(
+        lambda: natural_merge_sort(data, key=key), number=repeats
+    )
     builtin_time = timeit.timeit(
         lambda: sorted(data, key=key), number=repeats
     )
 
-    return {
+    result = {
         "merge_sort_ms": round(custom_time / repeats * 1000, 2),
+        "natural_merge_sort_ms": round(natural_time / repeats * 1000, 2),
         "builtin_sorted_ms": round(builtin_time / repeats * 1000, 2),
     }
 
+    keys = [key(x) for x in data]
+    if keys and all(isinstance(k, int) for k in keys):
+        result.update(benchmark_integer_sort(keys, repeats, include_builtin=False))
+    return result
+
+
+def benchmark_integer_sort(keys: Any, repeats: int = 3, include_builtin: bool = True) -> dict:
+    """Compare counting_sort / radix_sort with np.argsort and sorted().
+
+    Meant for multi-million-row key columns (start epoch seconds, station
+    or user codes), where the comparison sorts above are far too slow.
+    All results are permutations, so sorted() is timed as an argsort over
+    row indices.
+
+    Returns:
+        A dict with 'radix_sort_ms', 'np_argsort_ms' (quicksort, unstable),
+        'np_argsort_stable_ms', plus 'counting_sort_ms' when the key span
+        fits and 'builtin_sorted_ms' when *include_builtin* is set.
+    """
+    arr = _integer_keys(keys)
+
+    def ms(fn: Callable) -> float:
+        return round(timeit.timeit(fn, number=repeats) / repeats * 1000, 2)
+
+    result = {
+        "radix_sort_ms": ms(lambda: radix_sort(arr)),
+        "np_argsort_ms": ms(lambda: np.argsort(arr)),
+        "np_argsort_stable_ms": ms(lambda: np.argsort(arr, kind="stable")),
+    }
+    if arr.size and int(arr.max()) - int(arr.min()) < COUNTING_SORT_MAX_RANGE:
+        result["counting_sort_ms"] = ms(lambda: counting_sort(arr))
+    if include_builtin:
+        values = arr.tolist()
+        result["builtin_sorted_ms"] = ms(
+            lambda: sorted(range(len(values)), key=values.__getitem__)
+        )
+    return result
+
+
+def benchmark_parallel_sort(
+    keys: Any, max_workers: int | None = None, repeats: int = 1
+) -> dict:
+    """Time parallel_merge_sort for 1 … max_workers workers (speedup curve).
+
+    Returns:
+        A dict with 'workers' (list of worker counts), 'ms' (time per
+        count), 'speedup' (relative to one worker) and the single-process
+        'np_argsort_stable_ms' baseline.
+    """
+    arr = np.asarray(keys)
+    top = max_workers or os.cpu_count() or 1
+    counts = list(range(1, top + 1))
+    times = [
+        timeit.timeit(lambda w=w: parallel_merge_sort(arr, w), number=repeats) / repeats
+        for w in counts
+    ]
+    baseline = timeit.timeit(lambda: np.argsort(arr, kind="stable"), number=repeats)
+    return {
+        "workers": counts,
+        "ms": [round(t * 1000, 2) for t in times],
+        "speedup": [round(times[0] / t, 2) for t in times],
+        "np_argsort_stable_ms": round(baseline / repeats * 1000, 2),
+    }
+
+
+def benchmark_interval_index(
+    starts: Any, ends: Any, points: Any, repeats: int = 3
+) -> dict:
+    """Compare IntervalIndex stabbing queries with a brute-force scan.
+
+    Every point is looked up with a single overlap_point call, once as a
+    batch (overlap_points), counted (count_points) and finally by scanning
+    all intervals with a boolean mask per point.
+
+    Returns:
+        A dict with 'build_ms', 'tree_query_ms', 'tree_batch_ms',
+        'count_ms' and 'brute_force_ms' timings (all points per run).
+    """
+    starts, ends = np.asarray(starts), np.asarray(ends)
+    points = np.asarray(points)
+
+    def ms(fn: Callable) -> float:
+        return round(timeit.timeit(fn, number=repeats) / repeats * 1000, 2)
+
+    build = ms(lambda: IntervalIndex(starts, ends))
+    index = IntervalIndex(starts, ends)
+    return {
+        "build_ms": build,
+        "tree_query_ms": ms(lambda: [index.overlap_point(p) for p in points]),
+        "tree_batch_ms": ms(lambda: index.overlap_points(points)),
+        "count_ms": ms(lambda: index.count_points(points)),
+        "brute_force_ms": ms(
+            lambda: [np.flatnonzero((starts <= p) & (ends >= p)) for p in points]
+        ),
+    }
+
 
 def benchmark_search(
     data: list,
     target: Any,
     key: Callable = lambda x: x,
     repeats: int = 5,
+    targets: list | None = None,
 ) -> dict:
     """Compare custom binary_search vs. built-in methods.
 
     *data* must already be sorted by *key* for binary_search.
 
+    When *targets* is given the whole batch is looked up; otherwise only
+    *target*. Scalar searches loop over the batch, while
+    batch_binary_search resolves it in one call on a key array built once
+    up front (its build time is reported separately).
+
     Returns:
         A dict with 'binary_search_ms', 'linear_search_ms',
-        and 'builtin_in_ms' timings.
-
-    TODO: implement once binary_search and linear_search are complete.
+        'builtin_in_ms', 'builtin_bisect_ms', 'batch_binary_search_ms'
+        and 'key_array_build_ms' timings.
     """
     sorted_data = sorted(data, key=key)
-    binary_time = timeit.timeit(lambda: binary_search(sorted_data, target, key=key), number=repeats)
-    linear_time = timeit.timeit(lambda: linear_search(sorted_data, target, key=key), number=repeats)
-    builtin_time = timeit.timeit(lambda: sorted_data.index(target), number=repeats)
+    batch = [target] if targets is None else list(targets)
+
+    def builtin_index(t: Any) -> int | None:
+        try:
+            return sorted_data.index(t)
+        except ValueError:
+            return None
+
+    def build_keys() -> np.ndarray:
+        return np.array([key(x) for x in sorted_data])
+
+    binary_time = timeit.timeit(
+        lambda: [binary_search(sorted_data, t, key=key) for t in batch], number=repeats)
+    linear_time = timeit.timeit(
+        lambda: [linear_search(sorted_data, t, key=key) for t in batch], number=repeats)
+    builtin_time = timeit.timeit(
+        lambda: [builtin_index(t) for t in batch], number=repeats)
+    bisect_time = timeit.timeit(
+        lambda: [bisect_left(sorted_data, t, key=key) for t in batch], number=repeats)
+    build_time = timeit.timeit(build_keys, number=repeats)
+    sorted_keys = build_keys()
+    target_arr = np.asarray(batch)
+    batch_time = timeit.timeit(
+        lambda: batch_binary_search(sorted_keys, target_arr), number=repeats)
 
     return {
         "binary_search_ms": round(binary_time / repeats * 1000, 2),
         "linear_search_ms": round(linear_time / repeats * 1000, 2),
         "builtin_in_ms": round(builtin_time / repeats * 1000, 2),
+        "builtin_bisect_ms": round(bisect_time / repeats * 1000, 2),
+        "batch_binary_search_ms": round(batch_time / repeats * 1000, 2),
+        "key_array_build_ms": round(build_time / repeats * 1000, 2),
     }
-
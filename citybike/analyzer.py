@@ -13,14 +13,29 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 
+from algorithms import top_k_indices
+
 
 DATA_DIR = Path(__file__).resolve().parent / "data"
 OUTPUT_DIR = Path(__file__).resolve().parent / "output"
 
 
+def _top_counts(counts: pd.Series, n: int) -> pd.Series:
+    """Return the *n* largest counts, ties broken by ascending index label.
+
+    Uses top_k_indices (O(m + n log n) for m groups) instead of sorting
+    every count.
+    """
+    idx = top_k_indices(counts.to_numpy(), n, tiebreak=counts.index.to_numpy())
+    return counts.iloc[idx]
+
+
 class BikeShareSystem:
     """Central analysis class — loads, cleans, and analyzes bike-share data.
 
+    The analytics methods only read the frames, so one cleaned instance can
+    be queried from many threads (see snapshot.py for swapping in new data).
+
     Attributes:
         trips: DataFrame of trip records.
         stations: DataFrame of station metadata.
@@ -68,9 +83,13 @@ class BikeShareSystem:
     # Data cleaning
     # ------------------------------------------------------------------
 
-    def clean_data(self) -> None:
+    def clean_data(self, export: bool = True) -> None:
         """Clean all DataFrames and export to CSV.
 
+        Args:
+            export: Write the cleaned CSVs to data/ (step 7). Benchmarks
+                and tests pass False so the committed files are untouched.
+
         Steps to implement:
             1. Remove duplicate rows
             2. Parse date/datetime columns
@@ -144,9 +163,10 @@ class BikeShareSystem:
         print(self.trips.isna().sum())
         print(self.maintenance.isna().sum())
         
-        self.trips.to_csv(DATA_DIR / "trips_clean.csv", index=False)
-        self.stations.to_csv(DATA_DIR / "stations_clean.csv", index=False)
-        self.maintenance.to_csv(DATA_DIR / "maintenance_clean.csv", index=False)
+        if export:
+            self.trips.to_csv(DATA_DIR / "trips_clean.csv", index=False)
+            self.stations.to_csv(DATA_DIR / "stations_clean.csv", index=False)
+            self.maintenance.to_csv(DATA_DIR / "maintenance_clean.csv", index=False)
 
         
         
@@ -180,8 +200,9 @@ class BikeShareSystem:
               
         """
         
-        # Get value counts for start_station_id and convert to DataFrame
-        counts = self.trips["start_station_id"].value_counts().head(n).reset_index()
+        # Count per station, then select the top n without sorting every count
+        counts = _top_counts(self.trips["start_station_id"].value_counts(sort=False), n)
+        counts = counts.reset_index()
         counts.columns = ["start_station_id", "trip_count"]
 
         
@@ -203,9 +224,8 @@ class BikeShareSystem:
         """
         # self.trips["hour"]=self.trips["start_time"].dt.hour
         # return self.trips["hour"].value_counts().sort_index()
-        df = self.trips.copy()
-        df["hour"] = df["start_time"].dt.hour
-        return df["hour"].value_counts().sort_index()
+        # Read-only: derive the key as a new Series instead of adding a column
+        return self.trips["start_time"].dt.hour.rename("hour").value_counts().sort_index()
     
         
         # raise NotImplementedError("peak_usage_hours")
@@ -215,9 +235,8 @@ class BikeShareSystem:
 
         TODO: extract day-of-week from start_time, count.
         """
-        self.trips["start_time"] = pd.to_datetime(self.trips["start_time"])
-        self.trips["day"]=self.trips["start_time"].dt.day_name()
-        return self.trips["day"].value_counts().sort_index()
+        start = pd.to_datetime(self.trips["start_time"])
+        return start.dt.day_name().rename("day").value_counts().sort_index()
     
         
         # print(self.trips["start_time"].dtype)
@@ -234,8 +253,8 @@ class BikeShareSystem:
 
         TODO: extract year-month from start_time, group, count.
         """
-        self.trips["year_month"]=self.trips["start_time"].dt.to_period("M")
-        return self.trips["year_month"].value_counts().sort_index()
+        months = self.trips["start_time"].dt.to_period("M").rename("year_month")
+        return months.value_counts().sort_index()
         # raise NotImplementedError("monthly_trip_trend")
 
     def top_active_users(self, n: int = 15) -> pd.DataFrame:
@@ -243,8 +262,8 @@ class BikeShareSystem:
 
         TODO: group by user_id, count trips, sort descending.
         """
-        counts = self.trips["user_id"].value_counts().head(n)
-        return counts.to_frame().reset_index().rename(columns={"user_id": "user_id", 0: "trip_count"})
+        counts = _top_counts(self.trips["user_id"].value_counts(sort=False), n)
+        return counts.rename("trip_count").reset_index()
         # raise NotImplementedError("top_active_users")
 
     def maintenance_cost_by_bike_type(self) -> pd.Series:
@@ -261,8 +280,10 @@ class BikeShareSystem:
 
         TODO: group by (start_station_id, end_station_id), count, sort.
         """
-        route_counts = self.trips.groupby(["start_station_id", "end_station_id"]).size()
-        top_routes = route_counts.nlargest(n)
+        route_counts = self.trips.groupby(
+            ["start_station_id", "end_station_id"], sort=False
+        ).size()
+        top_routes = _top_counts(route_counts, n)
         top_routes_df = top_routes.reset_index(name="trip_count")
         # Merge with station names for start and end stations
         start_stations = self.stations[["station_id", "station_name"]].rename(columns={"station_id": "start_station_id", "station_name": "start_station_name"})
@@ -0,0 +1,478 @@
+"""
+Scaling benchmark suite with JSON results and baseline comparison.
+
+Covers the sort / search algorithms, the numerical.py kernels, data
+cleaning and every BikeShareSystem analytics method, each run on
+synthetic datasets of increasing size (10^3 … 10^7 trips).
+
+The same analytics also run through the SQLite backend (sql.*, plus
+sql.load for the bulk load and index build). Both backends answer a
+one-week window query (window.pandas.* / window.sql.*).
+compare_backends() pairs each pandas case with its SQL twin, and the
+CLI prints the speedup table.
+
+For every (case, size) the suite records:
+    - median and interquartile range (IQR) of the wall-clock time
+      over `repeats` timed runs, after one warm-up run
+    - peak traced memory (tracemalloc) of one extra, untimed run
+
+Results are written as JSON. Given a baseline file produced by an
+earlier run, any case whose median slowed down by more than the
+threshold is reported and the process exits with status 1, so the suite
+can gate CI.
+
+Usage:
+    python benchmarks.py --sizes 1e3 1e4 1e5 --output output/bench.json
+    python benchmarks.py --baseline output/bench.json --threshold 0.25
+    python benchmarks.py --cases sort. analytics.top --sizes 1e6
+    python benchmarks.py --cases analytics. sql. window. --sizes 1e4 1e5 1e6
+"""
+
+import argparse
+import contextlib
+import functools
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+import algorithms
+import numerical
+from fleet import FleetState
+from analyzer import OUTPUT_DIR, BikeShareSystem
+from generate_data import REALISTIC_DEMAND, DemandProfile, GeneratorConfig, generate_tables
+from server import filtered_system
+from sql_backend import SQLiteSystem
+
+
+DEFAULT_SIZES = (10**3, 10**4, 10**5)
+DEFAULT_REPEATS = 5
+DEFAULT_THRESHOLD = 0.25
+# Baseline medians below this are treated as this, so sub-millisecond
+# noise cannot fail the run.
+MIN_COMPARABLE_MS = 1.0
+
+ANALYTICS_METHODS = (
+    "total_trips_summary",
+    "top_start_stations",
+    "peak_usage_hours",
+    "busiest_day_of_week",
+    "avg_distance_by_user_type",
+    "monthly_trip_trend",
+    "top_active_users",
+    "maintenance_cost_by_bike_type",
+    "top_routes",
+)
+# Methods timed on a one-week start_time window (window.*).
+WINDOW_METHODS = ("total_trips_summary", "top_start_stations", "top_active_users")
+WINDOW_DAYS = 7
+
+# Pure-Python algorithms are skipped above these sizes (minutes per run).
+SIZE_LIMITS = {
+    "sort.merge_sort": 10**5,
+    "sort.natural_merge_sort": 10**5,
+    "sort.builtin_sorted": 10**6,
+    "search.linear_search": 10**4,
+    "search.binary_search": 10**6,
+    "sort.parallel_merge_sort": 10**7,
+    "sql.load": 10**6,
+}
+
+SEARCH_TARGETS = 1_000
+
+
+# ---------------------------------------------------------------------------
+# Synthetic data
+# ---------------------------------------------------------------------------
+
+def make_dataset(
+    n_trips: int, seed: int = 0, demand: DemandProfile | None = None
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Generate raw (uncleaned) trips, stations and maintenance tables.
+
+    Uses generate_data's vectorized generator with the sample data's
+    messiness plus a little user-type case noise for clean_data to fix.
+    Timestamps are turned back into strings, as read from trips.csv, so
+    clean_data's parsing is part of the measurement. The number of
+    stations, users, bikes and maintenance records grows with *n_trips*.
+    Pass a *demand* profile for skewed stations / users and realistic
+    time-of-day patterns instead of uniform draws.
+    """
+    config = GeneratorConfig(
+        n_trips=n_trips,
+        n_stations=max(15, n_trips // 2_000),
+        n_users=max(80, n_trips // 20),
+        n_bikes=max(60, n_trips // 25),
+        n_maintenance=max(200, n_trips // 10),
+        case_noise_rate=0.02,
+        seed=seed,
+        demand=demand,
+    )
+    trips, stations, maintenance = generate_tables(config)
+    for column in ("start_time", "end_time"):
+        trips[column] = np.datetime_as_string(trips[column].to_numpy(), unit="s")
+    return trips, stations, maintenance
+
+
+def _system(trips: pd.DataFrame, stations: pd.DataFrame,
+            maintenance: pd.DataFrame) -> BikeShareSystem:
+    """Return a BikeShareSystem holding copies of the given tables."""
+    system = BikeShareSystem()
+    system.trips = trips.copy()
+    system.stations = stations.copy()
+    system.maintenance = maintenance.copy()
+    return system
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+def measure(
+    fn: Callable[..., Any],
+    setup: Callable[[], tuple] | None = None,
+    repeats: int = DEFAULT_REPEATS,
+    warmup: int = 1,
+    memory: bool = True,
+) -> dict:
+    """Time *fn* and report robust statistics.
+
+    Args:
+        fn: Callable to benchmark; receives the tuple returned by *setup*.
+        setup: Optional untimed callable run before every call (e.g. to
+            copy a DataFrame that *fn* mutates).
+        repeats: Timed runs.
+        warmup: Untimed runs before timing.
+        memory: Also run once under tracemalloc for peak memory.
+
+    Returns:
+        Dict with 'median_ms', 'iqr_ms', 'min_ms', 'repeats' and
+        'peak_mb' (None when *memory* is False).
+    """
+    if repeats < 1:
+        raise ValueError("repeats must be at least 1")
+
+    def call() -> float:
+        args = setup() if setup is not None else ()
+        t0 = time.perf_counter()
+        fn(*args)
+        return time.perf_counter() - t0
+
+    for _ in range(warmup):
+        call()
+    times = np.array([call() for _ in range(repeats)]) * 1000
+
+    peak_mb = None
+    if memory:
+        args = setup() if setup is not None else ()
+        tracemalloc.start()
+        try:
+            fn(*args)
+            peak_mb = tracemalloc.get_traced_memory()[1] / 2**20
+        finally:
+            tracemalloc.stop()
+
+    q1, median, q3 = np.percentile(times, [25, 50, 75])
+    return {
+        "median_ms": round(float(median), 3),
+        "iqr_ms": round(float(q3 - q1), 3),
+        "min_ms": round(float(times.min()), 3),
+        "repeats": repeats,
+        "peak_mb": None if peak_mb is None else round(peak_mb, 3),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Cases
+# ---------------------------------------------------------------------------
+
+def build_cases(
+    trips: pd.DataFrame,
+    stations: pd.DataFrame,
+    maintenance: pd.DataFrame,
+    workers: int | None = None,
+) -> dict[str, tuple[Callable, Callable | None]]:
+    """Return {case name: (fn, setup)} for one dataset.
+
+    Names are '<group>.<name>'; groups are sort, search, numerical,
+    clean, fleet, analytics, sql and window.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        cleaned = _system(trips, stations, maintenance)
+        cleaned.clean_data(export=False)
+    durations = cleaned.trips["duration_minutes"].to_numpy()
+    distances = cleaned.trips["distance_km"].to_numpy()
+    epochs = cleaned.trips["start_time"].to_numpy().astype("datetime64[s]").astype(np.int64)
+    duration_list = durations.tolist()
+    sorted_list = sorted(duration_list)
+    sorted_keys = np.asarray(sorted_list)
+    targets_list = np.random.default_rng(1).choice(
+        duration_list, size=SEARCH_TARGETS).tolist()
+    targets = np.asarray(targets_list)
+    lat = stations["latitude"].to_numpy()
+    lon = stations["longitude"].to_numpy()
+
+    cases: dict[str, tuple[Callable, Callable | None]] = {
+        "sort.merge_sort": (lambda: algorithms.merge_sort(duration_list), None),
+        "sort.natural_merge_sort": (
+            lambda: algorithms.natural_merge_sort(duration_list), None),
+        "sort.builtin_sorted": (lambda: sorted(duration_list), None),
+        "sort.radix_sort": (lambda: algorithms.radix_sort(epochs), None),
+        "sort.np_argsort_stable": (lambda: np.argsort(epochs, kind="stable"), None),
+        "search.binary_search": (
+            lambda: [algorithms.binary_search(sorted_list, t) for t in targets_list], None),
+        "search.linear_search": (
+            lambda: [algorithms.linear_search(sorted_list, t) for t in targets_list], None),
+        "search.batch_binary_search": (
+            lambda: algorithms.batch_binary_search(sorted_keys, targets), None),
+        "numerical.station_distance_matrix": (
+            lambda: numerical.station_distance_matrix(lat, lon), None),
+        "numerical.trip_duration_stats": (
+            lambda: numerical.trip_duration_stats(durations), None),
+        "numerical.detect_outliers_zscore": (
+            lambda: numerical.detect_outliers_zscore(durations), None),
+        "numerical.calculate_fares": (
+            lambda: numerical.calculate_fares(durations, distances, 0.15, 0.10, 1.0), None),
+        "clean.clean_data": (
+            lambda system: system.clean_data(export=False),
+            lambda: (_system(trips, stations, maintenance),),
+        ),
+        "fleet.from_history": (
+            lambda: FleetState.from_history(cleaned.trips, cleaned.maintenance), None),
+    }
+    for w in range(1, (workers or os.cpu_count() or 1) + 1):
+        cases[f"sort.parallel_merge_sort.w{w}"] = (
+            lambda w=w: algorithms.parallel_merge_sort(epochs, max_workers=w), None)
+    # The analytics methods only read the frames, so they share `cleaned`.
+    # The SQLite database is loaded on first use (untimed, in setup), so
+    # runs filtered to other cases do not pay for it.
+    backend = functools.cache(lambda: SQLiteSystem.from_system(cleaned))
+    start = cleaned.trips["start_time"].min()
+    window = {"start": start, "end": start + pd.Timedelta(days=WINDOW_DAYS)}
+    cases["sql.load"] = (
+        lambda db: db.load(cleaned.trips, cleaned.stations, cleaned.maintenance),
+        lambda: (SQLiteSystem(),),
+    )
+    for method in ANALYTICS_METHODS:
+        cases[f"analytics.{method}"] = (
+            lambda method=method: getattr(cleaned, method)(), None)
+        cases[f"sql.{method}"] = (
+            lambda db, method=method: getattr(db, method)(), lambda: (backend(),))
+    for method in WINDOW_METHODS:
+        cases[f"window.pandas.{method}"] = (
+            lambda method=method: getattr(filtered_system(cleaned, window), method)(), None)
+        cases[f"window.sql.{method}"] = (
+            lambda db, method=method: getattr(db.filtered(**window), method)(),
+            lambda: (backend(),))
+    return cases
+
+
+def _size_limit(case: str) -> int | None:
+    for prefix, limit in SIZE_LIMITS.items():
+        if case == prefix or case.startswith(prefix + "."):
+            return limit
+    return None
+
+
+def run_suite(
+    sizes: tuple[int, ...] = DEFAULT_SIZES,
+    repeats: int = DEFAULT_REPEATS,
+    case_filter: list[str] | None = None,
+    seed: int = 0,
+    workers: int | None = None,
+    memory: bool = True,
+    log: Callable[[str], None] | None = None,
+    demand: DemandProfile | None = None,
+) -> dict:
+    """Run every selected case on every dataset size.
+
+    Args:
+        sizes: Trip counts to generate.
+        repeats: Timed runs per case.
+        case_filter: Keep only cases whose name contains one of these
+            substrings (all cases if None).
+        seed: Dataset seed.
+        workers: Highest worker count for the parallel sort speedup curve.
+        memory: Record peak memory per case.
+        log: Optional progress callback (e.g. print).
+        demand: Demand profile for the datasets (uniform if None).
+
+    Returns:
+        {'meta': {...}, 'results': [{'case', 'n_trips', 'median_ms', …}]}
+    """
+    results = []
+    for n in sizes:
+        trips, stations, maintenance = make_dataset(n, seed, demand)
+        cases = build_cases(trips, stations, maintenance, workers)
+        for name, (fn, setup) in cases.items():
+            if case_filter and not any(f in name for f in case_filter):
+                continue
+            limit = _size_limit(name)
+            if limit is not None and n > limit:
+                continue
+            with contextlib.redirect_stdout(io.StringIO()):
+                stats = measure(fn, setup, repeats=repeats, memory=memory)
+            results.append({"case": name, "n_trips": n, **stats})
+            if log is not None:
+                log(f"{name:<45} n={n:<10} median {stats['median_ms']:>10.3f} ms"
+                    f"  iqr {stats['iqr_ms']:>8.3f} ms")
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "repeats": repeats,
+            "seed": seed,
+            "demand": "uniform" if demand is None else demand._asdict(),
+        },
+        "results": results,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Backend comparison
+# ---------------------------------------------------------------------------
+
+def compare_backends(report: dict) -> list[dict]:
+    """Pair every pandas analytics case with its SQLite twin.
+
+    analytics.<m> is matched with sql.<m>, and window.pandas.<m> with
+    window.sql.<m>, at the same n_trips.
+
+    Returns:
+        List of dicts with 'question', 'n_trips', 'pandas_ms', 'sql_ms'
+        and 'speedup' (pandas / sql; above 1 means SQLite is faster),
+        ordered by question then size.
+    """
+    medians = {(r["case"], r["n_trips"]): r["median_ms"] for r in report["results"]}
+    rows = []
+    pairs = (("analytics.", "sql.", ""), ("window.pandas.", "window.sql.", "window."))
+    for (case, n), pandas_ms in medians.items():
+        for prefix, sql_prefix, label in pairs:
+            if case.startswith(prefix):
+                method = case.removeprefix(prefix)
+                break
+        else:
+            continue
+        question = label + method
+        sql_ms = medians.get((sql_prefix + method, n))
+        if sql_ms is None:
+            continue
+        rows.append({
+            "question": question,
+            "n_trips": n,
+            "pandas_ms": pandas_ms,
+            "sql_ms": sql_ms,
+            "speedup": round(pandas_ms / max(sql_ms, 1e-9), 2),
+        })
+    return sorted(rows, key=lambda r: (r["question"], r["n_trips"]))
+
+
+# ---------------------------------------------------------------------------
+# Baseline comparison
+# ---------------------------------------------------------------------------
+
+def compare_to_baseline(
+    current: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD
+) -> list[dict]:
+    """Return the cases whose median slowed down by more than *threshold*.
+
+    Cases are matched on (case, n_trips); cases missing from either run
+    are ignored. Medians below MIN_COMPARABLE_MS are raised to it first.
+
+    Returns:
+        List of dicts with 'case', 'n_trips', 'baseline_ms', 'current_ms'
+        and 'ratio', worst first.
+    """
+    if threshold < 0:
+        raise ValueError("threshold must be non-negative")
+    reference = {(r["case"], r["n_trips"]): r["median_ms"] for r in baseline["results"]}
+    regressions = []
+    for r in current["results"]:
+        key = (r["case"], r["n_trips"])
+        if key not in reference:
+            continue
+        before = max(reference[key], MIN_COMPARABLE_MS)
+        after = max(r["median_ms"], MIN_COMPARABLE_MS)
+        ratio = after / before
+        if ratio > 1 + threshold:
+            regressions.append({
+                "case": r["case"],
+                "n_trips": r["n_trips"],
+                "baseline_ms": reference[key],
+                "current_ms": r["median_ms"],
+                "ratio": round(ratio, 3),
+            })
+    return sorted(regressions, key=lambda r: r["ratio"], reverse=True)
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the CityBike benchmark suite.")
+    parser.add_argument("--sizes", nargs="+", type=float, default=list(DEFAULT_SIZES),
+                        help="trip counts, e.g. 1e3 1e4 1e5 (up to 1e7)")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--cases", nargs="*", default=None,
+                        help="only run cases containing one of these substrings")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--demand", choices=["uniform", "realistic"], default="uniform",
+                        help="dataset demand model (see generate_data.DemandProfile)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="max workers for the parallel sort speedup curve")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="skip the tracemalloc peak-memory run")
+    parser.add_argument("--output", default=str(OUTPUT_DIR / "benchmarks.json"))
+    parser.add_argument("--baseline", default=None, help="JSON from an earlier run")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown, e.g. 0.25 for +25%%")
+    args = parser.parse_args(argv)
+
+    report = run_suite(
+        sizes=tuple(int(s) for s in args.sizes),
+        repeats=args.repeats,
+        case_filter=args.cases,
+        seed=args.seed,
+        workers=args.workers,
+        memory=not args.no_memory,
+        log=print,
+        demand=None if args.demand == "uniform" else REALISTIC_DEMAND,
+    )
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"Wrote {len(report['results'])} results to {output}")
+    for r in compare_backends(report):
+        print(f"{r['question']:<40} n={r['n_trips']:<10} pandas {r['pandas_ms']:>10.3f} ms"
+              f"  sqlite {r['sql_ms']:>10.3f} ms  x{r['speedup']}")
+
+    if args.baseline is None:
+        return 0
+    baseline = json.loads(Path(args.baseline).read_text())
+    regressions = compare_to_baseline(report, baseline, args.threshold)
+    for r in regressions:
+        print(f"REGRESSION {r['case']} n={r['n_trips']}: "
+              f"{r['baseline_ms']} ms -> {r['current_ms']} ms (x{r['ratio']})")
+    if regressions:
+        return 1
+    print(f"No regressions beyond +{args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,223 @@
+"""
+Monthly billing — turns priced trips into per-user invoices.
+
+Billing rules:
+    - Each trip is priced with the CompiledTariff (casual / member / peak).
+    - A user's charges per calendar day are capped at DAILY_CAPS[user_type].
+    - Casual users may hold day passes (`CasualUser.day_pass_count`); each
+      pass waives one ride day and is then used up. Passes are spent month
+      by month in date order, on the most expensive days of each month.
+    - Members get TIER_DISCOUNTS[tier] off their monthly subtotal.
+
+All trips are priced in one vectorized call and sorted once by
+(user, day). Day and month totals are then segmented reductions
+(np.add.reduceat) over that order, so no per-trip objects are built.
+Invoices are produced block by block of users, so callers can stream
+them to disk without holding every invoice in memory.
+"""
+
+import csv
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from pricing import CompiledTariff
+
+
+DAILY_CAPS = {"casual": 15.00, "member": 10.00}
+TIER_DISCOUNTS = {"basic": 0.00, "premium": 0.20}
+
+INVOICE_COLUMNS = [
+    "user_id", "user_type", "month", "trips", "ride_days",
+    "gross", "cap_credit", "day_pass_credit", "discount", "total",
+]
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _segment_starts(*keys: np.ndarray) -> np.ndarray:
+    """Return the start index of every run of equal consecutive key tuples."""
+    n = len(keys[0])
+    if n == 0:
+        return np.zeros(0, dtype=np.intp)
+    change = np.zeros(n, dtype=bool)
+    change[0] = True
+    for key in keys:
+        change[1:] |= key[1:] != key[:-1]
+    return np.flatnonzero(change)
+
+
+def _user_attributes(
+    user_ids: pd.Index, user_types: np.ndarray, users: pd.DataFrame | None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Align cap, discount and day-pass count to the user code order."""
+    caps = pd.Series(user_types).map(DAILY_CAPS).to_numpy(dtype=np.float64)
+    discounts = np.zeros(len(user_ids))
+    passes = np.zeros(len(user_ids), dtype=np.int64)
+
+    if users is not None:
+        info = users.set_index("user_id").reindex(user_ids)
+        if "tier" in info:
+            tier = info["tier"].map(TIER_DISCOUNTS).fillna(0.0).to_numpy()
+            discounts = np.where(user_types == "member", tier, 0.0)
+        if "day_pass_count" in info:
+            count = info["day_pass_count"].fillna(0).to_numpy(dtype=np.int64)
+            passes = np.where(user_types == "casual", count, 0)
+    return caps, discounts, passes
+
+
+# ---------------------------------------------------------------------------
+# Invoice computation
+# ---------------------------------------------------------------------------
+
+def _invoice_block(
+    user: np.ndarray,
+    day: np.ndarray,
+    fares: np.ndarray,
+    user_ids: pd.Index,
+    user_types: np.ndarray,
+    caps: np.ndarray,
+    discounts: np.ndarray,
+    passes: np.ndarray,
+) -> pd.DataFrame:
+    """Build invoices for one block of trips already sorted by (user, day)."""
+    # Per (user, day): charge, capped at the user's daily cap.
+    d_start = _segment_starts(user, day)
+    d_user = user[d_start]
+    d_day = day[d_start]
+    d_month = d_day.astype("datetime64[D]").astype("datetime64[M]").astype(np.int64)
+    d_gross = np.add.reduceat(fares, d_start)
+    d_trips = np.diff(np.append(d_start, len(user)))
+    d_capped = np.minimum(d_gross, caps[d_user])
+
+    # Day passes are a budget per user, spent month by month in date
+    # order on the most expensive days of each month. A month may waive
+    # the passes left after the user's earlier months, up to its days.
+    order = np.lexsort((-d_capped, d_month, d_user))
+    g_start = _segment_starts(d_user[order], d_month[order])
+    g_size = np.diff(np.append(g_start, len(order)))
+    g_user = d_user[order][g_start]
+    days_before = np.cumsum(g_size) - g_size
+    u_first = _segment_starts(g_user)
+    u_id = np.repeat(np.arange(len(u_first)), np.diff(np.append(u_first, len(g_start))))
+    days_before -= days_before[u_first][u_id]
+    g_passes = np.clip(passes[g_user] - days_before, 0, g_size)
+    group_id = np.repeat(np.arange(len(g_start)), g_size)
+    rank = np.arange(len(order)) - g_start[group_id]
+    waived = np.zeros(len(order), dtype=bool)
+    waived[order] = rank < g_passes[group_id]
+    d_pass_credit = np.where(waived, d_capped, 0.0)
+
+    # Per (user, month): days are already ordered by month within a user.
+    m_start = _segment_starts(d_user, d_month)
+    m_user = d_user[m_start]
+    gross = np.add.reduceat(d_gross, m_start)
+    capped = np.add.reduceat(d_capped, m_start)
+    pass_credit = np.add.reduceat(d_pass_credit, m_start)
+    subtotal = capped - pass_credit
+    discount = subtotal * discounts[m_user]
+
+    return pd.DataFrame({
+        "user_id": user_ids[m_user],
+        "user_type": user_types[m_user],
+        "month": d_month[m_start].astype("datetime64[M]").astype(str),
+        "trips": np.add.reduceat(d_trips, m_start),
+        "ride_days": np.diff(np.append(m_start, len(d_start))),
+        "gross": gross.round(2),
+        "cap_credit": (gross - capped).round(2),
+        "day_pass_credit": pass_credit.round(2),
+        "discount": discount.round(2),
+        "total": (subtotal - discount).round(2),
+    }, columns=INVOICE_COLUMNS)
+
+
+def iter_invoice_batches(
+    trips: pd.DataFrame,
+    users: pd.DataFrame | None = None,
+    tariff: CompiledTariff | None = None,
+    users_per_batch: int = 50_000,
+) -> Iterator[pd.DataFrame]:
+    """Yield DataFrames of monthly invoices, one block of users at a time.
+
+    Args:
+        trips: Cleaned trips with 'user_id', 'user_type', 'start_time',
+            'duration_minutes' and 'distance_km'.
+        users: Optional user table with 'user_id' and any of 'tier',
+            'day_pass_count'. Users missing from it get no discount/passes.
+            'day_pass_count' is the number of passes for the whole billed
+            period; passes used in one month are gone for later months.
+        tariff: Tariff used to price the trips (default strategies if None).
+        users_per_batch: Number of users per yielded block.
+
+    Yields:
+        DataFrames with INVOICE_COLUMNS, ordered by user_id then month.
+
+    Complexity:
+        Time  — O(n log n) for the single sort, O(n) for the reductions
+        Space — O(n)
+    """
+    if users_per_batch <= 0:
+        raise ValueError("users_per_batch must be positive")
+    if tariff is None:
+        tariff = CompiledTariff.from_strategies()
+
+    start = trips["start_time"]
+    if not pd.api.types.is_datetime64_any_dtype(start):
+        start = pd.to_datetime(start)
+    fares = tariff.price_trips(trips)
+    user_code, user_ids = pd.factorize(trips["user_id"], sort=True)
+    day = start.to_numpy().astype("datetime64[D]").astype(np.int64)
+
+    first = np.unique(user_code, return_index=True)[1]
+    user_types = trips["user_type"].to_numpy()[first].astype(object)
+    caps, discounts, passes = _user_attributes(user_ids, user_types, users)
+
+    order = np.lexsort((day, user_code))
+    user_code, day, fares = user_code[order], day[order], fares[order]
+
+    bounds = np.searchsorted(user_code, np.arange(0, len(user_ids), users_per_batch))
+    bounds = np.append(bounds, len(user_code))
+    for lo, hi in zip(bounds[:-1], bounds[1:]):
+        if lo == hi:
+            continue
+        yield _invoice_block(
+            user_code[lo:hi], day[lo:hi], fares[lo:hi],
+            user_ids, user_types, caps, discounts, passes,
+        )
+
+
+def compute_invoices(
+    trips: pd.DataFrame,
+    users: pd.DataFrame | None = None,
+    tariff: CompiledTariff | None = None,
+) -> pd.DataFrame:
+    """Return every monthly invoice as a single DataFrame.
+
+    Day passes are consumed across months in date order, so a user with
+    one pass gets one waived day in total, not one per month.
+    """
+    batches = list(iter_invoice_batches(trips, users, tariff))
+    if not batches:
+        return pd.DataFrame(columns=INVOICE_COLUMNS)
+    return pd.concat(batches, ignore_index=True)
+
+
+def write_invoices(
+    trips: pd.DataFrame,
+    path: str | Path,
+    users: pd.DataFrame | None = None,
+    tariff: CompiledTariff | None = None,
+    users_per_batch: int = 50_000,
+) -> int:
+    """Stream invoices to a CSV file and return the number written."""
+    written = 0
+    with open(path, "w", newline="") as fh:
+        csv.writer(fh).writerow(INVOICE_COLUMNS)
+        for batch in iter_invoice_batches(trips, users, tariff, users_per_batch):
+            batch.to_csv(fh, header=False, index=False)
+            written += len(batch)
+    return written
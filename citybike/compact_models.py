@@ -0,0 +1,376 @@
+"""
+Memory-compact variants of the domain models.
+
+Mirrors the hierarchy in models.py, but every class declares __slots__
+so no instance carries a __dict__. `created_at` is lazy: unless passed
+explicitly it is only stamped (with datetime.now()) the first time it is
+read, so bulk construction never calls the clock.
+
+Only storage is defined here. The constructor checks are the
+``_validate`` helpers of the models.py classes, and properties,
+__str__ and __repr__ are the models.py functions themselves, so the two
+variants cannot drift apart. (A slotted subclass of the models.py classes
+would still get a __dict__ from its bases.)
+
+Use these when hydrating large numbers of objects:
+
+    from compact_models import ClassicBike, Station, Trip
+
+Run `python compact_models.py` to compare memory per instance and
+construction rate against models.py.
+"""
+
+import sys
+import time
+import tracemalloc
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from datetime import datetime
+
+import models
+
+
+# ---------------------------------------------------------------------------
+# Abstract Base Class
+# ---------------------------------------------------------------------------
+
+class Entity(ABC):
+    """Slotted counterpart of models.Entity with a lazy created_at."""
+
+    __slots__ = ("_id", "_created_at")
+
+    def __init__(self, id: str, created_at: datetime | None = None) -> None:
+        models.Entity._validate(id)
+        self._id = id
+        self._created_at = created_at
+
+    id = models.Entity.id
+    created_at = models.Entity.created_at
+
+    @abstractmethod
+    def __str__(self) -> str:
+        ...
+
+    @abstractmethod
+    def __repr__(self) -> str:
+        ...
+
+
+# ---------------------------------------------------------------------------
+# Bike hierarchy
+# ---------------------------------------------------------------------------
+
+class Bike(Entity):
+    """Slotted counterpart of models.Bike."""
+
+    __slots__ = ("_bike_type", "_status")
+
+    VALID_STATUSES = models.Bike.VALID_STATUSES
+
+    def __init__(
+        self,
+        bike_id: str,
+        bike_type: str,
+        status: str = "available",
+    ) -> None:
+        super().__init__(id=bike_id)
+        models.Bike._validate(bike_type, status)
+        self._bike_type = bike_type
+        self._status = status
+
+    bike_type = models.Bike.bike_type
+    status = models.Bike.status
+    __str__ = models.Bike.__str__
+    __repr__ = models.Bike.__repr__
+
+
+class ClassicBike(Bike):
+    """Slotted counterpart of models.ClassicBike."""
+
+    __slots__ = ("_gear_count",)
+
+    def __init__(
+        self,
+        bike_id: str,
+        gear_count: int = 7,
+        status: str = "available",
+    ) -> None:
+        super().__init__(bike_id=bike_id, bike_type="classic", status=status)
+        models.ClassicBike._validate(gear_count)
+        self._gear_count = gear_count
+
+    gear_count = models.ClassicBike.gear_count
+    __str__ = models.ClassicBike.__str__
+    __repr__ = models.ClassicBike.__repr__
+
+
+class ElectricBike(Bike):
+    """Slotted counterpart of models.ElectricBike."""
+
+    __slots__ = ("_battery_level", "_max_range_km")
+
+    def __init__(
+        self,
+        bike_id: str,
+        battery_level: float = 100.0,
+        max_range_km: float = 50.0,
+        status: str = "available",
+    ) -> None:
+        super().__init__(bike_id=bike_id, bike_type="electric", status=status)
+        models.ElectricBike._validate(battery_level, max_range_km)
+        self._battery_level = battery_level
+        self._max_range_km = max_range_km
+
+    battery_level = models.ElectricBike.battery_level
+    max_range_km = models.ElectricBike.max_range_km
+    __str__ = models.ElectricBike.__str__
+    __repr__ = models.ElectricBike.__repr__
+
+
+# ---------------------------------------------------------------------------
+# Station
+# ---------------------------------------------------------------------------
+
+class Station(Entity):
+    """Slotted counterpart of models.Station."""
+
+    __slots__ = ("_name", "_capacity", "_latitude", "_longitude")
+
+    def __init__(
+        self,
+        station_id: str,
+        name: str,
+        capacity: int,
+        latitude: float,
+        longitude: float,
+    ) -> None:
+        super().__init__(id=station_id)
+        models.Station._validate(capacity, latitude, longitude)
+        self._name = name
+        self._capacity = capacity
+        self._latitude = latitude
+        self._longitude = longitude
+
+    __str__ = models.Station.__str__
+    __repr__ = models.Station.__repr__
+
+
+# ---------------------------------------------------------------------------
+# User hierarchy
+# ---------------------------------------------------------------------------
+
+class User(Entity):
+    """Slotted counterpart of models.User."""
+
+    __slots__ = ("_name", "_email", "_user_type")
+
+    def __init__(
+        self,
+        user_id: str,
+        name: str,
+        email: str,
+        user_type: str,
+    ) -> None:
+        super().__init__(id=user_id)
+        models.User._validate(email)
+        self._name = name
+        self._email = email
+        self._user_type = user_type
+
+    __str__ = models.User.__str__
+    __repr__ = models.User.__repr__
+
+
+class CasualUser(User):
+    """Slotted counterpart of models.CasualUser."""
+
+    __slots__ = ("_day_pass_count",)
+
+    def __init__(
+        self,
+        user_id: str,
+        name: str,
+        email: str,
+        day_pass_count: int = 0,
+    ) -> None:
+        super().__init__(user_id=user_id, name=name, email=email, user_type="casual")
+        models.CasualUser._validate(day_pass_count)
+        self._day_pass_count = day_pass_count
+
+    __str__ = models.CasualUser.__str__
+    __repr__ = models.CasualUser.__repr__
+
+
+class MemberUser(User):
+    """Slotted counterpart of models.MemberUser."""
+
+    __slots__ = ("_membership_start", "_membership_end", "_tier")
+
+    def __init__(
+        self,
+        user_id: str,
+        name: str,
+        email: str,
+        membership_start: datetime = None,
+        membership_end: datetime = None,
+        tier: str = "basic",
+    ) -> None:
+        super().__init__(user_id=user_id, name=name, email=email, user_type="member")
+        models.MemberUser._validate(membership_start, membership_end, tier)
+        self._membership_start = membership_start
+        self._membership_end = membership_end
+        self._tier = tier
+
+    __str__ = models.MemberUser.__str__
+    __repr__ = models.MemberUser.__repr__
+
+
+# ---------------------------------------------------------------------------
+# Trip
+# ---------------------------------------------------------------------------
+
+class Trip:
+    """Slotted counterpart of models.Trip."""
+
+    __slots__ = (
+        "trip_id", "user", "bike", "start_station", "end_station",
+        "start_time", "end_time", "distance_km",
+    )
+
+    def __init__(
+        self,
+        trip_id: str,
+        user: User,
+        bike: Bike,
+        start_station: Station,
+        end_station: Station,
+        start_time: datetime,
+        end_time: datetime,
+        distance_km: float,
+    ) -> None:
+        models.Trip._validate(start_time, end_time, distance_km)
+        self.trip_id = trip_id
+        self.user = user
+        self.bike = bike
+        self.start_station = start_station
+        self.end_station = end_station
+        self.start_time = start_time
+        self.end_time = end_time
+        self.distance_km = distance_km
+
+    duration_minutes = models.Trip.duration_minutes
+    __str__ = models.Trip.__str__
+    __repr__ = models.Trip.__repr__
+
+
+# ---------------------------------------------------------------------------
+# MaintenanceRecord
+# ---------------------------------------------------------------------------
+
+class MaintenanceRecord:
+    """Slotted counterpart of models.MaintenanceRecord."""
+
+    __slots__ = (
+        "record_id", "bike", "date", "maintenance_type", "cost", "description",
+    )
+
+    VALID_TYPES = models.MaintenanceRecord.VALID_TYPES
+
+    def __init__(
+        self,
+        record_id: str,
+        bike: Bike,
+        date: datetime,
+        maintenance_type: str,
+        cost: float,
+        description: str = "",
+    ) -> None:
+        models.MaintenanceRecord._validate(maintenance_type, cost)
+        self.record_id = record_id
+        self.bike = bike
+        self.date = date
+        self.maintenance_type = maintenance_type
+        self.cost = cost
+        self.description = description
+
+    __str__ = models.MaintenanceRecord.__str__
+    __repr__ = models.MaintenanceRecord.__repr__
+
+
+# ---------------------------------------------------------------------------
+# Benchmarking helper
+# ---------------------------------------------------------------------------
+
+def _builders(module) -> dict[str, Callable[[int], object]]:
+    """Return one constructor call per model class for *module*."""
+    start = datetime(2024, 1, 1, 8, 0)
+    end = datetime(2024, 1, 1, 8, 25)
+    bike = module.ClassicBike("BK0")
+    station = module.Station("ST0", "Central", 20, 48.8, 9.2)
+    user = module.CasualUser("U0", "Ann", "ann@example.com")
+    return {
+        "ClassicBike": lambda i: module.ClassicBike(f"BK{i}"),
+        "ElectricBike": lambda i: module.ElectricBike(f"BK{i}", 80.0),
+        "Station": lambda i: module.Station(f"ST{i}", "Central", 20, 48.8, 9.2),
+        "CasualUser": lambda i: module.CasualUser(f"U{i}", "Ann", "ann@example.com"),
+        "MemberUser": lambda i: module.MemberUser(
+            f"U{i}", "Ann", "ann@example.com", start, end, "premium"
+        ),
+        "Trip": lambda i: module.Trip(
+            f"TR{i}", user, bike, station, station, start, end, 3.2
+        ),
+        "MaintenanceRecord": lambda i: module.MaintenanceRecord(
+            f"MR{i}", bike, start, "tire_repair", 25.0
+        ),
+    }
+
+
+def _measure(build: Callable[[int], object], n: int) -> tuple[float, float]:
+    """Return (bytes per instance, instances per second) for *build*."""
+    ids = range(n)
+    t0 = time.perf_counter()
+    objs = [build(i) for i in ids]
+    rate = n / (time.perf_counter() - t0)
+    del objs
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objs = [build(i) for i in ids]
+    size = (tracemalloc.get_traced_memory()[0] - before) / n
+    tracemalloc.stop()
+    del objs
+    return size, rate
+
+
+def benchmark_models(n: int = 20_000) -> dict[str, dict[str, float]]:
+    """Compare models.py against the slotted classes in this module.
+
+    Memory is measured with tracemalloc and includes the per-instance id
+    strings, which both variants allocate identically.
+
+    Returns:
+        A dict per class name with 'dict_bytes', 'slots_bytes',
+        'dict_per_sec' and 'slots_per_sec'.
+    """
+    before = _builders(models)
+    after = _builders(sys.modules[__name__])
+    results: dict[str, dict[str, float]] = {}
+    for name in before:
+        dict_bytes, dict_rate = _measure(before[name], n)
+        slots_bytes, slots_rate = _measure(after[name], n)
+        results[name] = {
+            "dict_bytes": round(dict_bytes, 1),
+            "slots_bytes": round(slots_bytes, 1),
+            "dict_per_sec": round(dict_rate),
+            "slots_per_sec": round(slots_rate),
+        }
+    return results
+
+
+if __name__ == "__main__":
+    print(f"{'class':<18} {'bytes/obj':>18} {'objects/s':>24}")
+    for name, r in benchmark_models().items():
+        print(
+            f"{name:<18} {r['dict_bytes']:>8.0f} -> {r['slots_bytes']:<7.0f} "
+            f"{r['dict_per_sec']:>11,.0f} -> {r['slots_per_sec']:<11,.0f}"
+        )
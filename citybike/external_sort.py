@@ -0,0 +1,215 @@
+"""
+External (out-of-core) sort for trip CSV files larger than memory.
+
+The input is read row by row into runs whose estimated size stays under
+a memory budget. Each run is sorted with algorithms.natural_merge_sort
+(near O(n) on trip logs, which arrive almost sorted by start_time) and
+spilled to a temporary binary run file as pickled blocks of
+(key, row) pairs. The run files are then merged with algorithms.kway_merge,
+reading one block per run at a time. If there are more runs than the
+merge fan-in allows, intermediate merge passes combine them first.
+
+The output is a CSV with the same header, sorted by the chosen column,
+which TripTable.from_csv and the analytics can load directly.
+
+Usage:
+    python external_sort.py data/trips_clean.csv data/trips_by_time.csv \\
+        --key start_time --memory-mb 256
+"""
+
+import argparse
+import csv
+import os
+import pickle
+import tempfile
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+from algorithms import kway_merge, natural_merge_sort
+
+
+# Rough per-row and per-field CPython overhead used for the memory estimate.
+ROW_OVERHEAD_BYTES = 120
+FIELD_OVERHEAD_BYTES = 57
+
+KEY_TYPES: dict[str, Callable[[str], Any]] = {
+    "str": str,
+    "int": int,
+    "float": float,
+}
+
+
+# ---------------------------------------------------------------------------
+# Run files
+# ---------------------------------------------------------------------------
+
+def _sort_key(parse: Callable[[str], Any]) -> Callable[[str], tuple]:
+    """Wrap *parse* so empty / unparseable values sort last."""
+    def key(text: str) -> tuple:
+        try:
+            return (0, parse(text)) if text != "" else (1, "")
+        except ValueError:
+            return (1, text)
+    return key
+
+
+def _write_run(pairs: list[tuple], directory: str, block_rows: int) -> str:
+    """Spill sorted (key, row) pairs to a run file in blocks."""
+    fd, path = tempfile.mkstemp(suffix=".run", dir=directory)
+    with os.fdopen(fd, "wb", buffering=1 << 20) as fh:
+        for start in range(0, len(pairs), block_rows):
+            pickle.dump(pairs[start:start + block_rows], fh,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def _read_run(path: str) -> Iterator[tuple]:
+    """Yield (key, row) pairs from a run file, one block in memory at a time."""
+    with open(path, "rb", buffering=1 << 20) as fh:
+        while True:
+            try:
+                block = pickle.load(fh)
+            except EOFError:
+                return
+            yield from block
+
+
+def _merge_runs_to_file(paths: list[str], directory: str, block_rows: int) -> str:
+    """Merge several run files into one new run file."""
+    fd, out = tempfile.mkstemp(suffix=".run", dir=directory)
+    with os.fdopen(fd, "wb", buffering=1 << 20) as fh:
+        block = []
+        for pair in kway_merge([_read_run(p) for p in paths]):
+            block.append(pair)
+            if len(block) >= block_rows:
+                pickle.dump(block, fh, protocol=pickle.HIGHEST_PROTOCOL)
+                block = []
+        if block:
+            pickle.dump(block, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    for p in paths:
+        os.remove(p)
+    return out
+
+
+# ---------------------------------------------------------------------------
+# External sort
+# ---------------------------------------------------------------------------
+
+def external_sort_csv(
+    src: str | Path,
+    dst: str | Path,
+    key_column: str,
+    key_type: str = "str",
+    memory_mb: float = 256,
+    block_rows: int = 8192,
+    fan_in: int = 64,
+    tmp_dir: str | Path | None = None,
+) -> dict:
+    """Sort a CSV file by one column using bounded memory.
+
+    Args:
+        src: Input CSV with a header row.
+        dst: Output CSV path.
+        key_column: Column to sort by. Timestamps in YYYY-MM-DD HH:MM:SS
+            format sort correctly as 'str'.
+        key_type: 'str', 'int' or 'float'. Empty or unparseable values
+            are placed last.
+        memory_mb: Approximate memory budget for one in-memory run.
+        block_rows: Rows per pickled block in run files (read granularity).
+        fan_in: Maximum number of runs merged at once.
+        tmp_dir: Directory for run files (system temp dir if None).
+
+    Returns:
+        A dict with 'rows', 'runs' and 'merge_passes'.
+
+    Complexity:
+        Time  — O(n log n) comparisons, O(n) I/O per merge pass
+        Space — O(memory_mb + fan_in * block_rows)
+    """
+    if key_type not in KEY_TYPES:
+        raise ValueError(f"key_type must be one of {set(KEY_TYPES)}")
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    budget = memory_mb * 2**20
+    key = _sort_key(KEY_TYPES[key_type])
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as directory:
+        runs: list[str] = []
+        rows = 0
+        with open(src, newline="") as fh:
+            reader = csv.reader(fh)
+            header = next(reader)
+            if key_column not in header:
+                raise ValueError(f"Column {key_column!r} not in header")
+            col = header.index(key_column)
+
+            batch: list[list[str]] = []
+            used = 0
+            for row in reader:
+                batch.append(row)
+                used += (ROW_OVERHEAD_BYTES + FIELD_OVERHEAD_BYTES * len(row)
+                         + sum(map(len, row)))
+                if used >= budget:
+                    runs.append(_spill(batch, col, key, directory, block_rows))
+                    rows += len(batch)
+                    batch, used = [], 0
+            if batch:
+                runs.append(_spill(batch, col, key, directory, block_rows))
+                rows += len(batch)
+
+        n_runs = len(runs)
+        passes = 0
+        while len(runs) > fan_in:
+            runs = [
+                _merge_runs_to_file(runs[i:i + fan_in], directory, block_rows)
+                for i in range(0, len(runs), fan_in)
+            ]
+            passes += 1
+
+        with open(dst, "w", newline="") as out:
+            writer = csv.writer(out)
+            writer.writerow(header)
+            writer.writerows(
+                row for _, row in kway_merge([_read_run(p) for p in runs])
+            )
+        passes += 1
+
+    return {"rows": rows, "runs": n_runs, "merge_passes": passes}
+
+
+def _spill(
+    batch: list[list[str]], col: int, key: Callable, directory: str, block_rows: int
+) -> str:
+    """Sort one in-memory run and write it to a run file."""
+    pairs = [(key(row[col]), row) for row in batch]
+    pairs = natural_merge_sort(pairs, key=lambda pair: pair[0])
+    return _write_run(pairs, directory, block_rows)
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Sort a trips CSV larger than memory.")
+    parser.add_argument("src", help="input CSV")
+    parser.add_argument("dst", help="output CSV")
+    parser.add_argument("--key", default="start_time", help="column to sort by")
+    parser.add_argument("--key-type", default="str", choices=sorted(KEY_TYPES))
+    parser.add_argument("--memory-mb", type=float, default=256)
+    parser.add_argument("--block-rows", type=int, default=8192)
+    parser.add_argument("--fan-in", type=int, default=64)
+    parser.add_argument("--tmp-dir", default=None)
+    args = parser.parse_args(argv)
+
+    stats = external_sort_csv(
+        args.src, args.dst, args.key, args.key_type, args.memory_mb,
+        args.block_rows, args.fan_in, args.tmp_dir,
+    )
+    print(f"Sorted {stats['rows']} rows from {stats['runs']} runs "
+          f"in {stats['merge_passes']} merge pass(es) -> {args.dst}")
+
+
+if __name__ == "__main__":
+    main()
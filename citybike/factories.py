@@ -7,18 +7,51 @@ so the rest of the code never needs to import ClassicBike / ElectricBike etc.
 Students should:
     - Complete create_user()
     - Optionally add create_trip() and create_maintenance_record()
+
+Bulk factories (create_*_bulk) build objects from whole DataFrames: the
+columns are validated once, shared Station / User / Bike instances are
+interned through an IdentityMap, and Trip / MaintenanceRecord objects are
+then built in a single pass over the column arrays.
+
+With trusted=True the per-instance constructor checks are skipped: the
+columns are validated once with the vectorized utils.validate_*_column
+helpers (which report offending rows) and objects are created through the
+models' `from_trusted` constructors. The default stays fully strict.
 """
 
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
 from models import (
     Bike,
     ClassicBike,
     ElectricBike,
+    Station,
     User,
     CasualUser,
     MemberUser,
+    Trip,
+    MaintenanceRecord,
+)
+from utils import (
+    VALID_BIKE_TYPES,
+    VALID_USER_TYPES,
+    VALID_MAINTENANCE_TYPES,
+    raise_for_rows,
+    validate_email_column,
+    validate_in_column,
+    validate_non_negative_column,
+    validate_positive_column,
 )
 
 
+# Membership window assumed for members whose dates are not known.
+DEFAULT_MEMBERSHIP_START = datetime(2000, 1, 1)
+DEFAULT_MEMBERSHIP_END = datetime(2100, 1, 1)
+
+
 def create_bike(data: dict) -> Bike:
     """Create a Bike (ClassicBike or ElectricBike) from a data dictionary.
 
@@ -91,3 +124,267 @@ def create_user(data: dict) -> User:
     else:
         raise ValueError(f"Unknown user_type: {user_type!r}")
     # raise NotImplementedError("create_user")
+
+
+# ---------------------------------------------------------------------------
+# Bulk factories
+# ---------------------------------------------------------------------------
+
+class IdentityMap:
+    """Interns shared domain objects so every ID is instantiated once.
+
+    Attributes:
+        stations: station_id -> Station
+        users: user_id -> User
+        bikes: bike_id -> Bike
+    """
+
+    def __init__(self) -> None:
+        self.stations: dict[str, Station] = {}
+        self.users: dict[str, User] = {}
+        self.bikes: dict[str, Bike] = {}
+
+
+def _require_columns(frame: pd.DataFrame, columns: list[str]) -> None:
+    missing = [c for c in columns if c not in frame.columns]
+    if missing:
+        raise ValueError(f"Missing columns: {missing}")
+
+
+def _validate_ids(ids: pd.Series, name: str) -> None:
+    """Column version of the Entity id check (non-empty string)."""
+    as_str = ids.astype(str)
+    bad = ids.isna() | ~ids.map(type).eq(str) | as_str.str.len().eq(0)
+    raise_for_rows(bad.to_numpy(), ids, f"{name} must be a non-empty string")
+
+
+def _datetimes(column: pd.Series) -> pd.Series:
+    if not pd.api.types.is_datetime64_any_dtype(column):
+        column = pd.to_datetime(column)
+    return column
+
+
+def create_stations_bulk(
+    frame: pd.DataFrame,
+    identity_map: IdentityMap | None = None,
+    trusted: bool = False,
+) -> list[Station]:
+    """Create Station objects from a stations DataFrame.
+
+    Args:
+        frame: Columns 'station_id', 'station_name', 'capacity',
+            'latitude', 'longitude'.
+        identity_map: Map to intern into (stations already present are
+            reused, not rebuilt).
+        trusted: Skip per-instance constructor checks.
+
+    Returns:
+        One Station per row, in row order.
+
+    Raises:
+        ValueError: Listing the offending rows if any column is invalid.
+    """
+    identity_map = identity_map or IdentityMap()
+    _require_columns(frame, ["station_id", "station_name", "capacity",
+                             "latitude", "longitude"])
+    validate_positive_column(frame["capacity"], "capacity")
+    lat = frame["latitude"].to_numpy(dtype=np.float64)
+    lon = frame["longitude"].to_numpy(dtype=np.float64)
+    raise_for_rows(~((lat >= -90) & (lat <= 90)), frame,
+                   "latitude must be between -90 and 90")
+    raise_for_rows(~((lon >= -180) & (lon <= 180)), frame,
+                   "longitude must be between -180 and 180")
+    if trusted:
+        _validate_ids(frame["station_id"], "station_id")
+    build = Station.from_trusted if trusted else Station
+
+    stations = identity_map.stations
+    result = []
+    for sid, name, cap, la, lo in zip(
+        frame["station_id"].tolist(), frame["station_name"].tolist(),
+        frame["capacity"].tolist(), lat.tolist(), lon.tolist(),
+    ):
+        station = stations.get(sid)
+        if station is None:
+            station = stations[sid] = build(sid, name, cap, la, lo)
+        result.append(station)
+    return result
+
+
+def create_bikes_bulk(
+    frame: pd.DataFrame,
+    identity_map: IdentityMap | None = None,
+    trusted: bool = False,
+) -> list[Bike]:
+    """Create (or reuse) one Bike per row from 'bike_id' / 'bike_type'.
+
+    Repeated bike IDs resolve to the same interned instance.
+    """
+    identity_map = identity_map or IdentityMap()
+    _require_columns(frame, ["bike_id", "bike_type"])
+    bike_type = frame["bike_type"].str.lower()
+    validate_in_column(bike_type, VALID_BIKE_TYPES, "bike_type")
+    ids = frame["bike_id"]
+    if trusted:
+        _validate_ids(ids, "bike_id")
+        classic, electric = ClassicBike.from_trusted, ElectricBike.from_trusted
+    else:
+        classic, electric = ClassicBike, ElectricBike
+
+    bikes = identity_map.bikes
+    first = ~ids.duplicated().to_numpy()
+    for bid, btype in zip(ids[first].tolist(), bike_type[first].tolist()):
+        if bid not in bikes:
+            bikes[bid] = classic(bid) if btype == "classic" else electric(bid)
+    return [bikes[bid] for bid in ids.tolist()]
+
+
+def create_users_bulk(
+    frame: pd.DataFrame,
+    identity_map: IdentityMap | None = None,
+    trusted: bool = False,
+) -> list[User]:
+    """Create (or reuse) one User per row from 'user_id' / 'user_type'.
+
+    Optional columns 'name', 'email', 'day_pass_count', 'membership_start',
+    'membership_end' and 'tier' are used when present; members without
+    dates get an open-ended membership.
+    """
+    identity_map = identity_map or IdentityMap()
+    _require_columns(frame, ["user_id", "user_type"])
+    user_type = frame["user_type"].str.lower()
+    validate_in_column(user_type, VALID_USER_TYPES, "user_type")
+
+    ids = frame["user_id"]
+    first = ~ids.duplicated().to_numpy()
+    unique = frame[first]
+    is_member = user_type[first].eq("member").to_numpy()
+
+    def column(name: str, default) -> pd.Series:
+        if name in unique:
+            return unique[name].fillna(default)
+        return pd.Series([default] * len(unique), index=unique.index, dtype=object)
+
+    names = column("name", "Unknown")
+    emails = validate_email_column(column("email", "unknown@example.com"))
+    passes = column("day_pass_count", 0)
+    starts = column("membership_start", DEFAULT_MEMBERSHIP_START)
+    ends = column("membership_end", DEFAULT_MEMBERSHIP_END)
+    tiers = column("tier", "basic")
+    if trusted:
+        _validate_ids(unique["user_id"], "user_id")
+        validate_non_negative_column(passes, "day_pass_count")
+        validate_in_column(tiers[is_member], {"basic", "premium"}, "tier")
+        raise_for_rows(
+            is_member & ~(_datetimes(ends) > _datetimes(starts)).to_numpy(),
+            unique, "membership_end must be after start",
+        )
+        casual, member = CasualUser.from_trusted, MemberUser.from_trusted
+    else:
+        casual, member = CasualUser, MemberUser
+
+    users = identity_map.users
+    for uid, is_mem, name, email, n_pass, start, end, tier in zip(
+        unique["user_id"].tolist(), is_member.tolist(), names.tolist(),
+        emails.tolist(), passes.tolist(), starts.tolist(), ends.tolist(),
+        tiers.tolist(),
+    ):
+        if uid in users:
+            continue
+        if is_mem:
+            users[uid] = member(uid, name, email, start, end, tier)
+        else:
+            users[uid] = casual(uid, name, email, int(n_pass))
+    return [users[uid] for uid in ids.tolist()]
+
+
+def create_trips_bulk(
+    trips: pd.DataFrame,
+    stations: pd.DataFrame | None = None,
+    identity_map: IdentityMap | None = None,
+    trusted: bool = False,
+) -> list[Trip]:
+    """Create Trip objects from a (cleaned) trips DataFrame.
+
+    Users, bikes and stations are interned through *identity_map*, so a
+    user with 500 trips is built once and shared by all 500 Trip objects.
+
+    Args:
+        trips: Trips with the columns of trips_clean.csv.
+        stations: Station metadata for the station IDs referenced by the
+            trips. May be omitted if *identity_map* already holds them.
+        identity_map: Map to intern into; a new one is used if None.
+        trusted: Skip per-instance constructor checks. Columns are still
+            validated in bulk, so invalid rows are reported either way.
+
+    Returns:
+        One Trip per row, in row order.
+
+    Raises:
+        ValueError: Listing the offending rows if any column is invalid
+            or references an unknown station.
+    """
+    identity_map = identity_map or IdentityMap()
+    _require_columns(trips, [
+        "trip_id", "user_id", "user_type", "bike_id", "bike_type",
+        "start_station_id", "end_station_id", "start_time", "end_time",
+        "distance_km",
+    ])
+    start = _datetimes(trips["start_time"])
+    end = _datetimes(trips["end_time"])
+    validate_non_negative_column(trips["distance_km"], "distance_km")
+    raise_for_rows((end < start).to_numpy(), trips,
+                   "end_time must be after start_time")
+
+    if stations is not None:
+        create_stations_bulk(stations, identity_map, trusted)
+    known = identity_map.stations
+    for col in ("start_station_id", "end_station_id"):
+        raise_for_rows(~trips[col].isin(list(known)).to_numpy(), trips,
+                       f"Unknown {col}")
+
+    users = create_users_bulk(trips[["user_id", "user_type"]], identity_map, trusted)
+    bikes = create_bikes_bulk(trips[["bike_id", "bike_type"]], identity_map, trusted)
+    build = Trip.from_trusted if trusted else Trip
+
+    return [
+        build(tid, user, bike, known[s], known[e], t0, t1, dist)
+        for tid, user, bike, s, e, t0, t1, dist in zip(
+            trips["trip_id"].tolist(), users, bikes,
+            trips["start_station_id"].tolist(), trips["end_station_id"].tolist(),
+            start.tolist(), end.tolist(), trips["distance_km"].tolist(),
+        )
+    ]
+
+
+def create_maintenance_records_bulk(
+    maintenance: pd.DataFrame,
+    identity_map: IdentityMap | None = None,
+    trusted: bool = False,
+) -> list[MaintenanceRecord]:
+    """Create MaintenanceRecord objects from a maintenance DataFrame.
+
+    Bikes are interned through *identity_map*, so records share the Bike
+    instances used by trips loaded into the same map.
+    """
+    identity_map = identity_map or IdentityMap()
+    _require_columns(maintenance, ["record_id", "bike_id", "bike_type", "date",
+                                   "maintenance_type", "cost"])
+    validate_non_negative_column(maintenance["cost"], "cost")
+    validate_in_column(maintenance["maintenance_type"], VALID_MAINTENANCE_TYPES,
+                       "maintenance_type")
+    dates = _datetimes(maintenance["date"])
+    descriptions = (maintenance["description"].fillna("").tolist()
+                    if "description" in maintenance else [""] * len(maintenance))
+    bikes = create_bikes_bulk(maintenance[["bike_id", "bike_type"]],
+                              identity_map, trusted)
+    build = MaintenanceRecord.from_trusted if trusted else MaintenanceRecord
+
+    return [
+        build(rid, bike, date, mtype, c, desc)
+        for rid, bike, date, mtype, c, desc in zip(
+            maintenance["record_id"].tolist(), bikes, dates.tolist(),
+            maintenance["maintenance_type"].tolist(),
+            maintenance["cost"].tolist(), descriptions,
+        )
+    ]
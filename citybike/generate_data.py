@@ -1,19 +1,55 @@
 """
 Synthetic data generator for the CityBike project.
 
-Run this script once to create the raw CSV files in the data/ directory.
+Creates the raw CSV files (stations.csv, trips.csv, maintenance.csv) in
+the data/ directory. Every column is drawn in one vectorized call with a
+numpy.random.Generator, and trips are produced and written in fixed-size
+chunks, so memory stays flat even for 100M-trip load-test datasets.
+
+Reproducibility: each trip chunk has its own random stream,
+SeedSequence(seed, spawn_key=(1, chunk_index)) — the chunk_index-th child
+of SeedSequence(seed).spawn(2)[1] — and the station / user / bike tables
+and the maintenance log use separate streams. The same seed and chunk
+size therefore always produce byte-identical files.
+
+Parallelism: chunks are grouped into shards (contiguous chunk ranges)
+written by a process pool. Because streams belong to chunks, not to
+workers, the output is the same for any number of workers. Shards can be
+kept as partition files with a manifest (--partitioned) or concatenated
+into a single trips.csv.
+
 Usage:
-    python generate_data.py
+    python generate_data.py                                # small sample data
+    python generate_data.py --trips 100000000 --stations 800 \\
+        --users 2000000 --bikes 30000 --out-dir /scratch/citybike
+    python generate_data.py --trips 1000000000 --workers 32 --partitioned \\
+        --out-dir /scratch/soak
+    python generate_data.py --trips 10000000 --demand realistic --user-alpha 1.4
+
+Demand: by default stations, users and start times are uniform, as in
+the original sample data. --demand realistic switches to a DemandProfile
+with Zipf station popularity, a power-law of trips per user, weekday
+commute peaks, a flatter weekend profile and a seasonal monthly curve.
 """
 
-import pandas as pd
+import argparse
+import functools
+import hashlib
+import json
+import shutil
+import tempfile
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
 import numpy as np
-from datetime import datetime, timedelta
+import pandas as pd
 
-np.random.seed(42)
 
-# --- Station data ---
-station_names = [
+DATA_DIR = Path(__file__).resolve().parent / "data"
+
+STATION_NAMES = [
     "Central Station", "University Campus", "City Hall",
     "Riverside Park", "Market Square", "Tech Hub",
     "Old Town", "Harbor View", "Sports Arena",
@@ -21,101 +57,605 @@ station_names = [
     "Business District", "Lakeside", "Airport Terminal",
 ]
 
-stations = []
-for i, name in enumerate(station_names):
-    stations.append({
-        "station_id": f"ST{100 + i}",
-        "station_name": name,
-        "capacity": np.random.choice([10, 15, 20, 25, 30]),
-        "latitude": round(48.75 + np.random.uniform(0, 0.15), 6),
-        "longitude": round(9.15 + np.random.uniform(0, 0.15), 6),
+MAINTENANCE_TYPES = [
+    "tire_repair", "brake_adjustment",
+    "battery_replacement", "chain_lubrication",
+    "general_inspection",
+]
+
+TRIP_COLUMNS = [
+    "trip_id", "user_id", "user_type", "bike_id", "bike_type",
+    "start_station_id", "end_station_id", "start_time", "end_time",
+    "duration_minutes", "distance_km", "status",
+]
+
+# spawn_key prefixes of the independent random streams.
+_META_STREAM = 0
+_TRIP_STREAM = 1
+_MAINTENANCE_STREAM = 2
+
+
+class DemandProfile(NamedTuple):
+    """Skewed, time-dependent demand model for realistic load tests.
+
+    Attributes:
+        station_zipf: Zipf exponent of station popularity (start and end
+            stations); the rank order of stations is fixed per seed.
+        user_alpha: Zipf exponent of trips per user (heavy-user tail).
+        member_share: Fraction of users who are members (per user, so a
+            user's type is consistent across trips).
+        weekday_peaks: (hour, spread in hours, weight) Gaussian bumps on
+            working days — the morning and evening commute.
+        weekend_peaks: Same for Saturdays and Sundays.
+        off_peak_level: Flat demand between 05:00 and midnight, relative
+            to a peak weight of 1.
+        weekend_volume: Trips on a weekend day relative to a weekday.
+        seasonal_amplitude: Monthly volume is 1 + A·cos(2π(m − peak)/12).
+        peak_month: Busiest month (1–12).
+        weekday_duration, weekend_duration: Mean trip minutes.
+    """
+
+    station_zipf: float = 1.1
+    user_alpha: float = 1.0
+    member_share: float = 0.65
+    weekday_peaks: tuple[tuple[float, float, float], ...] = (
+        (8.0, 1.0, 1.0), (17.5, 1.5, 1.0))
+    weekend_peaks: tuple[tuple[float, float, float], ...] = ((14.0, 3.0, 1.0),)
+    off_peak_level: float = 0.1
+    weekend_volume: float = 0.6
+    seasonal_amplitude: float = 0.5
+    peak_month: int = 7
+    weekday_duration: float = 18.0
+    weekend_duration: float = 35.0
+
+    def validate(self) -> None:
+        """Raise ValueError for parameters that give no valid distribution."""
+        for name in ("station_zipf", "user_alpha", "off_peak_level", "weekend_volume"):
+            if getattr(self, name) < 0:
+                raise ValueError(f"{name} must be non-negative")
+        if not 0.0 <= self.member_share <= 1.0:
+            raise ValueError("member_share must be between 0 and 1")
+        if not 0.0 <= self.seasonal_amplitude < 1.0:
+            raise ValueError("seasonal_amplitude must be in [0, 1)")
+        if not 1 <= self.peak_month <= 12:
+            raise ValueError("peak_month must be between 1 and 12")
+        if self.weekday_duration <= 0 or self.weekend_duration <= 0:
+            raise ValueError("trip durations must be positive")
+
+    def day_weights(self, start_date: str, days: int) -> np.ndarray:
+        """Relative trip volume of each day (weekday/weekend × season)."""
+        dates = np.datetime64(start_date, "D") + np.arange(days)
+        weekend = _is_weekend(dates)
+        month = dates.astype("datetime64[M]").astype(int) % 12 + 1
+        season = 1 + self.seasonal_amplitude * np.cos(
+            2 * np.pi * (month - self.peak_month) / 12)
+        return np.where(weekend, self.weekend_volume, 1.0) * season
+
+    def minute_weights(self, weekend: bool) -> np.ndarray:
+        """Relative demand for each minute of the day (1440 values)."""
+        hours = np.arange(24 * 60) / 60
+        weights = np.where(hours >= 5, self.off_peak_level, 0.0)
+        for center, spread, weight in (self.weekend_peaks if weekend
+                                       else self.weekday_peaks):
+            weights = weights + weight * np.exp(-0.5 * ((hours - center) / spread) ** 2)
+        return weights
+
+    def zipf_weights(self, n: int, exponent: float, rng: np.random.Generator) -> np.ndarray:
+        """Zipf weights 1/rank**exponent, with ranks shuffled by *rng*."""
+        return 1.0 / rng.permutation(np.arange(1, n + 1)) ** exponent
+
+
+REALISTIC_DEMAND = DemandProfile()
+
+
+class GeneratorConfig(NamedTuple):
+    """Size, time span and messiness of a synthetic dataset.
+
+    Attributes:
+        n_trips: Trips before duplicates are injected.
+        n_stations, n_users, n_bikes: Entity counts.
+        n_maintenance: Maintenance records.
+        start_date: First day of the trip period (YYYY-MM-DD).
+        days: Length of the trip period in days.
+        missing_rate: Fraction of trips missing duration and, separately,
+            distance.
+        zero_length_rate: Fraction of trips with end_time == start_time.
+        duplicate_rate: Fraction of each chunk re-appended as duplicates.
+        status_missing_rate: Fraction of trips with no status.
+        case_noise_rate: Fraction of user types written as ' Member' etc.
+        cost_missing_rate: Fraction of maintenance records without cost.
+        chunk_size: Trips generated and written per chunk.
+        seed: Root seed.
+        demand: DemandProfile for skewed stations / users and commute,
+            weekend and seasonal patterns; None draws them uniformly.
+    """
+
+    n_trips: int = 1500
+    n_stations: int = 15
+    n_users: int = 80
+    n_bikes: int = 60
+    n_maintenance: int = 200
+    start_date: str = "2024-01-01"
+    days: int = 365
+    missing_rate: float = 10 / 1500
+    zero_length_rate: float = 5 / 1500
+    duplicate_rate: float = 0.01
+    status_missing_rate: float = 0.06
+    case_noise_rate: float = 0.0
+    cost_missing_rate: float = 0.04
+    chunk_size: int = 1_000_000
+    seed: int = 42
+    demand: DemandProfile | None = None
+
+    def validate(self) -> None:
+        """Raise ValueError for impossible sizes or rates."""
+        for name in ("n_stations", "n_users", "n_bikes", "days", "chunk_size"):
+            if getattr(self, name) <= 0:
+                raise ValueError(f"{name} must be positive")
+        for name in ("n_trips", "n_maintenance"):
+            if getattr(self, name) < 0:
+                raise ValueError(f"{name} must be non-negative")
+        rates = ("missing_rate", "zero_length_rate", "duplicate_rate",
+                 "status_missing_rate", "case_noise_rate", "cost_missing_rate")
+        for name in rates:
+            if not 0.0 <= getattr(self, name) <= 1.0:
+                raise ValueError(f"{name} must be between 0 and 1")
+        if self.demand is not None:
+            self.demand.validate()
+
+    def to_dict(self) -> dict:
+        """Plain-dict form (JSON-serializable, demand expanded)."""
+        data = self._asdict()
+        if self.demand is not None:
+            data["demand"] = self.demand._asdict()
+        return data
+
+
+def _rng(config: GeneratorConfig, *key: int) -> np.random.Generator:
+    return np.random.default_rng(np.random.SeedSequence(config.seed, spawn_key=key))
+
+
+def _is_weekend(dates: np.ndarray) -> np.ndarray:
+    """True for Saturdays and Sundays (1970-01-01 was a Thursday)."""
+    return (dates.astype("datetime64[D]").astype(np.int64) + 3) % 7 >= 5
+
+
+def _sample(rng: np.random.Generator, weights: np.ndarray, n: int) -> np.ndarray:
+    """Draw *n* indices with probability proportional to *weights*."""
+    cdf = np.cumsum(weights, dtype=np.float64)
+    return np.searchsorted(cdf, rng.random(n) * cdf[-1], side="right")
+
+
+def _ids(prefix: str, first: int, count: int) -> np.ndarray:
+    """Return [prefix + str(first), …] for *count* consecutive numbers."""
+    return np.char.add(prefix, np.arange(first, first + count).astype(str)).astype(object)
+
+
+# ---------------------------------------------------------------------------
+# Entities
+# ---------------------------------------------------------------------------
+
+def generate_stations(config: GeneratorConfig) -> pd.DataFrame:
+    """Return the station table (named stations first, then numbered ones)."""
+    rng = _rng(config, _META_STREAM, 0)
+    n = config.n_stations
+    names = STATION_NAMES[:n] + [f"Station {i}" for i in range(len(STATION_NAMES), n)]
+    return pd.DataFrame({
+        "station_id": _ids("ST", 100, n),
+        "station_name": names,
+        "capacity": rng.choice([10, 15, 20, 25, 30], n),
+        "latitude": (48.75 + rng.uniform(0, 0.15, n)).round(6),
+        "longitude": (9.15 + rng.uniform(0, 0.15, n)).round(6),
     })
 
-stations_df = pd.DataFrame(stations)
-stations_df.to_csv("data/stations.csv", index=False)
-
-# --- Trip data ---
-n_trips = 1500
-user_ids = [f"USR{np.random.randint(1000, 1200)}" for _ in range(80)]
-bike_ids = [f"BK{np.random.randint(200, 350)}" for _ in range(60)]
-start_date = datetime(2024, 1, 1)
-
-trips = []
-for i in range(n_trips):
-    user_type = np.random.choice(["casual", "member"], p=[0.35, 0.65])
-    bike_type = np.random.choice(["classic", "electric"], p=[0.6, 0.4])
-    start_st = np.random.choice(stations_df["station_id"])
-    end_st = np.random.choice(stations_df["station_id"])
-    start_time = start_date + timedelta(
-        days=np.random.randint(0, 365),
-        hours=np.random.randint(6, 23),
-        minutes=np.random.randint(0, 60),
-    )
-    duration = max(2, np.random.exponential(25))
-    end_time = start_time + timedelta(minutes=duration)
-    distance = round(np.random.uniform(0.5, 15.0), 2)
-    status = np.random.choice(
-        ["completed", "cancelled", np.nan],
-        p=[0.82, 0.12, 0.06],
+
+def generate_maintenance(config: GeneratorConfig) -> pd.DataFrame:
+    """Return the maintenance log (battery replacements on electric bikes)."""
+    rng = _rng(config, _MAINTENANCE_STREAM)
+    n = config.n_maintenance
+    bikes = _ids("BK", 200, config.n_bikes)[rng.integers(0, config.n_bikes, n)]
+    mtype = np.asarray(MAINTENANCE_TYPES, dtype=object)[
+        rng.integers(0, len(MAINTENANCE_TYPES), n)]
+    battery = mtype == "battery_replacement"
+    cost = np.where(battery, rng.uniform(80, 250, n), rng.uniform(10, 150, n)).round(2)
+    cost[rng.random(n) < config.cost_missing_rate] = np.nan
+    day = np.datetime64(config.start_date, "D") + rng.integers(0, config.days, n)
+    labels = pd.Series(mtype).str.replace("_", " ").str.title()
+    return pd.DataFrame({
+        "record_id": _ids("MR", 5000, n),
+        "bike_id": bikes,
+        "bike_type": np.where(battery | (rng.random(n) < 0.5), "electric", "classic"),
+        "date": np.datetime_as_string(day, unit="D"),
+        "maintenance_type": mtype,
+        "cost": cost,
+        "description": (labels + " for bike " + bikes).to_numpy(),
+    })
+
+
+# ---------------------------------------------------------------------------
+# Trips
+# ---------------------------------------------------------------------------
+
+def chunk_bounds(config: GeneratorConfig) -> list[tuple[int, int]]:
+    """Return the [start, stop) trip rows of every chunk."""
+    edges = list(range(0, config.n_trips, config.chunk_size)) + [config.n_trips]
+    return [(lo, hi) for lo, hi in zip(edges[:-1], edges[1:])]
+
+
+def generate_trip_chunk(config: GeneratorConfig, index: int) -> pd.DataFrame:
+    """Generate chunk *index* of the trips table, duplicates included.
+
+    A chunk depends only on (seed, index, chunk_size), never on earlier
+    chunks, so chunks can be produced in any order or in parallel.
+    """
+    lo, hi = chunk_bounds(config)[index]
+    n = hi - lo
+    rng = _rng(config, _TRIP_STREAM, index)
+
+    start = (
+        np.datetime64(config.start_date, "s")
+        + rng.integers(0, config.days, n) * 86_400
+        + rng.integers(6, 23, n) * 3_600
+        + rng.integers(0, 60, n) * 60
     )
+    duration = np.maximum(2.0, rng.exponential(25, n))
+    end = start + (duration * 60).astype("timedelta64[s]")
+    zero = rng.random(n) < config.zero_length_rate
+    end[zero] = start[zero]
+
+    user_type = np.where(rng.random(n) < 0.35, "casual", "member").astype(object)
+    noisy = rng.random(n) < config.case_noise_rate
+    user_type[noisy] = np.where(user_type[noisy] == "casual", "Casual ", " Member")
+    status = np.asarray(["completed", "cancelled"], dtype=object)[
+        (rng.random(n) < 0.12).astype(np.int8)]
+    status[rng.random(n) < config.status_missing_rate] = np.nan
 
-    trips.append({
-        "trip_id": f"TR{10000 + i}",
-        "user_id": np.random.choice(user_ids),
+    duration = duration.round(1)
+    duration[rng.random(n) < config.missing_rate] = np.nan
+    distance = rng.uniform(0.5, 15.0, n).round(2)
+    distance[rng.random(n) < config.missing_rate] = np.nan
+
+    station_ids = _ids("ST", 100, config.n_stations)
+    chunk = pd.DataFrame({
+        "trip_id": _ids("TR", 10_000 + lo, n),
+        "user_id": _ids("USR", 1000, config.n_users)[rng.integers(0, config.n_users, n)],
         "user_type": user_type,
-        "bike_id": np.random.choice(bike_ids),
-        "bike_type": bike_type,
-        "start_station_id": start_st,
-        "end_station_id": end_st,
-        "start_time": start_time.strftime("%Y-%m-%d %H:%M:%S"),
-        "end_time": end_time.strftime("%Y-%m-%d %H:%M:%S"),
-        "duration_minutes": round(duration, 1),
+        "bike_id": _ids("BK", 200, config.n_bikes)[rng.integers(0, config.n_bikes, n)],
+        "bike_type": np.where(rng.random(n) < 0.6, "classic", "electric"),
+        "start_station_id": station_ids[rng.integers(0, config.n_stations, n)],
+        "end_station_id": station_ids[rng.integers(0, config.n_stations, n)],
+        "start_time": start,
+        "end_time": end,
+        "duration_minutes": duration,
         "distance_km": distance,
         "status": status,
-    })
+    }, columns=TRIP_COLUMNS)
 
-trips_df = pd.DataFrame(trips)
+    if config.demand is not None and n:
+        _apply_demand(chunk, config, _rng(config, _TRIP_STREAM, index, 1))
 
-# Inject some messiness
-idx = np.random.choice(n_trips, 30, replace=False)
-trips_df.loc[idx[:10], "duration_minutes"] = np.nan
-trips_df.loc[idx[10:20], "distance_km"] = np.nan
-trips_df.loc[idx[20:25], "end_time"] = trips_df.loc[idx[20:25], "start_time"]
-dup_rows = trips_df.sample(15)
-trips_df = pd.concat([trips_df, dup_rows], ignore_index=True)
-trips_df.to_csv("data/trips.csv", index=False)
+    n_dup = rng.binomial(n, config.duplicate_rate) if n else 0
+    if n_dup:
+        chunk = pd.concat([chunk, chunk.iloc[rng.integers(0, n, n_dup)]],
+                          ignore_index=True)
+    return chunk
 
-# --- Maintenance data ---
-maint_types = [
-    "tire_repair", "brake_adjustment",
-    "battery_replacement", "chain_lubrication",
-    "general_inspection",
-]
 
-records = []
-for i in range(200):
-    bike = np.random.choice(bike_ids)
-    btype = np.random.choice(["classic", "electric"])
-    mtype = np.random.choice(maint_types)
-    cost = round(np.random.uniform(10, 150), 2)
-    if mtype == "battery_replacement":
-        cost = round(np.random.uniform(80, 250), 2)
-        btype = "electric"
-
-    records.append({
-        "record_id": f"MR{5000 + i}",
-        "bike_id": bike,
-        "bike_type": btype,
-        "date": (
-            start_date + timedelta(days=np.random.randint(0, 365))
-        ).strftime("%Y-%m-%d"),
-        "maintenance_type": mtype,
-        "cost": cost,
-        "description": f"{mtype.replace('_', ' ').title()} for bike {bike}",
-    })
+@functools.lru_cache(maxsize=4)
+def _demand_tables(config: GeneratorConfig) -> dict[str, np.ndarray]:
+    """Per-dataset demand weights, drawn from the metadata stream once."""
+    demand = config.demand
+    return {
+        "station": demand.zipf_weights(
+            config.n_stations, demand.station_zipf, _rng(config, _META_STREAM, 1)),
+        "user": demand.zipf_weights(
+            config.n_users, demand.user_alpha, _rng(config, _META_STREAM, 2)),
+        "member": _rng(config, _META_STREAM, 3).random(config.n_users) < demand.member_share,
+        "day": demand.day_weights(config.start_date, config.days),
+        "weekday_minute": demand.minute_weights(weekend=False),
+        "weekend_minute": demand.minute_weights(weekend=True),
+    }
+
+
+def _apply_demand(chunk: pd.DataFrame, config: GeneratorConfig,
+                  rng: np.random.Generator) -> None:
+    """Redraw stations, users and times of a uniform chunk from the demand model.
+
+    Uses its own stream, so the uniform columns (and uniform datasets)
+    are unaffected. Injected messiness — zero-length trips, missing
+    durations, user-type case noise — stays on the same rows.
+    """
+    demand, tables, n = config.demand, _demand_tables(config), len(chunk)
+
+    day = _sample(rng, tables["day"], n)
+    dates = np.datetime64(config.start_date, "D") + day
+    weekend = _is_weekend(dates)
+    minute = np.empty(n, dtype=np.int64)
+    minute[~weekend] = _sample(rng, tables["weekday_minute"], int((~weekend).sum()))
+    minute[weekend] = _sample(rng, tables["weekend_minute"], int(weekend.sum()))
+    start = dates.astype("datetime64[s]") + minute * 60
+
+    mean = np.where(weekend, demand.weekend_duration, demand.weekday_duration)
+    duration = np.maximum(2.0, rng.exponential(mean))
+    zero = (chunk["end_time"] == chunk["start_time"]).to_numpy()
+    end = start + (duration * 60).astype("timedelta64[s]")
+    end[zero] = start[zero]
+    missing = chunk["duration_minutes"].isna().to_numpy()
+    duration = duration.round(1)
+    duration[missing] = np.nan
+
+    user = _sample(rng, tables["user"], n)
+    user_type = np.where(tables["member"][user], "member", "casual").astype(object)
+    noisy = ~chunk["user_type"].isin(["casual", "member"]).to_numpy()
+    user_type[noisy] = np.where(user_type[noisy] == "casual", "Casual ", " Member")
+    station_ids = _ids("ST", 100, config.n_stations)
+
+    chunk["user_id"] = _ids("USR", 1000, config.n_users)[user]
+    chunk["user_type"] = user_type
+    chunk["start_station_id"] = station_ids[_sample(rng, tables["station"], n)]
+    chunk["end_station_id"] = station_ids[_sample(rng, tables["station"], n)]
+    chunk["start_time"] = start
+    chunk["end_time"] = end
+    chunk["duration_minutes"] = duration
+
+
+def iter_trip_chunks(config: GeneratorConfig) -> Iterator[pd.DataFrame]:
+    """Yield every trips chunk in order."""
+    for index in range(len(chunk_bounds(config))):
+        yield generate_trip_chunk(config, index)
+
+
+def generate_tables(
+    config: GeneratorConfig,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Return (trips, stations, maintenance) in memory — for tests and benchmarks."""
+    config.validate()
+    chunks = list(iter_trip_chunks(config))
+    trips = (pd.concat(chunks, ignore_index=True) if chunks
+             else pd.DataFrame(columns=TRIP_COLUMNS))
+    return trips, generate_stations(config), generate_maintenance(config)
+
+
+# ---------------------------------------------------------------------------
+# Writing
+# ---------------------------------------------------------------------------
+
+def write_trip_chunks(config: GeneratorConfig, path: str | Path, indices) -> int:
+    """Write the given trip chunks to one CSV file; return rows written."""
+    rows = 0
+    with open(path, "w", newline="") as fh:
+        fh.write(",".join(TRIP_COLUMNS) + "\n")
+        for index in indices:
+            chunk = generate_trip_chunk(config, index)
+            chunk.to_csv(fh, header=False, index=False, lineterminator="\n")
+            rows += len(chunk)
+    return rows
+
+
+def shard_ranges(config: GeneratorConfig, shards: int | None = None) -> list[tuple[int, int]]:
+    """Split the chunks into *shards* contiguous [first, stop) chunk ranges.
+
+    Shards depend only on the config and the shard count, never on the
+    number of worker processes. Defaults to one shard per chunk.
+    """
+    n_chunks = len(chunk_bounds(config))
+    shards = n_chunks if shards is None else min(shards, n_chunks)
+    if n_chunks and shards < 1:
+        raise ValueError("shards must be at least 1")
+    edges = np.linspace(0, n_chunks, shards + 1).astype(int) if n_chunks else [0]
+    return [(int(a), int(b)) for a, b in zip(edges[:-1], edges[1:])]
+
+
+def _sha256(path: str | Path, block_size: int = 1 << 20) -> str:
+    """Hex SHA-256 of a file, read in blocks so memory stays bounded."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _write_shard(task: tuple[GeneratorConfig, str, int, int]) -> dict:
+    """Worker entry point: write chunks [first, stop) to one partition file."""
+    config, path, first, stop = task
+    rows = write_trip_chunks(config, path, range(first, stop))
+    digest = _sha256(path)
+    return {
+        "file": Path(path).name,
+        "first_chunk": first,
+        "chunks": stop - first,
+        "first_trip": chunk_bounds(config)[first][0],
+        "rows": rows,
+        "sha256": digest,
+    }
+
+
+def _run_shards(tasks: list[tuple], workers: int) -> list[dict]:
+    """Write every shard, in worker processes when workers > 1."""
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    if workers == 1 or len(tasks) <= 1:
+        return [_write_shard(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+        return list(pool.map(_write_shard, tasks))
+
+
+def _write_entities(config: GeneratorConfig, out: Path) -> dict:
+    stations = generate_stations(config)
+    stations.to_csv(out / "stations.csv", index=False, lineterminator="\n")
+    maintenance = generate_maintenance(config)
+    maintenance.to_csv(out / "maintenance.csv", index=False, lineterminator="\n")
+    return {"stations": len(stations), "maintenance": len(maintenance)}
+
+
+def write_dataset(
+    config: GeneratorConfig, out_dir: str | Path = DATA_DIR, workers: int = 1
+) -> dict:
+    """Write stations.csv, trips.csv and maintenance.csv to *out_dir*.
+
+    With workers > 1, shards of trips are written in parallel to
+    temporary part files and concatenated in order, so trips.csv is
+    byte-identical to a single-process run.
+
+    Returns:
+        A dict with the number of rows written per file.
+    """
+    config.validate()
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    counts = _write_entities(config, out)
+    if workers == 1:
+        counts["trips"] = write_trip_chunks(
+            config, out / "trips.csv", range(len(chunk_bounds(config))))
+        return counts
+
+    with tempfile.TemporaryDirectory(dir=out) as tmp:
+        ranges = shard_ranges(config)
+        tasks = [(config, str(Path(tmp) / f"part-{k:05d}.csv"), first, stop)
+                 for k, (first, stop) in enumerate(ranges)]
+        parts = _run_shards(tasks, workers)
+        with open(out / "trips.csv", "wb") as dst:
+            dst.write((",".join(TRIP_COLUMNS) + "\n").encode())
+            for task in tasks:
+                with open(task[1], "rb") as src:
+                    src.readline()  # per-part header
+                    shutil.copyfileobj(src, dst, 1 << 20)
+    counts["trips"] = sum(part["rows"] for part in parts)
+    return counts
+
+
+def write_partitioned(
+    config: GeneratorConfig,
+    out_dir: str | Path,
+    shards: int | None = None,
+    workers: int = 1,
+) -> dict:
+    """Write trips as partition files plus a manifest, in parallel.
+
+    Layout::
+
+        out_dir/stations.csv
+        out_dir/maintenance.csv
+        out_dir/trips/part-00000.csv …   (each with a header row)
+        out_dir/manifest.json
+
+    Every shard is a contiguous range of chunks and every chunk has its
+    own seed stream, so each partition can be regenerated on its own and
+    the files (and manifest) are identical for any *workers* value.
+
+    Returns:
+        The manifest dict (also written to manifest.json).
+    """
+    config.validate()
+    out = Path(out_dir)
+    trips_dir = out / "trips"
+    trips_dir.mkdir(parents=True, exist_ok=True)
+    counts = _write_entities(config, out)
+
+    tasks = [(config, str(trips_dir / f"part-{k:05d}.csv"), first, stop)
+             for k, (first, stop) in enumerate(shard_ranges(config, shards))]
+    partitions = _run_shards(tasks, workers)
+    for part in partitions:
+        part["file"] = f"trips/{part['file']}"
+
+    manifest = {
+        "generator": "generate_data.py",
+        "seed": config.seed,
+        "config": config.to_dict(),
+        "seed_streams": {
+            "stations": [_META_STREAM, 0],
+            "maintenance": [_MAINTENANCE_STREAM],
+            "trip_chunk": [_TRIP_STREAM, "<chunk index>"],
+        },
+        "columns": TRIP_COLUMNS,
+        "stations": {"file": "stations.csv", "rows": counts["stations"]},
+        "maintenance": {"file": "maintenance.csv", "rows": counts["maintenance"]},
+        "trips": {
+            "rows": sum(part["rows"] for part in partitions),
+            "partitions": partitions,
+        },
+    }
+    (out / "manifest.json").write_text(json.dumps(manifest, indent=2) + "\n")
+    return manifest
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def build_parser() -> argparse.ArgumentParser:
+    defaults = GeneratorConfig()
+    parser = argparse.ArgumentParser(description="Generate synthetic CityBike data.")
+    parser.add_argument("--trips", type=int, default=defaults.n_trips)
+    parser.add_argument("--stations", type=int, default=defaults.n_stations)
+    parser.add_argument("--users", type=int, default=defaults.n_users)
+    parser.add_argument("--bikes", type=int, default=defaults.n_bikes)
+    parser.add_argument("--maintenance", type=int, default=defaults.n_maintenance)
+    parser.add_argument("--start-date", default=defaults.start_date)
+    parser.add_argument("--days", type=int, default=defaults.days)
+    parser.add_argument("--missing-rate", type=float, default=defaults.missing_rate)
+    parser.add_argument("--zero-length-rate", type=float, default=defaults.zero_length_rate)
+    parser.add_argument("--duplicate-rate", type=float, default=defaults.duplicate_rate)
+    parser.add_argument("--status-missing-rate", type=float,
+                        default=defaults.status_missing_rate)
+    parser.add_argument("--case-noise-rate", type=float, default=defaults.case_noise_rate)
+    parser.add_argument("--cost-missing-rate", type=float,
+                        default=defaults.cost_missing_rate)
+    parser.add_argument("--chunk-size", type=int, default=defaults.chunk_size)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--demand", choices=["uniform", "realistic"], default="uniform",
+                        help="uniform draws, or the skewed DemandProfile")
+    parser.add_argument("--station-zipf", type=float, default=REALISTIC_DEMAND.station_zipf)
+    parser.add_argument("--user-alpha", type=float, default=REALISTIC_DEMAND.user_alpha)
+    parser.add_argument("--seasonality", type=float,
+                        default=REALISTIC_DEMAND.seasonal_amplitude)
+    parser.add_argument("--out-dir", default=str(DATA_DIR))
+    parser.add_argument("--workers", type=int, default=1,
+                        help="processes generating trip shards in parallel")
+    parser.add_argument("--partitioned", action="store_true",
+                        help="write trips/part-*.csv plus manifest.json")
+    parser.add_argument("--shards", type=int, default=None,
+                        help="partition files (default: one per chunk)")
+    return parser
+
+
+def config_from_args(args: argparse.Namespace) -> GeneratorConfig:
+    return GeneratorConfig(
+        n_trips=args.trips,
+        n_stations=args.stations,
+        n_users=args.users,
+        n_bikes=args.bikes,
+        n_maintenance=args.maintenance,
+        start_date=args.start_date,
+        days=args.days,
+        missing_rate=args.missing_rate,
+        zero_length_rate=args.zero_length_rate,
+        duplicate_rate=args.duplicate_rate,
+        status_missing_rate=args.status_missing_rate,
+        case_noise_rate=args.case_noise_rate,
+        cost_missing_rate=args.cost_missing_rate,
+        chunk_size=args.chunk_size,
+        seed=args.seed,
+        demand=None if args.demand == "uniform" else REALISTIC_DEMAND._replace(
+            station_zipf=args.station_zipf,
+            user_alpha=args.user_alpha,
+            seasonal_amplitude=args.seasonality,
+        ),
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = build_parser().parse_args(argv)
+    config = config_from_args(args)
+    if args.partitioned:
+        manifest = write_partitioned(config, args.out_dir, args.shards, args.workers)
+        print(f"Generated in {args.out_dir}: {manifest['trips']['rows']} trips in "
+              f"{len(manifest['trips']['partitions'])} partitions (manifest.json)")
+        return
+    counts = write_dataset(config, args.out_dir, args.workers)
+    print(f"Generated in {args.out_dir}: "
+          + ", ".join(f"{name}.csv ({rows} rows)" for name, rows in counts.items()))
 
-maint_df = pd.DataFrame(records)
-maint_df.loc[np.random.choice(200, 8, replace=False), "cost"] = np.nan
-maint_df.to_csv("data/maintenance.csv", index=False)
 
-print("Generated: data/stations.csv, data/trips.csv, data/maintenance.csv")
+if __name__ == "__main__":
+    main()
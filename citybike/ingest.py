@@ -0,0 +1,480 @@
+"""
+Streaming trip ingest with live, incrementally updated analytics.
+
+The ingest service takes trip events from an asyncio.Queue, a TCP or
+Unix socket, or stdin, as JSON lines in the replay.py format. It groups
+them into micro-batches, closing a batch when it reaches a size limit
+or when its first event has waited a time limit, whichever comes first.
+Each batch is validated with the utils rule checks, one vectorized
+audit per batch. It is then folded into LiveAggregates:
+
+    station counts          start-station trip counts
+    hourly / weekday        start-time histograms
+    monthly                 trips per year-month
+    OD matrix               (start, end) station pair counts
+    users                   trips per user
+    distance by user type   sums and counts
+    duration moments        count, mean, variance (Chan merge), min, max
+
+LiveAggregates answers the trip questions of analyzer.BikeShareSystem
+with the same shapes and values. It matches running the analyzer
+on everything ingested so far after clean_data(): duplicate trip_ids
+are ignored, rows clean_data would drop are rejected, and user_type is
+lower-cased and stripped.
+
+A trip is applied when its trip_end event arrives, since only then is
+the record complete. trip_start events are counted and tracked as trips
+in progress. Records without an 'event' field are treated as complete
+trips. Event-to-visible latency is measured for every applied event. It
+runs from the event's sent_at, or its arrival when sent_at is missing,
+to the moment the batch is visible in the aggregates.
+
+Usage:
+    python replay.py data/trips.csv --speedup 0 | python ingest.py --stdin
+    python ingest.py --listen tcp://127.0.0.1:9000 --report-every 5
+    python ingest.py --replay data/trips.csv --speedup 200000   # in-process
+"""
+
+import argparse
+import asyncio
+import calendar
+import json
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from analyzer import _top_counts
+from replay import EventLog, QueueSink, load_trips, replay
+from utils import audit_frame
+
+
+# Rows failing these rules are rejected. They mirror the rows that
+# BikeShareSystem.clean_data drops: unparseable or reversed times and
+# missing duration or distance. Negative durations and distances are
+# kept, as clean_data keeps them; non-numeric ones (on which clean_data
+# would raise) are rejected.
+INGEST_RULES: list[tuple] = [
+    ("not_null", "trip_id"),
+    ("datetime", "start_time"),
+    ("datetime", "end_time"),
+    ("time_order", "start_time", "end_time"),
+    ("numeric", "duration_minutes"),
+    ("numeric", "distance_km"),
+]
+
+DEFAULT_BATCH_SIZE = 2048
+DEFAULT_MAX_DELAY_S = 0.05
+LATENCY_WINDOW = 1 << 20  # most recent latency samples kept for percentiles
+
+_DAY_NAMES = np.array(list(calendar.day_name), dtype=object)  # Monday first
+
+
+# ---------------------------------------------------------------------------
+# Live aggregates
+# ---------------------------------------------------------------------------
+
+class LiveAggregates:
+    """Incrementally maintained answers to the analyzer's trip questions.
+
+    Args:
+        stations: Station metadata (station_id, station_name) used to
+            name stations in top_start_stations / top_routes.
+    """
+
+    def __init__(self, stations: pd.DataFrame | None = None) -> None:
+        self.stations = stations if stations is not None else pd.DataFrame(
+            {"station_id": pd.Series(dtype=object), "station_name": pd.Series(dtype=object)})
+        self.seen: set = set()
+        self.n_trips = 0
+        self.distance_sum = 0.0
+        self.duration = {"count": 0, "mean": 0.0, "m2": 0.0,
+                         "min": float("inf"), "max": float("-inf")}
+        self.hours = np.zeros(24, dtype=np.int64)
+        self.weekdays = np.zeros(7, dtype=np.int64)
+        self.months: Counter = Counter()
+        self.station_counts: Counter = Counter()
+        self.routes: Counter = Counter()
+        self.users: Counter = Counter()
+        self.user_type_distance: dict[str, list[float]] = {}
+        self.rejected: Counter = Counter()
+        self.duplicates = 0
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def update(self, trips: pd.DataFrame) -> int:
+        """Fold a batch of raw trip records in; return how many were applied."""
+        if trips.empty:
+            return 0
+        ids = trips["trip_id"].tolist()
+        fresh = np.ones(len(ids), dtype=bool)
+        for i, trip_id in enumerate(ids):
+            if trip_id in self.seen:
+                fresh[i] = False
+            else:
+                self.seen.add(trip_id)
+        self.duplicates += int((~fresh).sum())
+
+        trips = trips.reset_index(drop=True)
+        bad = ~fresh
+        for report in audit_frame(trips, INGEST_RULES):
+            rows = report.rows[fresh[report.rows]]
+            if len(rows):
+                self.rejected[f"{report.column}:{report.rule}"] += int((~bad[rows]).sum())
+                bad[rows] = True
+        good = trips[~bad]
+        if good.empty:
+            return 0
+
+        start = pd.to_datetime(good["start_time"], format="ISO8601").to_numpy()
+        days = start.astype("datetime64[D]").astype(np.int64)
+        self.hours += np.bincount(
+            (start.astype("datetime64[h]").astype(np.int64) % 24), minlength=24)
+        self.weekdays += np.bincount((days + 3) % 7, minlength=7)
+        self.months.update(start.astype("datetime64[M]").astype(np.int64).tolist())
+
+        self.station_counts.update(good["start_station_id"].tolist())
+        self.routes.update(zip(good["start_station_id"].tolist(),
+                               good["end_station_id"].tolist()))
+        self.users.update(good["user_id"].tolist())
+
+        distance = pd.to_numeric(good["distance_km"]).to_numpy(dtype=np.float64)
+        self.distance_sum += float(distance.sum())
+        user_type = good["user_type"].astype(str).str.lower().str.strip()
+        sums = pd.Series(distance, index=user_type.to_numpy()).groupby(level=0).agg(
+            ["sum", "count"])
+        for label, (total, count) in sums.iterrows():
+            acc = self.user_type_distance.setdefault(label, [0.0, 0])
+            acc[0] += total
+            acc[1] += int(count)
+
+        self._merge_durations(
+            pd.to_numeric(good["duration_minutes"]).to_numpy(dtype=np.float64))
+        self.n_trips += len(good)
+        return len(good)
+
+    def _merge_durations(self, values: np.ndarray) -> None:
+        """Combine batch moments into the running ones (Chan et al.)."""
+        d = self.duration
+        n_b = len(values)
+        mean_b = float(values.mean())
+        m2_b = float(((values - mean_b) ** 2).sum())
+        n = d["count"] + n_b
+        delta = mean_b - d["mean"]
+        d["mean"] += delta * n_b / n
+        d["m2"] += m2_b + delta ** 2 * d["count"] * n_b / n
+        d["count"] = n
+        d["min"] = min(d["min"], float(values.min()))
+        d["max"] = max(d["max"], float(values.max()))
+
+    # ------------------------------------------------------------------
+    # Queries (same shapes as BikeShareSystem)
+    # ------------------------------------------------------------------
+
+    def total_trips_summary(self) -> dict:
+        return {
+            "total_trips": self.n_trips,
+            "total_distance_km": round(self.distance_sum, 2),
+            "avg_duration_min": round(self.duration["mean"], 2) if self.n_trips else np.nan,
+        }
+
+    def _station_names(self, ids: pd.Index) -> np.ndarray:
+        names = self.stations.set_index("station_id")["station_name"]
+        return ids.to_series().map(names).to_numpy()
+
+    def top_start_stations(self, n: int = 10) -> pd.DataFrame:
+        counts = _top_counts(pd.Series(self.station_counts, dtype=np.int64), n)
+        return pd.DataFrame({
+            "station_name": self._station_names(counts.index),
+            "trip_count": counts.to_numpy(),
+        })
+
+    def peak_usage_hours(self) -> pd.Series:
+        hours = np.flatnonzero(self.hours)
+        return pd.Series(self.hours[hours], name="count",
+                         index=pd.Index(hours.astype(np.int32), name="hour"))
+
+    def busiest_day_of_week(self) -> pd.Series:
+        days = np.flatnonzero(self.weekdays)
+        counts = pd.Series(self.weekdays[days], name="count",
+                           index=pd.Index(_DAY_NAMES[days], name="day", dtype="str"))
+        return counts.sort_index()
+
+    def avg_distance_by_user_type(self) -> pd.Series:
+        labels = sorted(self.user_type_distance)
+        means = [self.user_type_distance[k][0] / self.user_type_distance[k][1]
+                 for k in labels]
+        return pd.Series(means, index=pd.Index(labels, name="user_type", dtype="str"),
+                         name="distance_km").round(2)
+
+    def monthly_trip_trend(self) -> pd.Series:
+        ordinals = sorted(self.months)
+        return pd.Series(
+            [self.months[m] for m in ordinals], name="count", dtype=np.int64,
+            index=pd.PeriodIndex.from_ordinals(ordinals, freq="M").rename("year_month"),
+        )
+
+    def top_active_users(self, n: int = 15) -> pd.DataFrame:
+        counts = _top_counts(pd.Series(self.users, dtype=np.int64), n)
+        return pd.DataFrame({"user_id": counts.index.to_numpy(),
+                             "trip_count": counts.to_numpy()})
+
+    def top_routes(self, n: int = 10) -> pd.DataFrame:
+        if not self.routes:
+            return pd.DataFrame(columns=["start_station_name", "end_station_name", "trip_count"])
+        counts = _top_counts(pd.Series(self.routes, dtype=np.int64), n)
+        return pd.DataFrame({
+            "start_station_name": self._station_names(counts.index.get_level_values(0)),
+            "end_station_name": self._station_names(counts.index.get_level_values(1)),
+            "trip_count": counts.to_numpy(),
+        })
+
+    def duration_moments(self) -> dict:
+        """Count, mean, sample std, min and max of trip durations."""
+        d = self.duration
+        if not d["count"]:
+            return {"count": 0, "mean": np.nan, "std": np.nan, "min": np.nan, "max": np.nan}
+        std = (d["m2"] / (d["count"] - 1)) ** 0.5 if d["count"] > 1 else np.nan
+        return {"count": d["count"], "mean": d["mean"], "std": std,
+                "min": d["min"], "max": d["max"]}
+
+
+# ---------------------------------------------------------------------------
+# Latency
+# ---------------------------------------------------------------------------
+
+class LatencyRecorder:
+    """Event-to-visible latencies over a sliding window of samples."""
+
+    def __init__(self, window: int = LATENCY_WINDOW) -> None:
+        self.samples = np.zeros(window)
+        self.count = 0
+
+    def record(self, latencies_s: np.ndarray) -> None:
+        window = len(self.samples)
+        first = self.count + max(0, len(latencies_s) - window)
+        latencies_s = latencies_s[-window:]
+        self.samples[np.arange(first, first + len(latencies_s)) % window] = latencies_s
+        self.count = first + len(latencies_s)
+
+    def percentiles(self) -> dict[str, float] | None:
+        if not self.count:
+            return None
+        ms = self.samples[:min(self.count, len(self.samples))] * 1000
+        p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+        return {"p50": round(float(p50), 3), "p95": round(float(p95), 3),
+                "p99": round(float(p99), 3), "max": round(float(ms.max()), 3)}
+
+
+# ---------------------------------------------------------------------------
+# Ingest service
+# ---------------------------------------------------------------------------
+
+class IngestService:
+    """Micro-batching consumer that keeps LiveAggregates current.
+
+    Events are put on ``self.queue`` (directly, with feed_lines or
+    serve). ``run()`` drains the queue until it receives None.
+
+    Args:
+        aggregates: Aggregates to update (a fresh LiveAggregates if None).
+        batch_size: Apply a batch once it holds this many events.
+        max_delay: ...or once its first event has waited this many seconds.
+        queue_size: Bound of the inbound queue (back-pressure on sources).
+    """
+
+    def __init__(
+        self,
+        aggregates: LiveAggregates | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_delay: float = DEFAULT_MAX_DELAY_S,
+        queue_size: int = 1 << 16,
+    ) -> None:
+        if batch_size < 1 or max_delay < 0:
+            raise ValueError("batch_size must be >= 1 and max_delay >= 0")
+        self.aggregates = aggregates if aggregates is not None else LiveAggregates()
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.latency = LatencyRecorder()
+        self.in_progress: set = set()
+        self.counts = Counter()
+        self._started: float | None = None
+
+    async def run(self) -> dict:
+        """Consume the queue until None; return the final stats()."""
+        loop = asyncio.get_running_loop()
+        self._started = time.time()
+        done = False
+        while not done:
+            event = await self.queue.get()
+            if event is None:
+                break
+            batch, arrived = [event], [time.time()]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.batch_size:
+                try:
+                    event = self.queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        event = await asyncio.wait_for(self.queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                if event is None:
+                    done = True
+                    break
+                batch.append(event)
+                arrived.append(time.time())
+            self.apply(batch, arrived)
+        return self.stats()
+
+    def apply(self, batch: list[dict], arrived: list[float] | None = None) -> None:
+        """Apply one micro-batch and record its events' latency."""
+        complete = []
+        for event in batch:
+            kind = event.get("event")
+            if kind == "trip_start":
+                self.in_progress.add(event.get("trip_id"))
+            else:
+                self.in_progress.discard(event.get("trip_id"))
+                complete.append(event)
+        self.counts["events"] += len(batch)
+        self.counts["trip_starts"] += len(batch) - len(complete)
+        self.counts["trip_ends"] += len(complete)
+        self.counts["batches"] += 1
+        if complete:
+            frame = pd.DataFrame.from_records(complete)
+            frame = frame.drop(columns=["event", "time", "seq", "sent_at"], errors="ignore")
+            self.counts["applied"] += self.aggregates.update(frame)
+
+        visible = time.time()
+        if arrived is None:
+            arrived = [visible] * len(batch)
+        sent = np.array([e.get("sent_at", a) for e, a in zip(batch, arrived)], dtype=float)
+        self.latency.record(visible - sent)
+
+    def stats(self) -> dict:
+        elapsed = time.time() - self._started if self._started else 0.0
+        events = self.counts["events"]
+        return {
+            "events": events,
+            "trip_starts": self.counts["trip_starts"],
+            "trip_ends": self.counts["trip_ends"],
+            "applied": self.counts["applied"],
+            "duplicates": self.aggregates.duplicates,
+            "rejected": dict(self.aggregates.rejected),
+            "in_progress": len(self.in_progress),
+            "batches": self.counts["batches"],
+            "mean_batch": round(events / self.counts["batches"], 1) if events else 0,
+            "rate_eps": round(events / elapsed, 1) if elapsed > 0 else None,
+            "latency_ms": self.latency.percentiles(),
+        }
+
+    # ------------------------------------------------------------------
+    # Sources
+    # ------------------------------------------------------------------
+
+    async def feed_lines(self, reader: asyncio.StreamReader) -> int:
+        """Queue JSON-line events from *reader* until EOF; return the count.
+
+        Blank or malformed lines are counted under 'bad_lines' and skipped.
+        """
+        n = 0
+        while line := await reader.readline():
+            try:
+                event = json.loads(line)
+            except ValueError:
+                self.counts["bad_lines"] += 1
+                continue
+            await self.queue.put(event)
+            n += 1
+        return n
+
+    async def serve(self, spec: str) -> asyncio.AbstractServer:
+        """Accept JSON-line connections on 'tcp://HOST:PORT' or 'unix://PATH'."""
+        async def handle(reader, writer):
+            await self.feed_lines(reader)
+            writer.close()
+
+        if spec.startswith("tcp://"):
+            host, _, port = spec[len("tcp://"):].rpartition(":")
+            return await asyncio.start_server(handle, host or "127.0.0.1", int(port))
+        if spec.startswith("unix://"):
+            return await asyncio.start_unix_server(handle, spec[len("unix://"):])
+        raise ValueError(f"Unsupported listen address {spec!r}")
+
+    async def feed_stdin(self) -> int:
+        """Queue events from stdin (JSON lines) and then the end marker."""
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader(limit=1 << 20)
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+        n = await self.feed_lines(reader)
+        await self.queue.put(None)
+        return n
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+async def _report_periodically(service: IngestService, every: float) -> None:
+    while True:
+        await asyncio.sleep(every)
+        print(json.dumps(service.stats()), flush=True)
+
+
+async def _main(args: argparse.Namespace) -> dict:
+    stations = pd.read_csv(args.stations) if Path(args.stations).exists() else None
+    service = IngestService(LiveAggregates(stations), args.batch_size, args.max_delay)
+    consumer = asyncio.create_task(service.run())
+    reporter = (asyncio.create_task(_report_periodically(service, args.report_every))
+                if args.report_every else None)
+
+    if args.replay:
+        events = EventLog.from_trips(load_trips(args.replay))
+        print(json.dumps({"replay": await replay(
+            events, QueueSink(service.queue), args.speedup, args.limit)}))
+    elif args.listen:
+        server = await service.serve(args.listen)
+        async with server:
+            await server.serve_forever()
+    else:
+        await service.feed_stdin()
+
+    stats = await consumer
+    if reporter is not None:
+        reporter.cancel()
+    print(json.dumps(stats))
+    print(json.dumps(service.aggregates.total_trips_summary()))
+    return stats
+
+
+def main(argv: list[str] | None = None) -> dict:
+    parser = argparse.ArgumentParser(description="Ingest trip events into live aggregates.")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--stdin", action="store_true", help="read JSON lines from stdin")
+    source.add_argument("--listen", default=None, help="tcp://HOST:PORT or unix://PATH")
+    source.add_argument("--replay", default=None,
+                        help="replay a trips CSV in-process (load test)")
+    parser.add_argument("--speedup", type=float, default=0.0, help="with --replay")
+    parser.add_argument("--limit", type=int, default=None, help="with --replay")
+    parser.add_argument("--stations", default=str(Path(__file__).resolve().parent
+                                                  / "data" / "stations.csv"))
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--max-delay", type=float, default=DEFAULT_MAX_DELAY_S,
+                        help="seconds an event may wait for its batch to fill")
+    parser.add_argument("--report-every", type=float, default=0,
+                        help="print stats every N seconds (0 = only at the end)")
+    return asyncio.run(_main(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
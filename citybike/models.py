@@ -34,11 +34,16 @@ class Entity(ABC):
     """
 
     def __init__(self, id: str, created_at: datetime | None = None) -> None:
-        if not id or not isinstance(id, str):
-            raise ValueError("id must be a non-empty string")
+        Entity._validate(id)
         self._id = id
         self._created_at = created_at or datetime.now()
 
+    @staticmethod
+    def _validate(id: str) -> None:
+        """Constructor checks, shared with compact_models."""
+        if not id or not isinstance(id, str):
+            raise ValueError("id must be a non-empty string")
+
     @property
     def id(self) -> str:
         """Return the entity's unique identifier."""
@@ -46,9 +51,25 @@ class Entity(ABC):
 
     @property
     def created_at(self) -> datetime:
-        """Return the creation timestamp."""
+        """Return the creation timestamp, stamping it on first access if unset."""
+        if self._created_at is None:
+            self._created_at = datetime.now()
         return self._created_at
 
+    @classmethod
+    def _new_trusted(cls, id: str, created_at: datetime | None = None):
+        """Allocate an instance with id/created_at set and no validation.
+
+        Backs the `from_trusted` constructors of the subclasses, which are
+        meant for data whose columns were already validated in bulk.
+        Without an explicit *created_at* the timestamp is taken lazily on
+        first read, so bulk loads do not call the clock per object.
+        """
+        obj = cls.__new__(cls)
+        obj._id = id
+        obj._created_at = created_at
+        return obj
+
     @abstractmethod
     def __str__(self) -> str:
         """Return a user-friendly string representation."""
@@ -81,12 +102,17 @@ class Bike(Entity):
         status: str = "available",
     ) -> None:
         super().__init__(id=bike_id)
+        Bike._validate(bike_type, status)
+        self._bike_type = bike_type
+        self._status = status
+
+    @staticmethod
+    def _validate(bike_type: str, status: str) -> None:
+        """Constructor checks, shared with compact_models."""
         if bike_type not in ("classic", "electric"):
             raise ValueError(f"Invalid bike_type: {bike_type}")
-        if status not in self.VALID_STATUSES:
+        if status not in Bike.VALID_STATUSES:
             raise ValueError(f"Invalid status: {status}")
-        self._bike_type = bike_type
-        self._status = status
 
     @property
     def bike_type(self) -> str:
@@ -102,6 +128,20 @@ class Bike(Entity):
             raise ValueError(f"Invalid status: {value}")
         self._status = value
 
+    @classmethod
+    def from_trusted(
+        cls,
+        bike_id: str,
+        bike_type: str,
+        status: str = "available",
+        created_at: datetime | None = None,
+    ) -> "Bike":
+        """Build a Bike from pre-validated values, skipping the checks."""
+        obj = cls._new_trusted(bike_id, created_at)
+        obj._bike_type = bike_type
+        obj._status = status
+        return obj
+
     def __str__(self) -> str:
         return f"Bike({self.id}, {self.bike_type}, {self.status})"
 
@@ -126,14 +166,34 @@ class ClassicBike(Bike):
         status: str = "available",
     ) -> None:
         super().__init__(bike_id=bike_id, bike_type="classic", status=status)
+        ClassicBike._validate(gear_count)
+        self._gear_count = gear_count
+
+    @staticmethod
+    def _validate(gear_count: int) -> None:
+        """Constructor checks, shared with compact_models."""
         if gear_count <= 0:
             raise ValueError("gear_count must be positive")
-        self._gear_count = gear_count
 
     @property
     def gear_count(self) -> int:
         return self._gear_count
 
+    @classmethod
+    def from_trusted(
+        cls,
+        bike_id: str,
+        gear_count: int = 7,
+        status: str = "available",
+        created_at: datetime | None = None,
+    ) -> "ClassicBike":
+        """Build a ClassicBike from pre-validated values, skipping the checks."""
+        obj = cls._new_trusted(bike_id, created_at)
+        obj._bike_type = "classic"
+        obj._status = status
+        obj._gear_count = gear_count
+        return obj
+
     def __str__(self) -> str:
         return f"ClassicBike({self.id}, gears={self.gear_count})"
 
@@ -162,15 +222,20 @@ class ElectricBike(Bike):
     ) -> None:
         super().__init__(bike_id=bike_id, bike_type="electric", status=status)
         # TODO: validate battery_level (0-100) and max_range_km (>0)
+        ElectricBike._validate(battery_level, max_range_km)
+
+        self._battery_level = battery_level
+        self._max_range_km = max_range_km
+        # TODO: store as private attributes with @property access
+
+    @staticmethod
+    def _validate(battery_level: float, max_range_km: float) -> None:
+        """Constructor checks, shared with compact_models."""
         if not (0 <= battery_level <= 100):
             raise ValueError("battery_level must be between 0 and 100")
-
         if max_range_km <= 0:
             raise ValueError("max_range_km must be positive")
 
-        self._battery_level = battery_level
-        self._max_range_km = max_range_km
-        # TODO: store as private attributes with @property access
     @property
     def battery_level(self) -> float:
         return self._battery_level
@@ -181,6 +246,23 @@ class ElectricBike(Bike):
 
         pass
 
+    @classmethod
+    def from_trusted(
+        cls,
+        bike_id: str,
+        battery_level: float = 100.0,
+        max_range_km: float = 50.0,
+        status: str = "available",
+        created_at: datetime | None = None,
+    ) -> "ElectricBike":
+        """Build an ElectricBike from pre-validated values, skipping the checks."""
+        obj = cls._new_trusted(bike_id, created_at)
+        obj._bike_type = "electric"
+        obj._status = status
+        obj._battery_level = battery_level
+        obj._max_range_km = max_range_km
+        return obj
+
     def __str__(self) -> str:
         # TODO: return a user-friendly string
         # return f"ElectricBike({self.id})"
@@ -219,20 +301,40 @@ class Station(Entity):
     ) -> None:
         super().__init__(id=station_id)
         # TODO: validate and store attributes
-        
+        Station._validate(capacity, latitude, longitude)
+        self._name = name
+        self._capacity = capacity
+        self._latitude = latitude
+        self._longitude = longitude
+        pass
+
+    @staticmethod
+    def _validate(capacity: int, latitude: float, longitude: float) -> None:
+        """Constructor checks, shared with compact_models."""
         if capacity <= 0:
             raise ValueError("capacity must be positive")
-
         if not (-90 <= latitude <= 90):
             raise ValueError("latitude must be between -90 and 90")
-
         if not (-180 <= longitude <= 180):
             raise ValueError("longitude must be between -180 and 180")
-        self._name = name
-        self._capacity = capacity
-        self._latitude = latitude
-        self._longitude = longitude
-        pass
+
+    @classmethod
+    def from_trusted(
+        cls,
+        station_id: str,
+        name: str,
+        capacity: int,
+        latitude: float,
+        longitude: float,
+        created_at: datetime | None = None,
+    ) -> "Station":
+        """Build a Station from pre-validated values, skipping the checks."""
+        obj = cls._new_trusted(station_id, created_at)
+        obj._name = name
+        obj._capacity = capacity
+        obj._latitude = latitude
+        obj._longitude = longitude
+        return obj
 
     def __str__(self) -> str:
         # TODO
@@ -265,8 +367,7 @@ class User(Entity):
     ) -> None:
         super().__init__(id=user_id)
         # TODO: validate and store attributes
-        if "@" not in email:
-            raise ValueError("Invalid email")
+        User._validate(email)
 
         self._name = name
         self._email = email
@@ -274,6 +375,28 @@ class User(Entity):
 
         pass
 
+    @staticmethod
+    def _validate(email: str) -> None:
+        """Constructor checks, shared with compact_models."""
+        if "@" not in email:
+            raise ValueError("Invalid email")
+
+    @classmethod
+    def from_trusted(
+        cls,
+        user_id: str,
+        name: str,
+        email: str,
+        user_type: str,
+        created_at: datetime | None = None,
+    ) -> "User":
+        """Build a User from pre-validated values, skipping the checks."""
+        obj = cls._new_trusted(user_id, created_at)
+        obj._name = name
+        obj._email = email
+        obj._user_type = user_type
+        return obj
+
     def __str__(self) -> str:
         # TODO
         return f"User({self.id})"
@@ -300,12 +423,34 @@ class CasualUser(User):
     ) -> None:
         super().__init__(user_id=user_id, name=name, email=email, user_type="casual")
         # TODO: validate and store day_pass_count
-        if day_pass_count < 0:
-            raise ValueError("day_pass_count must be >= 0")
+        CasualUser._validate(day_pass_count)
 
         self._day_pass_count = day_pass_count
         pass
 
+    @staticmethod
+    def _validate(day_pass_count: int) -> None:
+        """Constructor checks, shared with compact_models."""
+        if day_pass_count < 0:
+            raise ValueError("day_pass_count must be >= 0")
+
+    @classmethod
+    def from_trusted(
+        cls,
+        user_id: str,
+        name: str,
+        email: str,
+        day_pass_count: int = 0,
+        created_at: datetime | None = None,
+    ) -> "CasualUser":
+        """Build a CasualUser from pre-validated values, skipping the checks."""
+        obj = cls._new_trusted(user_id, created_at)
+        obj._name = name
+        obj._email = email
+        obj._user_type = "casual"
+        obj._day_pass_count = day_pass_count
+        return obj
+
     def __str__(self) -> str:
         # TODO
         return f"CasualUser({self.id})"
@@ -336,18 +481,43 @@ class MemberUser(User):
     ) -> None:
         super().__init__(user_id=user_id, name=name, email=email, user_type="member")
         # TODO: validate and store attributes
-        if membership_end <= membership_start:
-            raise ValueError("membership_end must be after start")
+        MemberUser._validate(membership_start, membership_end, tier)
 
-        if tier not in ("basic", "premium"):
-            raise ValueError("tier must be basic or premium")
-        
         self._membership_start = membership_start
         self._membership_end = membership_end
         self._tier = tier
 
         pass
 
+    @staticmethod
+    def _validate(membership_start: datetime, membership_end: datetime, tier: str) -> None:
+        """Constructor checks, shared with compact_models."""
+        if membership_end <= membership_start:
+            raise ValueError("membership_end must be after start")
+        if tier not in ("basic", "premium"):
+            raise ValueError("tier must be basic or premium")
+
+    @classmethod
+    def from_trusted(
+        cls,
+        user_id: str,
+        name: str,
+        email: str,
+        membership_start: datetime = None,
+        membership_end: datetime = None,
+        tier: str = "basic",
+        created_at: datetime | None = None,
+    ) -> "MemberUser":
+        """Build a MemberUser from pre-validated values, skipping the checks."""
+        obj = cls._new_trusted(user_id, created_at)
+        obj._name = name
+        obj._email = email
+        obj._user_type = "member"
+        obj._membership_start = membership_start
+        obj._membership_end = membership_end
+        obj._tier = tier
+        return obj
+
     def __str__(self) -> str:
         # TODO
         return f"MemberUser({self.id})"
@@ -384,11 +554,7 @@ class Trip:
         distance_km: float,
     ) -> None:
         # TODO: validate and store attributes
-        if distance_km < 0:
-            raise ValueError("distance must be >= 0")
-
-        if end_time < start_time:
-            raise ValueError("end_time must be after start_time")
+        Trip._validate(start_time, end_time, distance_km)
 
         self.trip_id = trip_id
         self.user = user
@@ -400,6 +566,14 @@ class Trip:
         self.distance_km = distance_km
         pass
 
+    @staticmethod
+    def _validate(start_time: datetime, end_time: datetime, distance_km: float) -> None:
+        """Constructor checks, shared with compact_models."""
+        if distance_km < 0:
+            raise ValueError("distance must be >= 0")
+        if end_time < start_time:
+            raise ValueError("end_time must be after start_time")
+
     @property
     def duration_minutes(self) -> float:
         """Calculate trip duration in minutes from start and end times."""
@@ -408,6 +582,30 @@ class Trip:
         return delta.total_seconds() / 60
         
 
+    @classmethod
+    def from_trusted(
+        cls,
+        trip_id: str,
+        user: User,
+        bike: Bike,
+        start_station: Station,
+        end_station: Station,
+        start_time: datetime,
+        end_time: datetime,
+        distance_km: float,
+    ) -> "Trip":
+        """Build a Trip from pre-validated values, skipping the checks."""
+        obj = cls.__new__(cls)
+        obj.trip_id = trip_id
+        obj.user = user
+        obj.bike = bike
+        obj.start_station = start_station
+        obj.end_station = end_station
+        obj.start_time = start_time
+        obj.end_time = end_time
+        obj.distance_km = distance_km
+        return obj
+
     def __str__(self) -> str:
         # TODO
         return f"Trip({self.trip_id})"
@@ -448,9 +646,8 @@ class MaintenanceRecord:
         description: str = "",
     ) -> None:
         # TODO: validate and store attributes
-        if maintenance_type not in self.VALID_TYPES:
-            raise ValueError("Invalid maintenance type")
-        
+        MaintenanceRecord._validate(maintenance_type, cost)
+
         self.record_id = record_id
         self.bike = bike
         self.date = date
@@ -458,10 +655,35 @@ class MaintenanceRecord:
         self.cost = cost
         self.description = description
 
+        pass
+
+    @staticmethod
+    def _validate(maintenance_type: str, cost: float) -> None:
+        """Constructor checks, shared with compact_models."""
+        if maintenance_type not in MaintenanceRecord.VALID_TYPES:
+            raise ValueError("Invalid maintenance type")
         if cost < 0:
             raise ValueError("cost must be >= 0")
 
-        pass
+    @classmethod
+    def from_trusted(
+        cls,
+        record_id: str,
+        bike: Bike,
+        date: datetime,
+        maintenance_type: str,
+        cost: float,
+        description: str = "",
+    ) -> "MaintenanceRecord":
+        """Build a MaintenanceRecord from pre-validated values, skipping the checks."""
+        obj = cls.__new__(cls)
+        obj.record_id = record_id
+        obj.bike = bike
+        obj.date = date
+        obj.maintenance_type = maintenance_type
+        obj.cost = cost
+        obj.description = description
+        return obj
 
     def __str__(self) -> str:
         # TODO
@@ -7,10 +7,22 @@ Students should:
     - Complete MemberPricing
     - Implement PeakHourPricing
     - Optionally add more strategies
+
+Also provides `CompiledTariff`, which flattens the strategies into NumPy
+lookup tables so a whole trips table can be priced without per-row
+Python calls.
 """
 
+import math
 from abc import ABC, abstractmethod
 
+import numpy as np
+import pandas as pd
+
+
+HOURS_PER_DAY = 24
+DAYS_PER_WEEK = 7
+
 
 # ---------------------------------------------------------------------------
 # Strategy interface
@@ -95,14 +107,186 @@ class PeakHourPricing(PricingStrategy):
     """
 
     MULTIPLIER = 1.5
+    BASE_STRATEGY = CasualPricing
+    PEAK_HOURS = frozenset({7, 8, 9, 16, 17, 18})
+    PEAK_WEEKDAYS = frozenset({0, 1, 2, 3, 4})  # Monday–Friday
 
     def calculate_cost(
         self, duration_minutes: float, distance_km: float
     ) -> float:
         # TODO: implement peak-hour pricing
         
-        base_cost = CasualPricing().calculate_cost(
+        base_cost = self.BASE_STRATEGY().calculate_cost(
         duration_minutes, distance_km)
 
         return base_cost * self.MULTIPLIER
         # raise NotImplementedError("PeakHourPricing.calculate_cost")
+
+
+# ---------------------------------------------------------------------------
+# Compiled tariff — vectorized pricing for whole trip tables
+# ---------------------------------------------------------------------------
+
+def linear_rates(strategy: PricingStrategy) -> tuple[float, float, float]:
+    """Recover (unlock_fee, per_minute, per_km) from an affine strategy.
+
+    The strategy is probed at a few points; every strategy in this module
+    is affine in duration and distance, so three probes determine it and a
+    fourth confirms it.
+
+    Raises:
+        ValueError: If the strategy is not affine in its two arguments.
+    """
+    unlock = strategy.calculate_cost(0.0, 0.0)
+    per_minute = strategy.calculate_cost(1.0, 0.0) - unlock
+    per_km = strategy.calculate_cost(0.0, 1.0) - unlock
+    probe = strategy.calculate_cost(37.0, 11.0)
+    if not math.isclose(probe, unlock + 37.0 * per_minute + 11.0 * per_km,
+                        rel_tol=1e-9, abs_tol=1e-9):
+        raise ValueError(
+            f"{type(strategy).__name__} is not linear and cannot be compiled"
+        )
+    return unlock, per_minute, per_km
+
+
+class CompiledTariff:
+    """Pricing strategies compiled into a (user_type, hour, weekday) table.
+
+    Each cell of the table holds the affine rates (unlock fee, per-minute,
+    per-km) of the strategy that applies to that slot. Pricing N trips is
+    then a single gather of N rate rows followed by a fused multiply-add.
+
+    Attributes:
+        user_types: Tuple of user-type labels; position is the type code.
+        rates: Array of shape (len(user_types) * 24 * 7, 3).
+    """
+
+    def __init__(self, user_types: tuple[str, ...], rates: np.ndarray) -> None:
+        expected = (len(user_types) * HOURS_PER_DAY * DAYS_PER_WEEK, 3)
+        if rates.shape != expected:
+            raise ValueError(f"rates must have shape {expected}, got {rates.shape}")
+        self._user_types = tuple(user_types)
+        self._rates = np.ascontiguousarray(rates, dtype=np.float64)
+        self._rates.flags.writeable = False
+
+    @classmethod
+    def from_strategies(
+        cls,
+        strategies: dict[str, PricingStrategy] | None = None,
+        peak: PricingStrategy | None = None,
+        peak_user_types: tuple[str, ...] = ("casual",),
+        peak_hours: frozenset[int] | None = None,
+        peak_weekdays: frozenset[int] | None = None,
+    ) -> "CompiledTariff":
+        """Build the lookup table from configured strategies.
+
+        Args:
+            strategies: Base strategy per user type. Defaults to
+                casual → CasualPricing, member → MemberPricing.
+            peak: Strategy used instead of the base one during peak slots.
+                Defaults to PeakHourPricing.
+            peak_user_types: User types the peak strategy applies to.
+            peak_hours: Hours (0–23) considered peak. Defaults to the
+                peak strategy's PEAK_HOURS.
+            peak_weekdays: Weekdays (Monday=0) considered peak. Defaults to
+                the peak strategy's PEAK_WEEKDAYS.
+        """
+        if strategies is None:
+            strategies = {"casual": CasualPricing(), "member": MemberPricing()}
+        if peak is None:
+            peak = PeakHourPricing()
+        if peak_hours is None:
+            peak_hours = getattr(peak, "PEAK_HOURS", PeakHourPricing.PEAK_HOURS)
+        if peak_weekdays is None:
+            peak_weekdays = getattr(
+                peak, "PEAK_WEEKDAYS", PeakHourPricing.PEAK_WEEKDAYS
+            )
+
+        user_types = tuple(strategies)
+        table = np.empty((len(user_types), HOURS_PER_DAY, DAYS_PER_WEEK, 3))
+        is_peak = np.zeros((HOURS_PER_DAY, DAYS_PER_WEEK), dtype=bool)
+        is_peak[np.ix_(sorted(peak_hours), sorted(peak_weekdays))] = True
+        peak_rates = linear_rates(peak)
+
+        for code, user_type in enumerate(user_types):
+            table[code] = linear_rates(strategies[user_type])
+            if user_type in peak_user_types:
+                table[code][is_peak] = peak_rates
+
+        return cls(user_types, table.reshape(-1, 3))
+
+    @property
+    def user_types(self) -> tuple[str, ...]:
+        return self._user_types
+
+    @property
+    def rates(self) -> np.ndarray:
+        return self._rates
+
+    def encode_user_types(self, user_types) -> np.ndarray:
+        """Map user-type labels to integer codes.
+
+        Raises:
+            ValueError: If any label is not part of this tariff.
+        """
+        codes = pd.Index(self._user_types).get_indexer(user_types)
+        if (codes < 0).any():
+            bad = np.flatnonzero(codes < 0)[:5]
+            raise ValueError(f"Unknown user_type at rows {bad.tolist()}")
+        return codes.astype(np.intp)
+
+    def slot_index(
+        self, user_codes: np.ndarray, hours: np.ndarray, weekdays: np.ndarray
+    ) -> np.ndarray:
+        """Flatten (user_code, hour, weekday) triples into table row indices."""
+        return (
+            np.asarray(user_codes, dtype=np.intp) * HOURS_PER_DAY
+            + np.asarray(hours, dtype=np.intp)
+        ) * DAYS_PER_WEEK + np.asarray(weekdays, dtype=np.intp)
+
+    def price(
+        self,
+        user_codes: np.ndarray,
+        hours: np.ndarray,
+        weekdays: np.ndarray,
+        durations: np.ndarray,
+        distances: np.ndarray,
+    ) -> np.ndarray:
+        """Price many trips at once.
+
+        Args:
+            user_codes: Integer user-type codes (see `encode_user_types`).
+            hours: Start hour of each trip (0–23).
+            weekdays: Start weekday of each trip (Monday=0).
+            durations: Trip durations in minutes.
+            distances: Trip distances in km.
+
+        Returns:
+            1-D array of fares in euros.
+
+        Complexity:
+            Time  — O(n)
+            Space — O(n)
+        """
+        rows = self._rates[self.slot_index(user_codes, hours, weekdays)]
+        fares = rows[:, 1] * durations
+        fares += rows[:, 2] * distances
+        fares += rows[:, 0]
+        return fares
+
+    def price_trips(self, trips: pd.DataFrame) -> np.ndarray:
+        """Price every row of a trips DataFrame.
+
+        Uses the 'user_type', 'start_time', 'duration_minutes' and
+        'distance_km' columns.
+        """
+        start = trips["start_time"]
+        if not pd.api.types.is_datetime64_any_dtype(start):
+            start = pd.to_datetime(start)
+        return self.price(
+            self.encode_user_types(trips["user_type"]),
+            start.dt.hour.to_numpy(),
+            start.dt.weekday.to_numpy(),
+            trips["duration_minutes"].to_numpy(dtype=np.float64),
+            trips["distance_km"].to_numpy(dtype=np.float64),
+        )
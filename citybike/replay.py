@@ -0,0 +1,389 @@
+"""
+Trip event replay for load-testing streaming consumers.
+
+A trips table is turned into trip_start and trip_end events in timestamp
+order and replayed in scaled real time. With a speedup of 1000, one hour
+of trips is emitted in 3.6 seconds; a speedup of 0 emits as fast as the
+sink accepts. Events go to a sink:
+
+    QueueSink     an asyncio.Queue in the same process
+    FileSink      JSON lines on a pipe (stdout) or file
+    StreamSink    JSON lines over a TCP or Unix socket
+    NullSink      discarded (measures the replay itself)
+
+After the run, replay reports the achieved event rate and the lag, i.e.
+how late each event was emitted relative to its schedule.
+
+Each event carries the raw trip record, unvalidated and as read from
+trips.csv, plus:
+
+    event       'trip_start' or 'trip_end'
+    time        event timestamp, 'YYYY-MM-DD HH:MM:SS'
+    seq         position in the replay
+    sent_at     wall-clock time.time() at emission (for end-to-end latency)
+
+At equal timestamps, trip_end sorts before trip_start. A bike that is
+docked and taken out again in the same second is therefore seen in that
+order. The exception is a zero-length trip, whose own end follows its
+start. Trips without a parseable start_time are skipped; trips without a
+parseable end_time only produce a trip_start.
+
+Usage:
+    python replay.py data/trips.csv --speedup 1000 --sink stdout | consumer
+    python replay.py data/trips.csv --speedup 0 --sink tcp://127.0.0.1:9000
+    python replay.py --generate 1000000 --demand realistic --sink null
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Protocol, TextIO
+
+import numpy as np
+import pandas as pd
+
+from algorithms import radix_sort
+from generate_data import REALISTIC_DEMAND, GeneratorConfig, generate_tables
+from utils import DATETIME_FORMAT
+
+
+EVENT_KINDS = ("trip_end", "trip_start")  # sort order at equal timestamps
+
+# Sleeps shorter than this are skipped (asyncio timers are ~1 ms coarse);
+# the event is emitted slightly early instead.
+MIN_SLEEP_S = 0.001
+# Yield to the event loop at least this often so consumers in the same
+# loop keep up even when the sink never blocks.
+YIELD_EVERY = 256
+
+
+# ---------------------------------------------------------------------------
+# Event log
+# ---------------------------------------------------------------------------
+
+def _epoch_seconds(column: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """(int64 epoch seconds, valid mask) for a raw timestamp column."""
+    parsed = pd.to_datetime(column, errors="coerce", format="ISO8601")
+    valid = parsed.notna().to_numpy()
+    seconds = np.zeros(len(column), dtype=np.int64)
+    seconds[valid] = parsed[valid].to_numpy().astype("datetime64[s]").astype(np.int64)
+    return seconds, valid
+
+
+def _plain(column: pd.Series) -> list:
+    """Column values as JSON-ready Python objects (NaN -> None)."""
+    if pd.api.types.is_datetime64_any_dtype(column):
+        column = column.dt.strftime(DATETIME_FORMAT)
+    values = column.astype(object)
+    return values.where(column.notna(), None).tolist()
+
+
+class EventLog:
+    """Trip start / end events of a trips table, sorted by timestamp.
+
+    Only three arrays are stored per event: epoch seconds, trip row and
+    kind. The event dicts are built on demand from per-column lists of
+    the trip records.
+    """
+
+    def __init__(self, epochs: np.ndarray, rows: np.ndarray, kinds: np.ndarray,
+                 records: dict[str, list]) -> None:
+        self.epochs = epochs
+        self.rows = rows
+        self.kinds = kinds
+        self.records = records
+        self.skipped = 0
+
+    @classmethod
+    def from_trips(cls, trips: pd.DataFrame) -> "EventLog":
+        """Build the event log of a raw (or cleaned) trips DataFrame."""
+        missing = [c for c in ("start_time", "end_time") if c not in trips.columns]
+        if missing:
+            raise ValueError(f"Missing columns: {missing}")
+        start, has_start = _epoch_seconds(trips["start_time"])
+        end, has_end = _epoch_seconds(trips["end_time"])
+        has_end = has_end & has_start
+
+        rows = np.arange(len(trips))
+        epochs = np.concatenate([start[has_start], end[has_end]])
+        kinds = np.concatenate([
+            np.ones(int(has_start.sum()), dtype=np.int8),
+            np.zeros(int(has_end.sum()), dtype=np.int8),
+        ])
+        # Sort rank within a second: ends (0), starts (1), zero-length ends (2).
+        rank = kinds.astype(np.int64)
+        rank[len(rank) - int(has_end.sum()):] = 2 * (end == start)[has_end]
+        order = radix_sort(epochs * 3 + rank)
+        log = cls(
+            epochs[order],
+            np.concatenate([rows[has_start], rows[has_end]])[order],
+            kinds[order],
+            {column: _plain(trips[column]) for column in trips.columns},
+        )
+        log.skipped = int((~has_start).sum())
+        return log
+
+    def __len__(self) -> int:
+        return len(self.epochs)
+
+    def event(self, i: int) -> dict[str, Any]:
+        """The *i*-th event as a JSON-ready dict (without seq / sent_at)."""
+        row = int(self.rows[i])
+        event = {
+            "event": EVENT_KINDS[self.kinds[i]],
+            "time": time.strftime(DATETIME_FORMAT, time.gmtime(int(self.epochs[i]))),
+        }
+        for column, values in self.records.items():
+            event[column] = values[row]
+        return event
+
+    @property
+    def span_s(self) -> float:
+        """Seconds of event time between the first and last event."""
+        return float(self.epochs[-1] - self.epochs[0]) if len(self) else 0.0
+
+
+def load_trips(source: str | Path) -> pd.DataFrame:
+    """Read raw trips from a CSV file or a write_partitioned directory."""
+    path = Path(source)
+    if path.is_dir():
+        manifest = json.loads((path / "manifest.json").read_text())
+        return pd.concat(
+            [pd.read_csv(path / part["file"]) for part in manifest["trips"]["partitions"]],
+            ignore_index=True,
+        )
+    return pd.read_csv(path)
+
+
+# ---------------------------------------------------------------------------
+# Sinks
+# ---------------------------------------------------------------------------
+
+class Sink(Protocol):
+    async def send(self, event: dict) -> None: ...
+    async def close(self) -> None: ...
+
+
+def encode(event: dict) -> bytes:
+    """One JSON line (the wire format of FileSink and StreamSink)."""
+    return (json.dumps(event, separators=(",", ":")) + "\n").encode()
+
+
+class QueueSink:
+    """Put events on an asyncio.Queue; None is put on close as end marker.
+
+    A bounded queue applies back-pressure: a slow consumer shows up as
+    replay lag.
+    """
+
+    def __init__(self, queue: asyncio.Queue) -> None:
+        self.queue = queue
+
+    async def send(self, event: dict) -> None:
+        await self.queue.put(event)
+
+    async def close(self) -> None:
+        await self.queue.put(None)
+
+
+class FileSink:
+    """Write JSON lines to a text stream such as sys.stdout or a pipe."""
+
+    def __init__(self, stream: TextIO, close_stream: bool = False) -> None:
+        self.stream = stream
+        self.close_stream = close_stream
+
+    async def send(self, event: dict) -> None:
+        self.stream.write(json.dumps(event, separators=(",", ":")) + "\n")
+
+    async def close(self) -> None:
+        self.stream.flush()
+        if self.close_stream:
+            self.stream.close()
+
+
+class StreamSink:
+    """Write JSON lines to an asyncio StreamWriter (TCP or Unix socket)."""
+
+    def __init__(self, writer: asyncio.StreamWriter, drain_every: int = 1024) -> None:
+        self.writer = writer
+        self.drain_every = drain_every
+        self._pending = 0
+
+    async def send(self, event: dict) -> None:
+        self.writer.write(encode(event))
+        self._pending += 1
+        if self._pending >= self.drain_every:
+            self._pending = 0
+            await self.writer.drain()
+
+    async def close(self) -> None:
+        await self.writer.drain()
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+class NullSink:
+    """Discard events."""
+
+    async def send(self, event: dict) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+async def open_sink(spec: str) -> Sink:
+    """Create a sink from 'stdout', 'null', 'tcp://HOST:PORT', 'unix://PATH'
+    or a file path."""
+    if spec == "stdout":
+        return FileSink(sys.stdout)
+    if spec == "null":
+        return NullSink()
+    if spec.startswith("tcp://"):
+        host, _, port = spec[len("tcp://"):].rpartition(":")
+        _, writer = await asyncio.open_connection(host or "127.0.0.1", int(port))
+        return StreamSink(writer)
+    if spec.startswith("unix://"):
+        _, writer = await asyncio.open_unix_connection(spec[len("unix://"):])
+        return StreamSink(writer)
+    return FileSink(open(spec, "w"), close_stream=True)
+
+
+# ---------------------------------------------------------------------------
+# Replay
+# ---------------------------------------------------------------------------
+
+def _lag_stats(lag_s: np.ndarray) -> dict[str, float]:
+    ms = lag_s * 1000
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+    return {
+        "mean": round(float(ms.mean()), 3),
+        "p50": round(float(p50), 3),
+        "p95": round(float(p95), 3),
+        "p99": round(float(p99), 3),
+        "max": round(float(ms.max()), 3),
+    }
+
+
+async def replay(
+    events: EventLog,
+    sink: Sink,
+    speedup: float = 1000.0,
+    limit: int | None = None,
+    close: bool = True,
+) -> dict:
+    """Emit *events* to *sink* on a schedule scaled by *speedup*.
+
+    Event *i* is due ``(epoch_i - epoch_0) / speedup`` seconds after the
+    start. Replay sleeps until the next event is due. When it falls
+    behind, because the sink blocks or the loop is busy, it emits
+    without sleeping and records the lag.
+
+    Args:
+        events: EventLog to replay.
+        sink: Destination (see the Sink classes above).
+        speedup: Event-time seconds per wall-clock second; 0 emits as
+            fast as possible (no schedule, no lag).
+        limit: Emit only the first *limit* events.
+        close: Close the sink afterwards.
+
+    Returns:
+        A dict with 'events', 'trip_starts', 'trip_ends', 'elapsed_s',
+        'rate_eps', 'target_rate_eps', 'span_s', 'speedup' and 'lag_ms'
+        (mean / p50 / p95 / p99 / max, None when speedup is 0).
+    """
+    if speedup < 0:
+        raise ValueError("speedup must be non-negative")
+    n = len(events) if limit is None else min(limit, len(events))
+    loop = asyncio.get_running_loop()
+    lag = np.zeros(n)
+    epoch0 = int(events.epochs[0]) if n else 0
+
+    t0 = loop.time()
+    for i in range(n):
+        if speedup:
+            due = t0 + (int(events.epochs[i]) - epoch0) / speedup
+            now = loop.time()
+            if due - now > MIN_SLEEP_S:
+                await asyncio.sleep(due - now)
+                now = loop.time()
+            lag[i] = max(0.0, now - due)
+        event = events.event(i)
+        event["seq"] = i
+        event["sent_at"] = time.time()
+        await sink.send(event)
+        if i % YIELD_EVERY == YIELD_EVERY - 1:
+            await asyncio.sleep(0)
+    if close:
+        await sink.close()
+    elapsed = loop.time() - t0
+
+    span = float(events.epochs[n - 1] - epoch0) if n else 0.0
+    starts = int(events.kinds[:n].sum())
+    return {
+        "events": n,
+        "trip_starts": starts,
+        "trip_ends": n - starts,
+        "elapsed_s": round(elapsed, 4),
+        "rate_eps": round(n / elapsed, 1) if elapsed > 0 else None,
+        "target_rate_eps": round(n * speedup / span, 1) if speedup and span else None,
+        "span_s": span,
+        "speedup": speedup,
+        "lag_ms": _lag_stats(lag) if speedup and n else None,
+    }
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Replay trips as a timed event stream.")
+    parser.add_argument("source", nargs="?", default=None,
+                        help="trips CSV or write_partitioned directory")
+    parser.add_argument("--generate", type=int, default=None, metavar="N_TRIPS",
+                        help="replay N freshly generated trips instead of a file")
+    parser.add_argument("--demand", choices=["uniform", "realistic"], default="realistic",
+                        help="demand model for --generate")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--speedup", type=float, default=1000.0,
+                        help="event-time seconds per second (0 = as fast as possible)")
+    parser.add_argument("--limit", type=int, default=None, help="stop after N events")
+    parser.add_argument("--sink", default="stdout",
+                        help="stdout, null, tcp://HOST:PORT, unix://PATH or a file path")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> dict:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if (args.source is None) == (args.generate is None):
+        parser.error("give either a source file or --generate")
+
+    if args.generate is not None:
+        trips, _, _ = generate_tables(GeneratorConfig(
+            n_trips=args.generate,
+            n_users=max(80, args.generate // 20),
+            seed=args.seed,
+            demand=REALISTIC_DEMAND if args.demand == "realistic" else None,
+        ))
+    else:
+        trips = load_trips(args.source)
+    events = EventLog.from_trips(trips)
+
+    async def run() -> dict:
+        return await replay(events, await open_sink(args.sink), args.speedup, args.limit)
+
+    report = asyncio.run(run())
+    report["skipped_trips"] = events.skipped
+    # Keep stdout clean for the event stream.
+    print(json.dumps(report), file=sys.stderr)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+What-if pricing scenarios evaluated in parallel.
+
+A scenario is a dict of overrides for the strategy constants in
+pricing.py, keyed "<ClassName>.<CONSTANT>":
+
+    {"MemberPricing.PER_MINUTE": 0.07, "PeakHourPricing.MULTIPLIER": 1.3}
+
+The trips table is reduced once to a handful of NumPy columns, written to
+.npy files and memory-mapped read-only by every worker process, so the
+trip data is never pickled per scenario. Each worker compiles the
+scenario into a CompiledTariff, prices all trips and reduces revenue by
+user type, start station and month with np.bincount.
+
+Usage:
+    grid = scenario_grid({
+        "MemberPricing.PER_MINUTE": [0.07, 0.08],
+        "PeakHourPricing.MULTIPLIER": [1.3, 1.5],
+    })
+    results = run_scenarios(system.trips, grid, max_workers=8)
+    results["by_user_type"]
+"""
+
+import itertools
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from pricing import (
+    CasualPricing,
+    CompiledTariff,
+    MemberPricing,
+    PeakHourPricing,
+    PricingStrategy,
+)
+
+
+STRATEGY_CLASSES: dict[str, type[PricingStrategy]] = {
+    "CasualPricing": CasualPricing,
+    "MemberPricing": MemberPricing,
+    "PeakHourPricing": PeakHourPricing,
+}
+
+ARRAY_NAMES = (
+    "user_code", "hour", "weekday", "duration", "distance",
+    "station_code", "month_code",
+)
+
+# Per-process memory-mapped trip arrays, set by _init_worker().
+_ARRAYS: dict[str, np.ndarray] = {}
+
+
+# ---------------------------------------------------------------------------
+# Scenario definition
+# ---------------------------------------------------------------------------
+
+def scenario_grid(axes: dict[str, list[Any]]) -> list[dict[str, Any]]:
+    """Expand {parameter: [values, …]} into the cartesian list of scenarios.
+
+    Example:
+        >>> scenario_grid({"MemberPricing.PER_MINUTE": [0.07, 0.08]})
+        [{'MemberPricing.PER_MINUTE': 0.07}, {'MemberPricing.PER_MINUTE': 0.08}]
+    """
+    names = list(axes)
+    return [dict(zip(names, values)) for values in itertools.product(*axes.values())]
+
+
+def scenario_label(overrides: dict[str, Any]) -> str:
+    """Return a short human-readable label for a scenario."""
+    if not overrides:
+        return "baseline"
+    return ", ".join(f"{name}={value}" for name, value in overrides.items())
+
+
+def build_tariff(overrides: dict[str, Any]) -> CompiledTariff:
+    """Compile a tariff with some strategy constants overridden.
+
+    Overridden strategies are derived subclasses, so the module-level
+    classes are never mutated. The peak strategy is rebuilt on top of the
+    (possibly overridden) casual strategy.
+
+    Raises:
+        ValueError: If a key does not name an existing strategy constant.
+    """
+    attrs: dict[str, dict[str, Any]] = {name: {} for name in STRATEGY_CLASSES}
+    for key, value in overrides.items():
+        cls_name, _, attr = key.partition(".")
+        cls = STRATEGY_CLASSES.get(cls_name)
+        if cls is None or not attr.isupper() or not hasattr(cls, attr):
+            raise ValueError(f"Unknown pricing parameter: {key!r}")
+        attrs[cls_name][attr] = value
+
+    casual = type("CasualPricing", (CasualPricing,), attrs["CasualPricing"])
+    member = type("MemberPricing", (MemberPricing,), attrs["MemberPricing"])
+    peak = type(
+        "PeakHourPricing",
+        (PeakHourPricing,),
+        {"BASE_STRATEGY": casual, **attrs["PeakHourPricing"]},
+    )
+    return CompiledTariff.from_strategies(
+        {"casual": casual(), "member": member()}, peak=peak()
+    )
+
+
+# ---------------------------------------------------------------------------
+# Shared trip arrays
+# ---------------------------------------------------------------------------
+
+def prepare_trip_arrays(
+    trips: pd.DataFrame, user_types: tuple[str, ...] = ("casual", "member")
+) -> tuple[dict[str, np.ndarray], dict[str, pd.Index]]:
+    """Reduce a trips DataFrame to compact columns for scenario pricing.
+
+    Returns:
+        (arrays, labels) — arrays keyed by ARRAY_NAMES; labels maps
+        'user_type', 'station' and 'month' to the Index decoding each code.
+    """
+    start = trips["start_time"]
+    if not pd.api.types.is_datetime64_any_dtype(start):
+        start = pd.to_datetime(start)
+
+    user_code = pd.Index(user_types).get_indexer(trips["user_type"])
+    if (user_code < 0).any():
+        bad = np.flatnonzero(user_code < 0)[:5]
+        raise ValueError(f"Unknown user_type at rows {bad.tolist()}")
+    station_code, stations = pd.factorize(trips["start_station_id"], sort=True)
+    month_code, months = pd.factorize(start.dt.to_period("M"), sort=True)
+
+    arrays = {
+        "user_code": user_code.astype(np.int8),
+        "hour": start.dt.hour.to_numpy(dtype=np.int8),
+        "weekday": start.dt.weekday.to_numpy(dtype=np.int8),
+        "duration": trips["duration_minutes"].to_numpy(dtype=np.float64),
+        "distance": trips["distance_km"].to_numpy(dtype=np.float64),
+        "station_code": station_code.astype(np.int32),
+        "month_code": month_code.astype(np.int32),
+    }
+    labels = {
+        "user_type": pd.Index(user_types, name="user_type"),
+        "station": pd.Index(stations, name="start_station_id"),
+        "month": pd.Index(months.astype(str), name="year_month"),
+    }
+    return arrays, labels
+
+
+def _save_arrays(arrays: dict[str, np.ndarray], directory: Path) -> None:
+    for name in ARRAY_NAMES:
+        np.save(directory / f"{name}.npy", arrays[name])
+
+
+def _init_worker(directory: str) -> None:
+    """Memory-map the shared trip arrays once per worker process."""
+    _ARRAYS.clear()
+    for name in ARRAY_NAMES:
+        _ARRAYS[name] = np.load(Path(directory) / f"{name}.npy", mmap_mode="r")
+
+
+def _evaluate(
+    task: tuple[dict[str, Any], int, int, int]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Price every trip under one scenario and reduce revenue three ways."""
+    overrides, n_user_types, n_stations, n_months = task
+    a = _ARRAYS
+    fares = build_tariff(overrides).price(
+        a["user_code"], a["hour"], a["weekday"], a["duration"], a["distance"]
+    )
+    return (
+        np.bincount(a["user_code"], weights=fares, minlength=n_user_types),
+        np.bincount(a["station_code"], weights=fares, minlength=n_stations),
+        np.bincount(a["month_code"], weights=fares, minlength=n_months),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def run_scenarios(
+    trips: pd.DataFrame,
+    scenarios: list[dict[str, Any]],
+    max_workers: int | None = None,
+    workdir: str | Path | None = None,
+) -> dict[str, pd.DataFrame | pd.Series]:
+    """Evaluate revenue for every scenario over the full trips table.
+
+    Args:
+        trips: Cleaned trips DataFrame.
+        scenarios: List of override dicts (see `scenario_grid`).
+        max_workers: Worker processes; 1 evaluates in the calling process.
+        workdir: Directory for the shared .npy files (a temporary
+            directory is used and removed when omitted).
+
+    Returns:
+        Dict with 'total' (Series) and 'by_user_type', 'by_station',
+        'by_month' (DataFrames), all indexed by scenario label.
+    """
+    for overrides in scenarios:
+        build_tariff(overrides)  # fail fast on bad parameter names
+
+    arrays, labels = prepare_trip_arrays(trips)
+    sizes = (len(labels["user_type"]), len(labels["station"]), len(labels["month"]))
+    tasks = [(overrides, *sizes) for overrides in scenarios]
+
+    with tempfile.TemporaryDirectory(dir=workdir) as directory:
+        _save_arrays(arrays, Path(directory))
+        if max_workers == 1:
+            _init_worker(directory)
+            try:
+                results = [_evaluate(task) for task in tasks]
+            finally:
+                _ARRAYS.clear()
+        else:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(directory,),
+            ) as pool:
+                chunksize = max(1, len(tasks) // ((max_workers or 4) * 4))
+                results = list(pool.map(_evaluate, tasks, chunksize=chunksize))
+
+    index = pd.Index([scenario_label(s) for s in scenarios], name="scenario")
+    by_user = pd.DataFrame([r[0] for r in results], index=index,
+                           columns=labels["user_type"])
+    by_station = pd.DataFrame([r[1] for r in results], index=index,
+                              columns=labels["station"])
+    by_month = pd.DataFrame([r[2] for r in results], index=index,
+                            columns=labels["month"])
+    return {
+        "total": by_user.sum(axis=1).rename("revenue"),
+        "by_user_type": by_user,
+        "by_station": by_station,
+        "by_month": by_month,
+    }
@@ -0,0 +1,425 @@
+"""
+Local HTTP query server over a warm, cleaned BikeShareSystem.
+
+The data is loaded and cleaned once at startup. Each analytics method is
+then served as a JSON endpoint, so a dashboard query costs milliseconds
+rather than a full `python main.py` run:
+
+    GET /api                        list of endpoints and filters
+    GET /api/<method>?<filters>     run one analytics method
+    GET /stats                      request latency and cache statistics
+    GET /health
+    POST /refresh                   reload and re-clean the data
+
+Filters (all optional; combined with AND):
+
+    start, end      start_time window [start, end), e.g. 2024-03-01
+    station         start_station_id, comma-separated list
+    user_type       casual / member
+    bike_type       classic / electric (also filters maintenance)
+    n               result size for the top_* methods
+
+A filtered request runs the method on a BikeShareSystem that holds only
+the matching rows. Responses are cached in an LRU keyed by snapshot
+version, method and normalized filters. Requests are handled by a fixed
+thread pool, and per-endpoint latency percentiles are kept for /stats.
+
+Queries read from the current snapshot.Snapshot and take no lock, so
+workers compute in parallel. /refresh publishes a new snapshot. Queries
+already running finish on the old one, and later ones see the new
+version (and miss the cache).
+
+The server binds to 127.0.0.1 by default.
+
+Usage:
+    python server.py --port 8000 --workers 8
+    curl 'http://127.0.0.1:8000/api/top_start_stations?start=2024-06-01&n=5'
+"""
+
+import argparse
+import contextlib
+import functools
+import io
+import json
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from analyzer import DATA_DIR, BikeShareSystem
+from ingest import LatencyRecorder
+from snapshot import SnapshotStore
+from utils import VALID_BIKE_TYPES, VALID_USER_TYPES
+
+
+# Endpoint name -> parameters passed through to the method.
+ENDPOINTS: dict[str, tuple[str, ...]] = {
+    "total_trips_summary": (),
+    "top_start_stations": ("n",),
+    "peak_usage_hours": (),
+    "busiest_day_of_week": (),
+    "avg_distance_by_user_type": (),
+    "monthly_trip_trend": (),
+    "top_active_users": ("n",),
+    "maintenance_cost_by_bike_type": (),
+    "top_routes": ("n",),
+}
+FILTERS = ("start", "end", "station", "user_type", "bike_type", "n")
+
+DEFAULT_CACHE_SIZE = 256
+DEFAULT_WORKERS = 8
+MAX_N = 10_000
+
+
+# ---------------------------------------------------------------------------
+# Loading
+# ---------------------------------------------------------------------------
+
+def load_system(data_dir: str | Path = DATA_DIR) -> BikeShareSystem:
+    """Load the raw CSVs from *data_dir* and clean them (no exports)."""
+    data_dir = Path(data_dir)
+    system = BikeShareSystem()
+    system.trips = pd.read_csv(data_dir / "trips.csv")
+    system.stations = pd.read_csv(data_dir / "stations.csv")
+    system.maintenance = pd.read_csv(data_dir / "maintenance.csv")
+    with contextlib.redirect_stdout(io.StringIO()):
+        system.clean_data(export=False)
+    system.maintenance = system.maintenance.assign(
+        date=pd.to_datetime(system.maintenance["date"], errors="coerce"))
+    return system
+
+
+# ---------------------------------------------------------------------------
+# Queries
+# ---------------------------------------------------------------------------
+
+def parse_filters(query: dict[str, list[str]]) -> dict[str, Any]:
+    """Validate and normalize query-string filters.
+
+    Raises:
+        ValueError: On unknown parameters or invalid values.
+    """
+    unknown = sorted(set(query) - set(FILTERS))
+    if unknown:
+        raise ValueError(f"Unknown parameters: {unknown}")
+    value = {key: values[-1] for key, values in query.items()}
+    filters: dict[str, Any] = {}
+    for key in ("start", "end"):
+        if key in value:
+            stamp = pd.to_datetime(value[key], errors="coerce", format="ISO8601")
+            if pd.isna(stamp):
+                raise ValueError(f"{key} must be a date or datetime")
+            if stamp.tzinfo is not None:
+                raise ValueError(f"{key} must not carry a timezone (trip times are local)")
+            filters[key] = stamp.isoformat(sep=" ")
+    if "station" in value:
+        filters["station"] = tuple(sorted(s for s in value["station"].split(",") if s))
+    for key, allowed in (("user_type", VALID_USER_TYPES), ("bike_type", VALID_BIKE_TYPES)):
+        if key in value:
+            if value[key] not in allowed:
+                raise ValueError(f"{key} must be one of {sorted(allowed)}")
+            filters[key] = value[key]
+    if "n" in value:
+        try:
+            n = int(value["n"])
+        except ValueError:
+            raise ValueError("n must be an integer") from None
+        if not 1 <= n <= MAX_N:
+            raise ValueError(f"n must be between 1 and {MAX_N}")
+        filters["n"] = n
+    return filters
+
+
+def filtered_system(system: BikeShareSystem, filters: dict[str, Any]) -> BikeShareSystem:
+    """A BikeShareSystem holding only the rows matching *filters*."""
+    trips, maintenance = system.trips, system.maintenance
+    dates = maintenance["date"]
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, errors="coerce")
+    mask = np.ones(len(trips), dtype=bool)
+    service = np.ones(len(maintenance), dtype=bool)
+    if "start" in filters:
+        start = pd.Timestamp(filters["start"])
+        mask &= (trips["start_time"] >= start).to_numpy()
+        service &= (dates >= start).to_numpy()
+    if "end" in filters:
+        end = pd.Timestamp(filters["end"])
+        mask &= (trips["start_time"] < end).to_numpy()
+        service &= (dates < end).to_numpy()
+    if "station" in filters:
+        mask &= trips["start_station_id"].isin(filters["station"]).to_numpy()
+    if "user_type" in filters:
+        mask &= (trips["user_type"] == filters["user_type"]).to_numpy()
+    if "bike_type" in filters:
+        mask &= (trips["bike_type"] == filters["bike_type"]).to_numpy()
+        service &= (maintenance["bike_type"] == filters["bike_type"]).to_numpy()
+
+    view = BikeShareSystem()
+    view.trips = trips[mask].copy()
+    view.stations = system.stations
+    view.maintenance = maintenance[service]
+    return view
+
+
+def to_json(result: Any) -> Any:
+    """Convert an analytics result (DataFrame / Series / dict) to JSON types."""
+    if isinstance(result, pd.DataFrame):
+        return json.loads(result.to_json(orient="records"))
+    if isinstance(result, pd.Series):
+        return {str(k): to_json(v) for k, v in result.items()}
+    if isinstance(result, dict):
+        return {str(k): to_json(v) for k, v in result.items()}
+    if isinstance(result, np.generic):
+        result = result.item()
+    if isinstance(result, float) and result != result:
+        return None
+    return result
+
+
+class LRUCache:
+    """Thread-safe least-recently-used cache."""
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Any) -> Any | None:
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class QueryEngine:
+    """Runs analytics methods with filters, caching and latency tracking.
+
+    Args:
+        source: SnapshotStore to read from, or a cleaned BikeShareSystem
+            (published as version 1 of a new store).
+        cache_size: LRU capacity (0 disables caching).
+    """
+
+    def __init__(self, source: SnapshotStore | BikeShareSystem,
+                 cache_size: int = DEFAULT_CACHE_SIZE) -> None:
+        if isinstance(source, BikeShareSystem):
+            source = SnapshotStore(system=source)
+        self.store = source
+        self.cache = LRUCache(cache_size) if cache_size else None
+        self._stats_lock = threading.Lock()
+        self.latency: dict[str, LatencyRecorder] = {}
+        self.requests: Counter = Counter()
+        self.errors: Counter = Counter()
+
+    def query(self, method: str, filters: dict[str, Any]) -> tuple[Any, bool, int]:
+        """Return (JSON-ready result, served from cache, snapshot version)."""
+        if method not in ENDPOINTS:
+            raise KeyError(method)
+        snapshot = self.store.current()
+        key = (snapshot.version, method, tuple(sorted(filters.items())))
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached, True, snapshot.version
+        kwargs = {name: filters[name] for name in ENDPOINTS[method] if name in filters}
+        system = snapshot.system()
+        if any(k != "n" for k in filters):
+            system = filtered_system(system, filters)
+        result = to_json(getattr(system, method)(**kwargs))
+        if self.cache is not None:
+            self.cache.put(key, result)
+        return result, False, snapshot.version
+
+    def refresh(self) -> dict:
+        """Reload through the store's loader and publish a new snapshot."""
+        t0 = time.perf_counter()
+        snapshot = self.store.refresh()
+        return {"version": snapshot.version, "trips": len(snapshot.trips),
+                "elapsed_ms": round((time.perf_counter() - t0) * 1000, 3)}
+
+    def record(self, endpoint: str, seconds: float, error: bool = False) -> None:
+        with self._stats_lock:
+            self.requests[endpoint] += 1
+            if error:
+                self.errors[endpoint] += 1
+            recorder = self.latency.setdefault(endpoint, LatencyRecorder(window=1 << 14))
+            recorder.record(np.array([seconds]))
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            endpoints = {
+                name: {"requests": self.requests[name], "errors": self.errors[name],
+                       "latency_ms": self.latency[name].percentiles()}
+                for name in sorted(self.requests)
+            }
+        cache = None
+        if self.cache is not None:
+            cache = {"size": len(self.cache), "hits": self.cache.hits,
+                     "misses": self.cache.misses}
+        snapshot = self.store.current()
+        return {"version": snapshot.version, "trips": len(snapshot.trips),
+                "cache": cache, "endpoints": endpoints}
+
+
+# ---------------------------------------------------------------------------
+# HTTP
+# ---------------------------------------------------------------------------
+
+class QueryHandler(BaseHTTPRequestHandler):
+    """JSON request handler; ``self.server.engine`` answers queries."""
+
+    server_version = "CityBike/1.0"
+
+    def do_GET(self) -> None:
+        t0 = time.perf_counter()
+        url = urlsplit(self.path)
+        parts = [p for p in url.path.split("/") if p]
+        endpoint = "/" + "/".join(parts[:2])
+        engine: QueryEngine = self.server.engine
+        status, body = 200, None
+        try:
+            if parts == ["health"]:
+                body = {"status": "ok"}
+            elif parts == ["stats"]:
+                body = engine.stats()
+            elif parts == ["api"]:
+                body = {"endpoints": {m: list(p) for m, p in ENDPOINTS.items()},
+                        "filters": list(FILTERS)}
+            elif len(parts) == 2 and parts[0] == "api" and parts[1] in ENDPOINTS:
+                filters = parse_filters(parse_qs(url.query))
+                result, cached, version = engine.query(parts[1], filters)
+                body = {"method": parts[1], "filters": filters, "result": result,
+                        "cached": cached, "version": version}
+            else:
+                status, body = 404, {"error": f"Not found: {url.path}"}
+        except ValueError as exc:
+            status, body = 400, {"error": str(exc)}
+        except Exception as exc:  # keep serving; report the failure
+            status, body = 500, {"error": f"{type(exc).__name__}: {exc}"}
+
+        elapsed = time.perf_counter() - t0
+        if body is not None and parts[:1] == ["api"] and len(parts) == 2:
+            body["elapsed_ms"] = round(elapsed * 1000, 3)
+        # Unknown /api paths are not recorded: each name would add a recorder.
+        if parts == ["api"] or (len(parts) == 2 and parts[0] == "api"
+                                and parts[1] in ENDPOINTS):
+            engine.record(endpoint, elapsed, error=status != 200)
+        self._send(status, body)
+
+    def do_POST(self) -> None:
+        engine: QueryEngine = self.server.engine
+        if urlsplit(self.path).path.strip("/") != "refresh":
+            self._send(404, {"error": f"Not found: {self.path}"})
+            return
+        try:
+            self._send(200, engine.refresh())
+        except ValueError as exc:
+            self._send(400, {"error": str(exc)})
+        except Exception as exc:  # the old snapshot stays current
+            self._send(500, {"error": f"{type(exc).__name__}: {exc}"})
+
+    def _send(self, status: int, body: Any) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class QueryServer(HTTPServer):
+    """HTTPServer that handles each connection on a fixed thread pool."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], engine: QueryEngine,
+                 workers: int = DEFAULT_WORKERS, verbose: bool = False) -> None:
+        super().__init__(address, QueryHandler)
+        self.engine = engine
+        self.verbose = verbose
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="query")
+
+    def process_request(self, request, client_address) -> None:
+        self.pool.submit(self._handle, request, client_address)
+
+    def _handle(self, request, client_address) -> None:
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.pool.shutdown(wait=True)
+
+
+def serve(source: SnapshotStore | BikeShareSystem, host: str = "127.0.0.1",
+          port: int = 8000, workers: int = DEFAULT_WORKERS,
+          cache_size: int = DEFAULT_CACHE_SIZE, verbose: bool = False) -> QueryServer:
+    """Create a QueryServer (call serve_forever() on it, or run it in a thread)."""
+    return QueryServer((host, port), QueryEngine(source, cache_size), workers, verbose)
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve CityBike analytics as JSON.")
+    parser.add_argument("--data-dir", default=str(DATA_DIR))
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE)
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    store = SnapshotStore(loader=functools.partial(load_system, args.data_dir))
+    snapshot = store.refresh()
+    print(f"Loaded and cleaned {len(snapshot.trips)} trips in "
+          f"{time.perf_counter() - t0:.2f} s")
+    server = serve(store, args.host, args.port, args.workers, args.cache_size, args.verbose)
+    print(f"Serving on http://{args.host}:{server.server_address[1]}/api")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Immutable, versioned snapshots of the cleaned data for concurrent readers.
+
+A Snapshot freezes one cleaned (trips, stations, maintenance) triple
+under a version number. Readers take the current snapshot with a single
+attribute read and run analytics on ``snapshot.system()``; they never
+lock and never see a half-refreshed state.
+
+A refresh (new data, re-cleaning) builds the next snapshot off to the
+side and swaps it in with one reference assignment:
+
+    store = SnapshotStore(loader=server.load_system)
+    store.refresh()                         # version 1
+    snap = store.current()                  # readers: no lock
+    snap.system().top_start_stations(5)
+    store.refresh()                         # version 2; snap is unchanged
+
+Readers that still hold version 1 keep using it until they drop it, so
+a long query started before a refresh finishes on the data it started
+with. Publishes are serialized with each other, never with readers.
+
+Frames are copied once when published, so the publisher can keep
+changing its own. ``system()`` hands out shallow copies. pandas
+copy-on-write turns any write through them into a private copy, so a
+reader cannot change what other readers see. This needs pandas 3.0 or
+newer, where copy-on-write is always on (requirements.txt pins it).
+
+Usage:
+    from snapshot import SnapshotStore
+    store = SnapshotStore(system=cleaned_system)
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from typing import NamedTuple
+
+import pandas as pd
+
+from analyzer import BikeShareSystem
+
+
+class Snapshot(NamedTuple):
+    """One frozen, versioned copy of the cleaned data.
+
+    Treat the frames as read-only; use system() for analytics.
+    """
+
+    version: int
+    trips: pd.DataFrame
+    stations: pd.DataFrame
+    maintenance: pd.DataFrame
+    created_at: float
+
+    @classmethod
+    def from_system(cls, system: BikeShareSystem, version: int) -> "Snapshot":
+        """Freeze *system*'s frames (deep copy) as *version*.
+
+        Raises:
+            ValueError: If any of the frames has not been loaded.
+        """
+        frames = (system.trips, system.stations, system.maintenance)
+        if any(frame is None for frame in frames):
+            raise ValueError("system must have trips, stations and maintenance loaded")
+        return cls(version, *(frame.copy() for frame in frames), time.time())
+
+    def system(self) -> BikeShareSystem:
+        """A BikeShareSystem over this snapshot, isolated from other readers.
+
+        Complexity:
+            O(columns); the data itself is shared until written.
+        """
+        system = BikeShareSystem()
+        system.trips = self.trips.copy(deep=False)
+        system.stations = self.stations.copy(deep=False)
+        system.maintenance = self.maintenance.copy(deep=False)
+        return system
+
+
+class SnapshotStore:
+    """Holds the current Snapshot and swaps in new ones atomically.
+
+    Args:
+        loader: Zero-argument callable returning a cleaned BikeShareSystem;
+            used by refresh().
+        system: Optional cleaned system to publish as version 1 right away.
+    """
+
+    def __init__(self, loader: Callable[[], BikeShareSystem] | None = None,
+                 system: BikeShareSystem | None = None) -> None:
+        self.loader = loader
+        self._current: Snapshot | None = None
+        self._write_lock = threading.Lock()
+        if system is not None:
+            self.publish(system)
+
+    def current(self) -> Snapshot:
+        """The latest published snapshot (lock-free).
+
+        Raises:
+            ValueError: If nothing has been published yet.
+        """
+        snapshot = self._current
+        if snapshot is None:
+            raise ValueError("no snapshot published yet")
+        return snapshot
+
+    @property
+    def version(self) -> int:
+        """Version of the current snapshot (0 before the first publish)."""
+        snapshot = self._current
+        return 0 if snapshot is None else snapshot.version
+
+    def publish(self, system: BikeShareSystem) -> Snapshot:
+        """Freeze *system* as the next version and make it current."""
+        with self._write_lock:
+            snapshot = Snapshot.from_system(system, self.version + 1)
+            self._current = snapshot
+        return snapshot
+
+    def refresh(self) -> Snapshot:
+        """Load and clean through ``loader``, then publish the result.
+
+        Loading runs outside the swap; readers keep the old snapshot
+        until the new one is complete.
+
+        Raises:
+            ValueError: If the store was created without a loader.
+        """
+        if self.loader is None:
+            raise ValueError("SnapshotStore has no loader to refresh from")
+        return self.publish(self.loader())
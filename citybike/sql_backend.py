@@ -0,0 +1,355 @@
+"""
+SQLite-backed storage and analytics for the CityBike platform.
+
+SQLiteSystem is a BikeShareSystem whose analytics methods run as SQL
+against a local SQLite database. The database is either ":memory:" or a
+file, so a large history can be queried without holding it in pandas.
+It is bulk-loaded once from cleaned frames:
+
+    trips           every cleaned column; datetimes as INTEGER epoch
+    stations        seconds, missing values as NULL
+    maintenance
+
+Trips are inserted in start_time order, so the rows of a time window
+sit on neighbouring pages. Indexes cover trips(start_time),
+trips(start_station_id), trips(user_id), trips(bike_id) and
+maintenance(bike_id).
+
+Each analytics method returns the same labels, ordering and
+tie-breaking (count descending, then key ascending) as the pandas
+version in analyzer.py. The parity tests in tests/test_sql_backend.py
+check this.
+
+``filtered(start=..., end=..., station=..., user_type=..., bike_type=...)``
+returns a view that adds a WHERE clause to every query. This uses the
+same filter names as server.py. A narrow time window or a station list
+is answered from the indexes instead of a full scan. That is where SQL
+wins over pandas; unfiltered aggregates still read every row.
+
+Usage:
+    python sql_backend.py --db output/citybike.sqlite
+    python sql_backend.py --db output/citybike.sqlite --no-load \\
+        --method top_start_stations --start 2024-06-01 --end 2024-07-01
+"""
+
+import argparse
+import copy
+import sqlite3
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from analyzer import DATA_DIR, BikeShareSystem
+
+
+INDEXES = {
+    "idx_trips_start_time": ("trips", "start_time"),
+    "idx_trips_start_station_id": ("trips", "start_station_id"),
+    "idx_trips_user_id": ("trips", "user_id"),
+    "idx_trips_bike_id": ("trips", "bike_id"),
+    "idx_maintenance_bike_id": ("maintenance", "bike_id"),
+}
+FILTERS = ("start", "end", "station", "user_type", "bike_type")
+
+# strftime('%w') numbers days from Sunday.
+_DAY_NAMES = ("Sunday", "Monday", "Tuesday", "Wednesday", "Thursday",
+              "Friday", "Saturday")
+
+
+# ---------------------------------------------------------------------------
+# Bulk loading
+# ---------------------------------------------------------------------------
+
+def _sql_type(dtype: Any) -> str:
+    if pd.api.types.is_datetime64_any_dtype(dtype) or pd.api.types.is_integer_dtype(dtype):
+        return "INTEGER"
+    if pd.api.types.is_float_dtype(dtype):
+        return "REAL"
+    return "TEXT"
+
+
+def _column_values(column: pd.Series) -> list:
+    """Python values for executemany; NaN / NaT become NULL."""
+    if pd.api.types.is_datetime64_any_dtype(column):
+        epochs = column.to_numpy().astype("datetime64[s]").astype(np.int64)
+        return [None if missing else int(e)
+                for e, missing in zip(epochs.tolist(), column.isna().tolist())]
+    if pd.api.types.is_float_dtype(column):
+        return column.tolist()          # SQLite stores NaN as NULL
+    if pd.api.types.is_integer_dtype(column):
+        return column.tolist()
+    return column.astype(object).where(column.notna(), None).tolist()
+
+
+def _epoch(value: Any) -> int:
+    return int(pd.Timestamp(value).to_datetime64().astype("datetime64[s]").astype(np.int64))
+
+
+class SQLiteSystem(BikeShareSystem):
+    """BikeShareSystem whose analytics run as SQL over a SQLite database.
+
+    Args:
+        path: Database file, or ":memory:".
+
+    The ``trips`` / ``stations`` / ``maintenance`` attributes stay None;
+    use fetch() to pull a query result into pandas.
+    """
+
+    def __init__(self, path: str | Path = ":memory:") -> None:
+        super().__init__()
+        self.path = str(path)
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.filters: dict[str, Any] = {}
+
+    @classmethod
+    def from_system(cls, system: BikeShareSystem,
+                    path: str | Path = ":memory:") -> "SQLiteSystem":
+        """Create a database at *path* and bulk-load *system*'s cleaned frames."""
+        backend = cls(path)
+        backend.load(system.trips, system.stations, system.maintenance)
+        return backend
+
+    def load(self, trips: pd.DataFrame, stations: pd.DataFrame,
+             maintenance: pd.DataFrame) -> dict[str, int]:
+        """Replace the tables with the given cleaned frames, then index them.
+
+        Rows are inserted with executemany in a single transaction, and the
+        indexes are built after the insert (faster than maintaining them
+        row by row). ANALYZE then gives the planner row counts.
+
+        Returns:
+            {table: rows loaded}.
+
+        Complexity:
+            O(n log n) for n trips (index builds).
+        """
+        if "start_time" in trips:
+            # Clustered by start_time: a time window reads contiguous pages.
+            order = np.argsort(trips["start_time"].to_numpy(), kind="stable")
+            trips = trips.iloc[order]
+        frames = {"trips": trips, "stations": stations, "maintenance": maintenance}
+        if "date" in maintenance and not pd.api.types.is_datetime64_any_dtype(maintenance["date"]):
+            frames["maintenance"] = maintenance.assign(
+                date=pd.to_datetime(maintenance["date"], errors="coerce"))
+        self.conn.execute("PRAGMA synchronous = OFF")
+        with self.conn:
+            for table, frame in frames.items():
+                columns = list(frame.columns)
+                schema = ", ".join(f'"{c}" {_sql_type(frame[c].dtype)}' for c in columns)
+                self.conn.execute(f'DROP TABLE IF EXISTS "{table}"')
+                self.conn.execute(f'CREATE TABLE "{table}" ({schema})')
+                rows = zip(*(_column_values(frame[c]) for c in columns))
+                marks = ", ".join("?" * len(columns))
+                self.conn.executemany(f'INSERT INTO "{table}" VALUES ({marks})', rows)
+            for name, (table, column) in INDEXES.items():
+                if column in frames[table]:
+                    self.conn.execute(f'CREATE INDEX "{name}" ON "{table}" ("{column}")')
+        self.conn.execute("ANALYZE")
+        return {table: len(frame) for table, frame in frames.items()}
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # ------------------------------------------------------------------
+    # Filtering
+    # ------------------------------------------------------------------
+
+    def filtered(self, **filters: Any) -> "SQLiteSystem":
+        """A view over the same database restricted by *filters*.
+
+        Args:
+            start, end: start_time window [start, end); maintenance by date.
+            station: start_station_id or an iterable of them.
+            user_type: Trips by this user type.
+            bike_type: Trips and maintenance of this bike type.
+
+        Raises:
+            ValueError: On unknown filter names.
+        """
+        unknown = sorted(set(filters) - set(FILTERS))
+        if unknown:
+            raise ValueError(f"Unknown filters: {unknown}")
+        view = copy.copy(self)
+        view.filters = {**self.filters, **{k: v for k, v in filters.items() if v is not None}}
+        return view
+
+    def _where(self, table: str, *conditions: str) -> tuple[str, list]:
+        """WHERE clause and parameters for *table* under self.filters."""
+        clauses, params = list(conditions), []
+        time_column = "start_time" if table == "trips" else "date"
+        if "start" in self.filters:
+            clauses.append(f"{time_column} >= ?")
+            params.append(_epoch(self.filters["start"]))
+        if "end" in self.filters:
+            clauses.append(f"{time_column} < ?")
+            params.append(_epoch(self.filters["end"]))
+        if "bike_type" in self.filters:
+            clauses.append("bike_type = ?")
+            params.append(self.filters["bike_type"])
+        if table == "trips":
+            if "station" in self.filters:
+                stations = self.filters["station"]
+                stations = [stations] if isinstance(stations, str) else list(stations)
+                clauses.append(f"start_station_id IN ({', '.join('?' * len(stations))})")
+                params.extend(stations)
+            if "user_type" in self.filters:
+                clauses.append("user_type = ?")
+                params.append(self.filters["user_type"])
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def fetch(self, sql: str, params: Iterable = ()) -> pd.DataFrame:
+        """Run *sql* and return the rows as a DataFrame."""
+        cursor = self.conn.execute(sql, tuple(params))
+        columns = [d[0] for d in cursor.description]
+        rows = cursor.fetchall()
+        if not rows:  # no values to infer from; pandas would give str columns
+            return pd.DataFrame({c: pd.Series(dtype="str") for c in columns})
+        return pd.DataFrame(rows, columns=columns)
+
+    def _rows(self, sql: str, params: Iterable = ()) -> list[tuple]:
+        return self.conn.execute(sql, tuple(params)).fetchall()
+
+    def _counts(self, rows: list[tuple], index: pd.Index, name: str = "count") -> pd.Series:
+        return pd.Series([r[1] for r in rows], index=index, name=name, dtype="int64")
+
+    # ------------------------------------------------------------------
+    # Analytics — same questions as BikeShareSystem, answered in SQL
+    # ------------------------------------------------------------------
+
+    def total_trips_summary(self) -> dict:
+        """Q1: Total trips, total distance, average duration."""
+        where, params = self._where("trips")
+        count, distance, duration = self._rows(
+            f"SELECT COUNT(*), TOTAL(distance_km), AVG(duration_minutes) FROM trips{where}",
+            params)[0]
+        return {
+            "total_trips": count,
+            "total_distance_km": round(distance, 2),
+            "avg_duration_min": round(duration, 2) if duration is not None else float("nan"),
+        }
+
+    def top_start_stations(self, n: int = 10) -> pd.DataFrame:
+        """Q2: Top *n* most popular start stations."""
+        where, params = self._where("trips", "start_station_id IS NOT NULL")
+        return self.fetch(
+            "SELECT s.station_name, c.trip_count FROM ("
+            f"  SELECT start_station_id, COUNT(*) AS trip_count FROM trips{where}"
+            "   GROUP BY start_station_id"
+            "   ORDER BY trip_count DESC, start_station_id LIMIT ?) AS c"
+            " LEFT JOIN stations AS s ON s.station_id = c.start_station_id"
+            " ORDER BY c.trip_count DESC, c.start_station_id",
+            [*params, n]).astype({"trip_count": "int64"})
+
+    def peak_usage_hours(self) -> pd.Series:
+        """Q3: Trip count by hour of day."""
+        where, params = self._where("trips", "start_time IS NOT NULL")
+        rows = self._rows(
+            "SELECT CAST(strftime('%H', start_time, 'unixepoch') AS INTEGER) AS hour,"
+            f" COUNT(*) FROM trips{where} GROUP BY hour ORDER BY hour", params)
+        return self._counts(rows, pd.Index([r[0] for r in rows], name="hour", dtype="int32"))
+
+    def busiest_day_of_week(self) -> pd.Series:
+        """Q4: Trip count by day of week (index sorted by name, as in pandas)."""
+        where, params = self._where("trips", "start_time IS NOT NULL")
+        rows = self._rows(
+            "SELECT CAST(strftime('%w', start_time, 'unixepoch') AS INTEGER) AS dow,"
+            f" COUNT(*) FROM trips{where} GROUP BY dow", params)
+        rows = sorted((_DAY_NAMES[dow], count) for dow, count in rows)
+        return self._counts(rows, pd.Index([r[0] for r in rows], name="day", dtype="str"))
+
+    def avg_distance_by_user_type(self) -> pd.Series:
+        """Q5: Average trip distance grouped by user type."""
+        where, params = self._where("trips", "user_type IS NOT NULL")
+        rows = self._rows(
+            f"SELECT user_type, AVG(distance_km) FROM trips{where}"
+            " GROUP BY user_type ORDER BY user_type", params)
+        return pd.Series([np.nan if r[1] is None else r[1] for r in rows],
+                         index=pd.Index([r[0] for r in rows], name="user_type", dtype="str"),
+                         name="distance_km", dtype="float64").round(2)
+
+    def monthly_trip_trend(self) -> pd.Series:
+        """Q7: Monthly trip counts over time."""
+        where, params = self._where("trips", "start_time IS NOT NULL")
+        rows = self._rows(
+            "SELECT strftime('%Y-%m', start_time, 'unixepoch') AS year_month,"
+            f" COUNT(*) FROM trips{where} GROUP BY year_month ORDER BY year_month", params)
+        index = pd.PeriodIndex([r[0] for r in rows], freq="M", name="year_month")
+        return self._counts(rows, index)
+
+    def top_active_users(self, n: int = 15) -> pd.DataFrame:
+        """Q8: Top *n* most active users by trip count."""
+        where, params = self._where("trips", "user_id IS NOT NULL")
+        return self.fetch(
+            f"SELECT user_id, COUNT(*) AS trip_count FROM trips{where}"
+            " GROUP BY user_id ORDER BY trip_count DESC, user_id LIMIT ?",
+            [*params, n]).astype({"trip_count": "int64"})
+
+    def maintenance_cost_by_bike_type(self) -> pd.Series:
+        """Q9: Total maintenance cost per bike type."""
+        where, params = self._where("maintenance", "bike_type IS NOT NULL")
+        rows = self._rows(
+            f"SELECT bike_type, TOTAL(cost) FROM maintenance{where}"
+            " GROUP BY bike_type ORDER BY bike_type", params)
+        return pd.Series([r[1] for r in rows],
+                         index=pd.Index([r[0] for r in rows], name="bike_type", dtype="str"),
+                         name="cost", dtype="float64").round(2)
+
+    def top_routes(self, n: int = 10) -> pd.DataFrame:
+        """Q10: Most common start→end station pairs."""
+        where, params = self._where(
+            "trips", "start_station_id IS NOT NULL", "end_station_id IS NOT NULL")
+        return self.fetch(
+            "SELECT a.station_name AS start_station_name,"
+            "       b.station_name AS end_station_name, r.trip_count FROM ("
+            "  SELECT start_station_id, end_station_id, COUNT(*) AS trip_count"
+            f"  FROM trips{where} GROUP BY start_station_id, end_station_id"
+            "   ORDER BY trip_count DESC, start_station_id, end_station_id LIMIT ?) AS r"
+            " LEFT JOIN stations AS a ON a.station_id = r.start_station_id"
+            " LEFT JOIN stations AS b ON b.station_id = r.end_station_id"
+            " ORDER BY r.trip_count DESC, r.start_station_id, r.end_station_id",
+            [*params, n]).astype({"trip_count": "int64"})
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main(argv: list[str] | None = None) -> None:
+    from server import ENDPOINTS, load_system
+
+    parser = argparse.ArgumentParser(description="Load CityBike data into SQLite and query it.")
+    parser.add_argument("--db", default=":memory:", help="SQLite file (default in-memory)")
+    parser.add_argument("--data-dir", default=str(DATA_DIR))
+    parser.add_argument("--no-load", action="store_true",
+                        help="query an existing --db instead of reloading it")
+    parser.add_argument("--method", choices=sorted(ENDPOINTS), default=None)
+    parser.add_argument("--n", type=int, default=None)
+    for name in FILTERS:
+        parser.add_argument(f"--{name.replace('_', '-')}", dest=name, default=None)
+    args = parser.parse_args(argv)
+
+    backend = SQLiteSystem(args.db)
+    if not args.no_load:
+        t0 = time.perf_counter()
+        system = load_system(args.data_dir)
+        counts = backend.load(system.trips, system.stations, system.maintenance)
+        print(f"Loaded {counts} into {args.db} in {time.perf_counter() - t0:.2f} s")
+    if args.method is not None:
+        filters = {name: getattr(args, name) for name in FILTERS}
+        if filters["station"] is not None:
+            filters["station"] = filters["station"].split(",")
+        view = backend.filtered(**filters)
+        kwargs = {"n": args.n} if args.n is not None and "n" in ENDPOINTS[args.method] else {}
+        t0 = time.perf_counter()
+        result = getattr(view, args.method)(**kwargs)
+        print(result if not isinstance(result, pd.DataFrame) else result.to_string(index=False))
+        print(f"({(time.perf_counter() - t0) * 1000:.2f} ms)")
+    backend.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,12 +3,28 @@ Unit tests for sorting and searching algorithms.
 
 Covers:
     - merge_sort (fully implemented)
+    - natural_merge_sort
+    - kway_merge
+    - top_k / top_k_indices
+    - counting_sort / radix_sort
+    - parallel_merge_sort
+    - batch_binary_search / batch_range_search
+    - IntervalIndex
     - benchmark_sort (fully implemented)
 """
 
+import numpy as np
 import pytest
 
-from algorithms import merge_sort, benchmark_sort
+from algorithms import (
+    merge_sort, natural_merge_sort, kway_merge, benchmark_sort,
+    batch_binary_search, batch_lower_bound, batch_upper_bound,
+    batch_range_search, benchmark_search,
+    counting_sort, radix_sort, benchmark_integer_sort,
+    parallel_merge_sort, benchmark_parallel_sort,
+    top_k, top_k_indices, IntervalIndex, benchmark_interval_index,
+)
+import algorithms
 
 
 # ---------------------------------------------------------------------------
@@ -74,6 +90,260 @@ class TestMergeSort:
         assert ones == [(1, "a"), (1, "c")]
 
 
+# ---------------------------------------------------------------------------
+# natural_merge_sort
+# ---------------------------------------------------------------------------
+
+class TestNaturalMergeSort:
+
+    def test_empty_and_single(self) -> None:
+        assert natural_merge_sort([]) == []
+        assert natural_merge_sort([7]) == [7]
+
+    def test_matches_sorted_on_random_input(self) -> None:
+        import random
+        random.seed(1)
+        data = [random.randint(0, 50) for _ in range(1000)]
+        assert natural_merge_sort(data) == sorted(data)
+
+    def test_reverse_sorted(self) -> None:
+        assert natural_merge_sort(list(range(100, 0, -1))) == list(range(1, 101))
+
+    def test_nearly_sorted(self) -> None:
+        data = list(range(500))
+        data[100], data[101] = data[101], data[100]
+        data[400], data[250] = data[250], data[400]
+        assert natural_merge_sort(data) == list(range(500))
+
+    def test_stability_across_runs(self) -> None:
+        data = [(i % 3, i) for i in range(200)]
+        result = natural_merge_sort(data, key=lambda x: x[0])
+        assert result == sorted(data, key=lambda x: x[0])
+
+    def test_stability_with_descending_run(self) -> None:
+        data = [(3, "a"), (2, "b"), (1, "c"), (2, "d"), (1, "e")]
+        result = natural_merge_sort(data, key=lambda x: x[0])
+        assert result == [(1, "c"), (1, "e"), (2, "b"), (2, "d"), (3, "a")]
+
+    def test_key_called_once_per_item(self) -> None:
+        calls = []
+
+        def key(x):
+            calls.append(x)
+            return x
+
+        natural_merge_sort([5, 3, 9, 1, 7] * 20, key=key)
+        assert len(calls) == 100
+
+    def test_does_not_modify_original(self) -> None:
+        original = [3, 1, 2]
+        natural_merge_sort(original)
+        assert original == [3, 1, 2]
+
+
+# ---------------------------------------------------------------------------
+# kway_merge
+# ---------------------------------------------------------------------------
+
+class TestKwayMerge:
+
+    def test_merges_sorted_runs(self) -> None:
+        runs = [[(1, "a"), (4, "b")], [(2, "c")], [], [(0, "d"), (5, "e")]]
+        assert [k for k, _ in kway_merge(runs)] == [0, 1, 2, 4, 5]
+
+    def test_stable_on_equal_keys(self) -> None:
+        runs = [[(1, "first")], [(1, "second")], [(1, "third")]]
+        assert [v for _, v in kway_merge(runs)] == ["first", "second", "third"]
+
+    def test_items_never_compared(self) -> None:
+        runs = [[(1, object())], [(1, object())]]
+        assert len(list(kway_merge(runs))) == 2
+
+    def test_accepts_generators(self) -> None:
+        runs = [((i, i) for i in range(0, 10, 2)), ((i, i) for i in range(1, 10, 2))]
+        assert [k for k, _ in kway_merge(runs)] == list(range(10))
+
+
+# ---------------------------------------------------------------------------
+# top_k / top_k_indices
+# ---------------------------------------------------------------------------
+
+class TestTopK:
+
+    def test_largest_first(self) -> None:
+        assert top_k([5, 1, 9, 3, 7], 3) == [9, 7, 5]
+
+    def test_ties_keep_arrival_order(self) -> None:
+        items = [("a", 2), ("b", 3), ("c", 2), ("d", 3), ("e", 2)]
+        assert top_k(items, 3, key=lambda x: x[1]) == [("b", 3), ("d", 3), ("a", 2)]
+
+    def test_consumes_generator(self) -> None:
+        assert top_k((x % 7 for x in range(100)), 2) == [6, 6]
+
+    def test_k_edge_cases(self) -> None:
+        assert top_k([1, 2], 0) == []
+        assert top_k([1, 2], 5) == [2, 1]
+
+    def test_indices_match_full_sort(self) -> None:
+        rng = np.random.default_rng(3)
+        values = rng.integers(0, 10, 500)
+        expected = sorted(range(500), key=lambda i: (-values[i], i))[:20]
+        assert top_k_indices(values, 20).tolist() == expected
+
+    def test_indices_tiebreak_by_label(self) -> None:
+        counts = np.array([4, 7, 4, 4])
+        labels = np.array(["S3", "S9", "S1", "S2"], dtype=object)
+        assert top_k_indices(counts, 3, tiebreak=labels).tolist() == [1, 2, 3]
+
+    def test_indices_with_key(self) -> None:
+        values = np.array([-5, 2, 4, -1])
+        assert top_k_indices(values, 2, key=np.abs).tolist() == [0, 2]
+
+    def test_indices_k_larger_than_n(self) -> None:
+        assert top_k_indices([1, 3, 2], 10).tolist() == [1, 2, 0]
+        assert top_k_indices([], 3).tolist() == []
+
+
+# ---------------------------------------------------------------------------
+# counting_sort / radix_sort
+# ---------------------------------------------------------------------------
+
+class TestIntegerSorts:
+
+    def test_counting_sort_permutation(self) -> None:
+        keys = np.array([3, -1, 2, -1, 0])
+        perm = counting_sort(keys)
+        assert keys[perm].tolist() == [-1, -1, 0, 2, 3]
+        assert perm[:2].tolist() == [1, 3]
+
+    def test_counting_sort_rejects_wide_range(self) -> None:
+        with pytest.raises(ValueError, match="radix_sort"):
+            counting_sort([0, 1 << 20])
+
+    def test_rejects_non_integer_keys(self) -> None:
+        with pytest.raises(ValueError, match="integers"):
+            radix_sort([1.5, 2.0])
+
+    def test_empty(self) -> None:
+        assert counting_sort([]).tolist() == []
+        assert radix_sort([]).tolist() == []
+
+    @pytest.mark.parametrize("bits", [1, 8, 16])
+    def test_radix_matches_stable_argsort(self, bits: int) -> None:
+        rng = np.random.default_rng(bits)
+        keys = rng.integers(-(2**40), 2**40, 2_000)
+        keys[::7] = keys[0]  # plenty of ties
+        expected = np.argsort(keys, kind="stable")
+        assert np.array_equal(radix_sort(keys, bits=bits), expected)
+
+    def test_radix_full_int64_range(self) -> None:
+        keys = np.array([np.iinfo(np.int64).max, np.iinfo(np.int64).min, 0])
+        assert radix_sort(keys).tolist() == [1, 2, 0]
+
+    def test_radix_rejects_bad_bits(self) -> None:
+        with pytest.raises(ValueError):
+            radix_sort([1, 2], bits=17)
+
+    def test_benchmark_integer_sort_keys(self) -> None:
+        result = benchmark_integer_sort(np.arange(1000)[::-1], repeats=1)
+        assert {"radix_sort_ms", "np_argsort_ms", "counting_sort_ms",
+                "builtin_sorted_ms"} <= set(result)
+        wide = benchmark_integer_sort([0, 1 << 40], repeats=1, include_builtin=False)
+        assert "counting_sort_ms" not in wide
+        assert "builtin_sorted_ms" not in wide
+
+
+# ---------------------------------------------------------------------------
+# parallel_merge_sort
+# ---------------------------------------------------------------------------
+
+class TestParallelMergeSort:
+
+    @pytest.fixture(autouse=True)
+    def small_threshold(self, monkeypatch) -> None:
+        monkeypatch.setattr(algorithms, "PARALLEL_SORT_MIN_KEYS", 10)
+
+    @pytest.mark.parametrize("n, workers", [(1_000, 1), (5_000, 2), (5_001, 3)])
+    def test_matches_stable_argsort(self, n: int, workers: int) -> None:
+        keys = np.random.default_rng(n).integers(0, 50, n)  # many ties
+        perm = parallel_merge_sort(keys, max_workers=workers)
+        assert np.array_equal(perm, np.argsort(keys, kind="stable"))
+
+    def test_float_keys(self) -> None:
+        keys = np.random.default_rng(1).random(3_000)
+        perm = parallel_merge_sort(keys, max_workers=2)
+        assert np.all(np.diff(keys[perm]) >= 0)
+
+    def test_more_workers_than_keys(self) -> None:
+        keys = np.array([5, 1, 4, 1, 3, 9, 2, 6, 5, 3, 5, 8])
+        perm = parallel_merge_sort(keys, max_workers=16)
+        assert np.array_equal(perm, np.argsort(keys, kind="stable"))
+
+    def test_trivial_inputs(self) -> None:
+        assert parallel_merge_sort([]).tolist() == []
+        assert parallel_merge_sort([7]).tolist() == [0]
+
+    def test_rejects_bad_input(self) -> None:
+        with pytest.raises(ValueError):
+            parallel_merge_sort(["b", "a"])
+        with pytest.raises(ValueError):
+            parallel_merge_sort([2, 1], max_workers=0)
+
+    def test_speedup_curve(self) -> None:
+        result = benchmark_parallel_sort(np.arange(2_000)[::-1], max_workers=2)
+        assert result["workers"] == [1, 2]
+        assert len(result["ms"]) == 2
+        assert result["speedup"][0] == 1.0
+
+
+# ---------------------------------------------------------------------------
+# batched binary search
+# ---------------------------------------------------------------------------
+
+class TestBatchBinarySearch:
+
+    keys = np.array([1, 3, 3, 3, 7, 9])
+
+    def test_finds_first_occurrence(self) -> None:
+        pos, found = batch_binary_search(self.keys, np.array([3, 9, 1]))
+        assert pos.tolist() == [1, 5, 0]
+        assert found.all()
+
+    def test_missing_targets(self) -> None:
+        pos, found = batch_binary_search(self.keys, np.array([0, 4, 10]))
+        assert pos.tolist() == [-1, -1, -1]
+        assert not found.any()
+
+    def test_empty_keys(self) -> None:
+        pos, found = batch_binary_search(np.array([]), np.array([1.0]))
+        assert pos.tolist() == [-1]
+        assert not found.any()
+
+    def test_bounds(self) -> None:
+        assert batch_lower_bound(self.keys, np.array([3])).tolist() == [1]
+        assert batch_upper_bound(self.keys, np.array([3])).tolist() == [4]
+
+    def test_range_search_is_inclusive(self) -> None:
+        starts, ends = batch_range_search(self.keys, np.array([3, 4, 8]), np.array([7, 6, 2]))
+        assert (ends - starts).tolist() == [4, 0, 0]
+        assert self.keys[starts[0]:ends[0]].tolist() == [3, 3, 3, 7]
+
+    def test_matches_scalar_search(self) -> None:
+        rng = np.random.default_rng(0)
+        keys = np.sort(rng.integers(0, 100, 500))
+        targets = rng.integers(-5, 105, 200)
+        pos, found = batch_binary_search(keys, targets)
+        for t, p, f in zip(targets, pos, found):
+            assert f == (t in keys)
+            if f:
+                assert p == keys.tolist().index(t)
+
+    def test_benchmark_search_batch(self) -> None:
+        result = benchmark_search(list(range(100)), 5, repeats=1, targets=[5, 50, 500])
+        assert "batch_binary_search_ms" in result
+        assert "builtin_bisect_ms" in result
+
+
 # ---------------------------------------------------------------------------
 # benchmark_sort
 # ---------------------------------------------------------------------------
@@ -83,8 +353,13 @@ class TestBenchmarkSort:
     def test_returns_dict_with_expected_keys(self) -> None:
         result = benchmark_sort([5, 3, 1, 4, 2], repeats=1)
         assert "merge_sort_ms" in result
+        assert "natural_merge_sort_ms" in result
         assert "builtin_sorted_ms" in result
 
+    def test_integer_keys_add_radix_timings(self) -> None:
+        assert "radix_sort_ms" in benchmark_sort([3, 1, 2], repeats=1)
+        assert "radix_sort_ms" not in benchmark_sort(["b", "a"], repeats=1)
+
     def test_timings_are_positive(self) -> None:
         result = benchmark_sort(list(range(100, 0, -1)), repeats=2)
         assert result["merge_sort_ms"] > 0
@@ -94,3 +369,73 @@ class TestBenchmarkSort:
         data = ["bb", "a", "ccc"]
         result = benchmark_sort(data, key=len, repeats=1)
         assert isinstance(result["merge_sort_ms"], float)
+
+
+# ---------------------------------------------------------------------------
+# IntervalIndex
+# ---------------------------------------------------------------------------
+
+class TestIntervalIndex:
+
+    @staticmethod
+    def brute(starts, ends, lo, hi) -> list[int]:
+        return np.flatnonzero((starts <= hi) & (ends >= lo)).tolist()
+
+    @pytest.fixture
+    def intervals(self) -> tuple[np.ndarray, np.ndarray]:
+        rng = np.random.default_rng(7)
+        starts = rng.integers(0, 1_000, 600)
+        return starts, starts + rng.integers(0, 60, 600)
+
+    @pytest.mark.parametrize("leaf_size", [1, 8, 64])
+    def test_points_match_brute_force(self, intervals, leaf_size: int) -> None:
+        starts, ends = intervals
+        index = IntervalIndex(starts, ends, leaf_size=leaf_size)
+        for p in range(-10, 1_080, 37):
+            assert index.overlap_point(p).tolist() == self.brute(starts, ends, p, p)
+
+    def test_ranges_batched(self, intervals) -> None:
+        starts, ends = intervals
+        index = IntervalIndex(starts, ends, leaf_size=4)
+        los = np.array([-5, 100, 500, 990, 2_000])
+        his = los + np.array([0, 10, 200, 50, 10])
+        offsets, ids = index.overlap_ranges(los, his)
+        assert len(offsets) == len(los) + 1
+        for i, (lo, hi) in enumerate(zip(los, his)):
+            assert ids[offsets[i]:offsets[i + 1]].tolist() == self.brute(starts, ends, lo, hi)
+
+    def test_counts(self, intervals) -> None:
+        starts, ends = intervals
+        index = IntervalIndex(starts, ends)
+        points = np.arange(0, 1_000, 50)
+        expected = [len(self.brute(starts, ends, p, p)) for p in points]
+        assert index.count_points(points).tolist() == expected
+        offsets, _ = index.overlap_points(points)
+        assert np.diff(offsets).tolist() == expected
+
+    def test_endpoints_are_inclusive(self) -> None:
+        index = IntervalIndex([0, 5], [5, 10])
+        assert index.overlap_point(5).tolist() == [0, 1]
+        assert index.overlap_range(10, 20).tolist() == [1]
+
+    def test_datetime_intervals(self) -> None:
+        starts = np.array(["2024-03-01T08:00", "2024-03-01T08:10"], dtype="datetime64[s]")
+        ends = np.array(["2024-03-01T08:20", "2024-03-01T08:12"], dtype="datetime64[s]")
+        index = IntervalIndex(starts, ends)
+        assert index.overlap_point(np.datetime64("2024-03-01T08:15")).tolist() == [0]
+        assert index.overlap_range("2024-03-01T08:11", "2024-03-01T09:00").tolist() == [0, 1]
+
+    def test_empty_index(self) -> None:
+        index = IntervalIndex([], [])
+        assert index.overlap_point(3).tolist() == []
+        assert index.count_points([1, 2]).tolist() == [0, 0]
+
+    def test_rejects_end_before_start(self) -> None:
+        with pytest.raises(ValueError, match="end before start"):
+            IntervalIndex([0, 5], [1, 4])
+
+    def test_benchmark_keys(self, intervals) -> None:
+        starts, ends = intervals
+        result = benchmark_interval_index(starts, ends, [10, 500], repeats=1)
+        assert {"build_ms", "tree_query_ms", "tree_batch_ms",
+                "count_ms", "brute_force_ms"} == set(result)
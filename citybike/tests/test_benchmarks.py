@@ -0,0 +1,168 @@
+"""
+Unit tests for the benchmark suite.
+
+Covers:
+    - make_dataset
+    - measure
+    - run_suite
+    - compare_backends (pandas vs SQLite)
+    - compare_to_baseline and the CLI exit status
+"""
+
+import json
+
+import pytest
+
+import analyzer
+import benchmarks
+from benchmarks import (
+    ANALYTICS_METHODS,
+    WINDOW_METHODS,
+    compare_backends,
+    compare_to_baseline,
+    main,
+    make_dataset,
+    measure,
+    run_suite,
+)
+from generate_data import REALISTIC_DEMAND
+
+
+def report(*rows) -> dict:
+    return {"meta": {}, "results": [
+        {"case": case, "n_trips": n, "median_ms": ms} for case, n, ms in rows
+    ]}
+
+
+# ---------------------------------------------------------------------------
+# make_dataset
+# ---------------------------------------------------------------------------
+
+class TestMakeDataset:
+
+    def test_shapes_and_messiness(self) -> None:
+        trips, stations, maintenance = make_dataset(1_000, seed=1)
+        assert len(trips) > 1_000  # duplicates appended
+        assert trips["trip_id"].duplicated().any()
+        assert trips["duration_minutes"].isna().any()
+        assert len(stations) == 15
+        assert len(maintenance) == 200
+        assert set(trips["start_station_id"]) <= set(stations["station_id"])
+
+    def test_realistic_demand(self) -> None:
+        uniform, _, _ = make_dataset(2_000, seed=1)
+        skewed, _, _ = make_dataset(2_000, seed=1, demand=REALISTIC_DEMAND)
+        assert skewed["start_station_id"].value_counts().iloc[0] > \
+            uniform["start_station_id"].value_counts().iloc[0]
+
+    def test_deterministic(self) -> None:
+        a, _, _ = make_dataset(500, seed=4)
+        b, _, _ = make_dataset(500, seed=4)
+        assert a.equals(b)
+
+
+# ---------------------------------------------------------------------------
+# measure
+# ---------------------------------------------------------------------------
+
+class TestMeasure:
+
+    def test_statistics(self) -> None:
+        stats = measure(lambda: sum(range(1_000)), repeats=4)
+        assert stats["repeats"] == 4
+        assert stats["min_ms"] <= stats["median_ms"]
+        assert stats["iqr_ms"] >= 0
+        assert stats["peak_mb"] is not None
+
+    def test_setup_runs_before_each_call(self) -> None:
+        calls = []
+        measure(lambda x: calls.append(x), setup=lambda: (1,), repeats=3,
+                warmup=1, memory=False)
+        assert calls == [1, 1, 1, 1]
+
+    def test_rejects_zero_repeats(self) -> None:
+        with pytest.raises(ValueError):
+            measure(lambda: None, repeats=0)
+
+
+# ---------------------------------------------------------------------------
+# run_suite
+# ---------------------------------------------------------------------------
+
+class TestRunSuite:
+
+    def test_runs_every_analytics_method(self) -> None:
+        result = run_suite(sizes=(500,), repeats=1, case_filter=["analytics."],
+                           memory=False)
+        cases = {r["case"] for r in result["results"]}
+        assert cases == {f"analytics.{m}" for m in ANALYTICS_METHODS}
+        assert "numpy" in result["meta"]
+
+    def test_runs_sql_and_window_cases(self) -> None:
+        result = run_suite(sizes=(500,), repeats=1, case_filter=["sql.", "window."],
+                           memory=False)
+        cases = {r["case"] for r in result["results"]}
+        assert {f"sql.{m}" for m in ANALYTICS_METHODS} | {"sql.load"} <= cases
+        assert {f"window.sql.{m}" for m in WINDOW_METHODS} <= cases
+        assert {f"window.pandas.{m}" for m in WINDOW_METHODS} <= cases
+
+    def test_does_not_touch_data_files(self, monkeypatch) -> None:
+        monkeypatch.setattr(analyzer, "DATA_DIR", None)  # any export would fail
+        result = run_suite(sizes=(500,), repeats=1, case_filter=["clean."],
+                           memory=False)
+        assert [r["case"] for r in result["results"]] == ["clean.clean_data"]
+
+    def test_size_limits_skip_slow_cases(self, monkeypatch) -> None:
+        monkeypatch.setitem(benchmarks.SIZE_LIMITS, "search.linear_search", 100)
+        result = run_suite(sizes=(500,), repeats=1, case_filter=["search."],
+                           memory=False)
+        cases = {r["case"] for r in result["results"]}
+        assert "search.linear_search" not in cases
+        assert "search.batch_binary_search" in cases
+
+
+# ---------------------------------------------------------------------------
+# compare_to_baseline / CLI
+# ---------------------------------------------------------------------------
+
+class TestCompareBackends:
+
+    def test_pairs_pandas_and_sql_cases(self) -> None:
+        rows = compare_backends(report(
+            ("analytics.top_routes", 10, 8.0), ("sql.top_routes", 10, 2.0),
+            ("window.pandas.top_routes", 10, 3.0), ("window.sql.top_routes", 10, 6.0),
+            ("analytics.peak_usage_hours", 10, 1.0), ("sql.peak_usage_hours", 100, 1.0),
+            ("sql.load", 10, 50.0),
+        ))
+        assert [(r["question"], r["speedup"]) for r in rows] == [
+            ("top_routes", 4.0), ("window.top_routes", 0.5)]
+
+
+class TestCompareToBaseline:
+
+    def test_flags_slowdown_beyond_threshold(self) -> None:
+        baseline = report(("a", 10, 10.0), ("b", 10, 10.0))
+        current = report(("a", 10, 13.0), ("b", 10, 12.0))
+        regressions = compare_to_baseline(current, baseline, threshold=0.25)
+        assert [r["case"] for r in regressions] == ["a"]
+        assert regressions[0]["ratio"] == 1.3
+
+    def test_ignores_unmatched_and_tiny_cases(self) -> None:
+        baseline = report(("a", 10, 0.01), ("b", 10, 5.0))
+        current = report(("a", 10, 0.5), ("b", 100, 50.0))
+        assert compare_to_baseline(current, baseline) == []
+
+    def test_cli_exit_status(self, tmp_path, monkeypatch) -> None:
+        out = tmp_path / "out.json"
+        baseline = tmp_path / "baseline.json"
+        args = ["--sizes", "500", "--repeats", "1", "--no-memory",
+                "--cases", "numerical.calculate_fares", "--output", str(out),
+                "--baseline", str(baseline)]
+
+        baseline.write_text(json.dumps(report(("numerical.calculate_fares", 500, 1e3))))
+        assert main(args) == 0
+        assert json.loads(out.read_text())["results"][0]["n_trips"] == 500
+
+        monkeypatch.setattr(benchmarks, "MIN_COMPARABLE_MS", 0.0)
+        baseline.write_text(json.dumps(report(("numerical.calculate_fares", 500, 1e-9))))
+        assert main(args) == 1
@@ -0,0 +1,117 @@
+"""
+Unit tests for the monthly billing engine.
+
+Covers:
+    - daily caps, day passes (used up across months) and tier discounts
+    - batching / streaming of invoices
+"""
+
+import pandas as pd
+import pytest
+
+from billing import (
+    DAILY_CAPS,
+    INVOICE_COLUMNS,
+    compute_invoices,
+    iter_invoice_batches,
+    write_invoices,
+)
+
+
+def make_trips(rows: list[tuple]) -> pd.DataFrame:
+    return pd.DataFrame(rows, columns=[
+        "user_id", "user_type", "start_time", "duration_minutes", "distance_km",
+    ]).assign(start_time=lambda df: pd.to_datetime(df["start_time"]))
+
+
+class TestComputeInvoices:
+
+    def test_one_invoice_per_user_and_month(self) -> None:
+        trips = make_trips([
+            ("U1", "member", "2024-01-02 12:00:00", 10.0, 2.0),
+            ("U1", "member", "2024-01-20 12:00:00", 10.0, 2.0),
+            ("U1", "member", "2024-02-01 12:00:00", 10.0, 2.0),
+            ("U2", "casual", "2024-01-02 12:00:00", 20.0, 5.0),
+        ])
+        invoices = compute_invoices(trips)
+        assert list(invoices.columns) == INVOICE_COLUMNS
+        assert list(zip(invoices["user_id"], invoices["month"])) == [
+            ("U1", "2024-01"), ("U1", "2024-02"), ("U2", "2024-01"),
+        ]
+        assert invoices["trips"].tolist() == [2, 1, 1]
+        assert invoices["ride_days"].tolist() == [2, 1, 1]
+        # member: 0.08*10 + 0.05*2 = 0.90 per trip
+        assert invoices["total"].tolist() == pytest.approx([1.80, 0.90, 4.50])
+
+    def test_daily_cap(self) -> None:
+        trips = make_trips([
+            ("U1", "casual", "2024-01-02 11:00:00", 60.0, 10.0),
+            ("U1", "casual", "2024-01-02 13:00:00", 60.0, 10.0),
+        ])
+        invoice = compute_invoices(trips).iloc[0]
+        assert invoice["gross"] == pytest.approx(22.0)
+        assert invoice["total"] == pytest.approx(DAILY_CAPS["casual"])
+        assert invoice["cap_credit"] == pytest.approx(22.0 - DAILY_CAPS["casual"])
+
+    def test_day_pass_waives_most_expensive_day(self) -> None:
+        trips = make_trips([
+            ("U1", "casual", "2024-01-02 12:00:00", 20.0, 5.0),  # 4.50
+            ("U1", "casual", "2024-01-03 12:00:00", 40.0, 5.0),  # 7.50
+        ])
+        users = pd.DataFrame({"user_id": ["U1"], "day_pass_count": [1]})
+        invoice = compute_invoices(trips, users).iloc[0]
+        assert invoice["day_pass_credit"] == pytest.approx(7.50)
+        assert invoice["total"] == pytest.approx(4.50)
+
+    def test_day_passes_are_used_up_across_months(self) -> None:
+        trips = make_trips([
+            ("U1", "casual", "2024-01-02 12:00:00", 20.0, 5.0),  # 4.50
+            ("U1", "casual", "2024-02-02 12:00:00", 40.0, 5.0),  # 7.50
+            ("U1", "casual", "2024-03-02 12:00:00", 40.0, 5.0),  # 7.50
+        ])
+        users = pd.DataFrame({"user_id": ["U1"], "day_pass_count": [1]})
+        invoices = compute_invoices(trips, users)
+        assert invoices["day_pass_credit"].tolist() == pytest.approx([4.50, 0, 0])
+
+    def test_leftover_passes_carry_into_later_months(self) -> None:
+        trips = make_trips([
+            ("U1", "casual", "2024-01-02 12:00:00", 20.0, 5.0),  # 4.50
+            ("U1", "casual", "2024-02-02 12:00:00", 20.0, 5.0),  # 4.50
+            ("U1", "casual", "2024-02-03 12:00:00", 40.0, 5.0),  # 7.50
+            ("U2", "casual", "2024-02-03 12:00:00", 40.0, 5.0),  # 7.50
+        ])
+        users = pd.DataFrame({"user_id": ["U1", "U2"], "day_pass_count": [2, 0]})
+        invoices = compute_invoices(trips, users)
+        assert invoices["day_pass_credit"].tolist() == pytest.approx([4.50, 7.50, 0])
+
+    def test_premium_discount_only_for_members(self) -> None:
+        trips = make_trips([
+            ("U1", "member", "2024-01-02 12:00:00", 100.0, 0.0),  # 8.00
+            ("U2", "casual", "2024-01-02 12:00:00", 20.0, 5.0),
+        ])
+        users = pd.DataFrame({"user_id": ["U1", "U2"], "tier": ["premium", "premium"]})
+        invoices = compute_invoices(trips, users).set_index("user_id")
+        assert invoices.loc["U1", "discount"] == pytest.approx(1.60)
+        assert invoices.loc["U1", "total"] == pytest.approx(6.40)
+        assert invoices.loc["U2", "discount"] == 0
+
+
+class TestStreaming:
+
+    def test_batches_cover_all_users(self) -> None:
+        trips = make_trips([
+            (f"U{i}", "member", "2024-01-02 12:00:00", 10.0, 2.0) for i in range(7)
+        ])
+        batches = list(iter_invoice_batches(trips, users_per_batch=3))
+        assert [len(b) for b in batches] == [3, 3, 1]
+
+    def test_write_invoices(self, tmp_path) -> None:
+        trips = make_trips([
+            ("U1", "member", "2024-01-02 12:00:00", 10.0, 2.0),
+            ("U2", "casual", "2024-03-02 12:00:00", 10.0, 2.0),
+        ])
+        path = tmp_path / "invoices.csv"
+        assert write_invoices(trips, path, users_per_batch=1) == 2
+        written = pd.read_csv(path)
+        assert list(written.columns) == INVOICE_COLUMNS
+        assert written["user_id"].tolist() == ["U1", "U2"]
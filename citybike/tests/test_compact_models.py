@@ -0,0 +1,140 @@
+"""
+Unit tests for the slotted model variants (compact_models.py).
+
+Covers:
+    - no per-instance __dict__
+    - validation, str and repr parity with models.py
+    - lazy created_at
+    - benchmark_models
+"""
+
+import pytest
+from datetime import datetime
+
+import compact_models
+import models
+from compact_models import (
+    ClassicBike,
+    ElectricBike,
+    Entity,
+    MaintenanceRecord,
+    MemberUser,
+    Station,
+    Trip,
+    CasualUser,
+    benchmark_models,
+)
+
+
+class TestSlots:
+
+    @pytest.mark.parametrize("obj", [
+        ClassicBike("BK1"),
+        ElectricBike("BK2"),
+        Station("ST1", "Central", 10, 48.8, 9.2),
+        CasualUser("U1", "Ann", "ann@example.com"),
+    ])
+    def test_no_instance_dict(self, obj) -> None:
+        assert not hasattr(obj, "__dict__")
+        with pytest.raises(AttributeError):
+            obj.unexpected = 1
+
+    def test_trip_has_no_dict_and_duration(self) -> None:
+        bike = ClassicBike("BK1")
+        station = Station("ST1", "Central", 10, 48.8, 9.2)
+        user = CasualUser("U1", "Ann", "ann@example.com")
+        trip = Trip("TR1", user, bike, station, station,
+                    datetime(2024, 1, 1, 8, 0), datetime(2024, 1, 1, 8, 30), 2.0)
+        assert not hasattr(trip, "__dict__")
+        assert trip.duration_minutes == pytest.approx(30.0)
+
+
+class TestValidation:
+
+    def test_entity_is_abstract(self) -> None:
+        with pytest.raises(TypeError):
+            Entity(id="E1")  # type: ignore[abstract]
+
+    def test_rejects_empty_id(self) -> None:
+        with pytest.raises(ValueError):
+            ClassicBike("")
+
+    def test_rejects_bad_battery(self) -> None:
+        with pytest.raises(ValueError):
+            ElectricBike("BK1", battery_level=120)
+
+    def test_rejects_bad_station(self) -> None:
+        with pytest.raises(ValueError):
+            Station("ST1", "Central", 10, 91.0, 9.2)
+
+    def test_rejects_bad_member_tier(self) -> None:
+        with pytest.raises(ValueError):
+            MemberUser("U1", "Ann", "ann@example.com",
+                       datetime(2024, 1, 1), datetime(2025, 1, 1), tier="gold")
+
+    def test_rejects_negative_cost(self) -> None:
+        with pytest.raises(ValueError):
+            MaintenanceRecord("MR1", ClassicBike("BK1"), datetime(2024, 1, 1),
+                              "tire_repair", -1.0)
+
+    def test_status_setter(self) -> None:
+        bike = ClassicBike("BK1")
+        bike.status = "in_use"
+        assert str(bike.status) == "in_use"
+        with pytest.raises(ValueError, match="Invalid status"):
+            bike.status = "lost"
+
+
+class TestParity:
+
+    @pytest.mark.parametrize("name, args", [
+        ("ClassicBike", ("",)),
+        ("ClassicBike", ("BK1", 0)),
+        ("ElectricBike", ("BK1", 50.0, -1.0)),
+        ("Station", ("ST1", "Central", 0, 48.8, 9.2)),
+        ("Station", ("ST1", "Central", 10, 48.8, 200.0)),
+        ("CasualUser", ("U1", "Ann", "ann.example.com")),
+        ("CasualUser", ("U1", "Ann", "ann@example.com", -1)),
+        ("MemberUser", ("U1", "Ann", "a@x.com", datetime(2025, 1, 1), datetime(2024, 1, 1))),
+        ("MaintenanceRecord", ("MR1", None, datetime(2024, 1, 1), "repaint", 1.0)),
+    ])
+    def test_same_errors(self, name, args) -> None:
+        with pytest.raises(ValueError) as expected:
+            getattr(models, name)(*args)
+        with pytest.raises(ValueError, match=str(expected.value)):
+            getattr(compact_models, name)(*args)
+
+    @pytest.mark.parametrize("name, args", [
+        ("ClassicBike", ("BK1", 21, "in_use")),
+        ("ElectricBike", ("BK2", 42.0)),
+        ("Station", ("ST1", "Central", 10, 48.8, 9.2)),
+        ("CasualUser", ("U1", "Ann", "ann@example.com", 2)),
+    ])
+    def test_same_str_and_repr(self, name, args) -> None:
+        compact, regular = getattr(compact_models, name)(*args), getattr(models, name)(*args)
+        assert (str(compact), repr(compact)) == (str(regular), repr(regular))
+
+
+class TestCreatedAt:
+
+    def test_explicit_created_at(self) -> None:
+        ts = datetime(2024, 6, 15, 12, 0)
+        bike = ClassicBike.__new__(ClassicBike)
+        Entity.__init__(bike, id="BK1", created_at=ts)
+        assert bike.created_at == ts
+
+    def test_lazy_created_at_is_stable(self) -> None:
+        bike = ClassicBike("BK1")
+        first = bike.created_at
+        assert isinstance(first, datetime)
+        assert bike.created_at is first
+
+
+class TestBenchmarkModels:
+
+    def test_reports_every_class(self) -> None:
+        result = benchmark_models(n=200)
+        assert set(result) >= {"ClassicBike", "Station", "Trip", "MaintenanceRecord"}
+        for row in result.values():
+            assert row["slots_bytes"] < row["dict_bytes"]
+            assert row["slots_per_sec"] > 0
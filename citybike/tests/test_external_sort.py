@@ -0,0 +1,71 @@
+"""
+Unit tests for the external CSV sort.
+"""
+
+import csv
+import random
+
+import pytest
+
+from external_sort import external_sort_csv
+
+
+def write_trips(path, rows) -> None:
+    with open(path, "w", newline="") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(["trip_id", "bike_id", "start_time", "distance_km"])
+        writer.writerows(rows)
+
+
+def read_rows(path) -> list[list[str]]:
+    with open(path, newline="") as fh:
+        return list(csv.reader(fh))
+
+
+@pytest.fixture
+def trips_csv(tmp_path):
+    random.seed(3)
+    rows = [
+        [f"TR{i}", f"BK{random.randint(200, 220)}",
+         f"2024-01-{random.randint(1, 28):02d} {random.randint(0, 23):02d}:00:00",
+         f"{random.uniform(0.5, 15):.2f}"]
+        for i in range(2000)
+    ]
+    path = tmp_path / "trips.csv"
+    write_trips(path, rows)
+    return path, rows
+
+
+class TestExternalSortCsv:
+
+    def test_sorts_by_timestamp_with_many_runs(self, trips_csv, tmp_path) -> None:
+        src, rows = trips_csv
+        dst = tmp_path / "sorted.csv"
+        stats = external_sort_csv(src, dst, "start_time", memory_mb=0.02,
+                                  block_rows=50, tmp_dir=tmp_path)
+        assert stats["rows"] == 2000
+        assert stats["runs"] > 1
+        out = read_rows(dst)
+        assert out[0] == ["trip_id", "bike_id", "start_time", "distance_km"]
+        assert out[1:] == sorted(rows, key=lambda r: r[2])  # stable
+
+    def test_multi_pass_merge(self, trips_csv, tmp_path) -> None:
+        src, rows = trips_csv
+        dst = tmp_path / "sorted.csv"
+        stats = external_sort_csv(src, dst, "bike_id", memory_mb=0.01,
+                                  fan_in=2, tmp_dir=tmp_path)
+        assert stats["merge_passes"] > 1
+        assert read_rows(dst)[1:] == sorted(rows, key=lambda r: r[1])
+
+    def test_numeric_key_with_missing_values(self, tmp_path) -> None:
+        src = tmp_path / "in.csv"
+        write_trips(src, [["T1", "B", "t", "10.5"], ["T2", "B", "t", ""],
+                          ["T3", "B", "t", "2.0"]])
+        dst = tmp_path / "out.csv"
+        external_sort_csv(src, dst, "distance_km", key_type="float")
+        assert [r[0] for r in read_rows(dst)[1:]] == ["T3", "T1", "T2"]
+
+    def test_unknown_column_raises(self, trips_csv, tmp_path) -> None:
+        src, _ = trips_csv
+        with pytest.raises(ValueError, match="not in header"):
+            external_sort_csv(src, tmp_path / "out.csv", "nope")
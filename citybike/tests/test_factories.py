@@ -3,12 +3,22 @@ Unit tests for the factory module.
 
 Covers:
     - create_bike (fully implemented)
+    - bulk factories and the IdentityMap
 """
 
+import pandas as pd
 import pytest
 
-from factories import create_bike
-from models import ClassicBike, ElectricBike, Bike
+from factories import (
+    IdentityMap,
+    create_bike,
+    create_bikes_bulk,
+    create_maintenance_records_bulk,
+    create_stations_bulk,
+    create_trips_bulk,
+    create_users_bulk,
+)
+from models import ClassicBike, ElectricBike, Bike, CasualUser, MemberUser
 
 
 # ---------------------------------------------------------------------------
@@ -58,3 +68,133 @@ class TestCreateBike:
     def test_result_is_bike_instance(self) -> None:
         bike = create_bike({"bike_id": "BK008", "bike_type": "electric"})
         assert isinstance(bike, Bike)
+
+
+# ---------------------------------------------------------------------------
+# Bulk factories
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def stations() -> pd.DataFrame:
+    return pd.DataFrame({
+        "station_id": ["ST100", "ST101"],
+        "station_name": ["Central", "Harbor"],
+        "capacity": [20, 15],
+        "latitude": [48.8, 48.9],
+        "longitude": [9.2, 9.3],
+    })
+
+
+@pytest.fixture
+def trips() -> pd.DataFrame:
+    return pd.DataFrame({
+        "trip_id": ["TR1", "TR2", "TR3"],
+        "user_id": ["U1", "U1", "U2"],
+        "user_type": ["casual", "casual", "member"],
+        "bike_id": ["BK1", "BK2", "BK1"],
+        "bike_type": ["classic", "electric", "classic"],
+        "start_station_id": ["ST100", "ST101", "ST100"],
+        "end_station_id": ["ST101", "ST100", "ST100"],
+        "start_time": ["2024-01-01 08:00:00", "2024-01-01 09:00:00",
+                       "2024-01-02 10:00:00"],
+        "end_time": ["2024-01-01 08:20:00", "2024-01-01 09:30:00",
+                     "2024-01-02 10:05:00"],
+        "distance_km": [3.0, 5.5, 1.0],
+    })
+
+
+class TestBulkFactories:
+
+    def test_trips_share_interned_objects(self, trips, stations) -> None:
+        identity_map = IdentityMap()
+        result = create_trips_bulk(trips, stations, identity_map)
+        assert [t.trip_id for t in result] == ["TR1", "TR2", "TR3"]
+        assert result[0].user is result[1].user
+        assert result[0].bike is result[2].bike
+        assert result[0].end_station is result[1].start_station
+        assert len(identity_map.users) == 2
+        assert len(identity_map.bikes) == 2
+        assert result[1].duration_minutes == pytest.approx(30.0)
+
+    def test_user_subclasses(self, trips) -> None:
+        users = create_users_bulk(trips[["user_id", "user_type"]])
+        assert isinstance(users[0], CasualUser)
+        assert isinstance(users[2], MemberUser)
+
+    def test_bike_subclasses(self, trips) -> None:
+        bikes = create_bikes_bulk(trips[["bike_id", "bike_type"]])
+        assert isinstance(bikes[0], ClassicBike)
+        assert isinstance(bikes[1], ElectricBike)
+
+    def test_invalid_rows_reported(self, trips, stations) -> None:
+        trips.loc[[0, 2], "distance_km"] = -1.0
+        with pytest.raises(ValueError, match=r"distance_km must be non-negative at rows \[0, 2\]"):
+            create_trips_bulk(trips, stations)
+
+    def test_time_order_checked(self, trips, stations) -> None:
+        trips.loc[1, "end_time"] = "2024-01-01 08:00:00"
+        with pytest.raises(ValueError, match=r"end_time must be after start_time at rows \[1\]"):
+            create_trips_bulk(trips, stations)
+
+    def test_unknown_station_reported(self, trips, stations) -> None:
+        with pytest.raises(ValueError, match=r"Unknown start_station_id at rows \[1\]"):
+            create_trips_bulk(trips, stations.iloc[:1])
+
+    def test_invalid_capacity_reported(self, stations) -> None:
+        stations.loc[1, "capacity"] = 0
+        with pytest.raises(ValueError, match="capacity must be positive"):
+            create_stations_bulk(stations)
+
+    def test_maintenance_reuses_trip_bikes(self, trips, stations) -> None:
+        identity_map = IdentityMap()
+        trip_objs = create_trips_bulk(trips, stations, identity_map)
+        maintenance = pd.DataFrame({
+            "record_id": ["MR1", "MR2"],
+            "bike_id": ["BK1", "BK9"],
+            "bike_type": ["classic", "electric"],
+            "date": ["2024-01-05", "2024-01-06"],
+            "maintenance_type": ["tire_repair", "battery_replacement"],
+            "cost": [20.0, 150.0],
+        })
+        records = create_maintenance_records_bulk(maintenance, identity_map)
+        assert records[0].bike is trip_objs[0].bike
+        assert isinstance(records[1].bike, ElectricBike)
+
+    def test_maintenance_invalid_type(self) -> None:
+        maintenance = pd.DataFrame({
+            "record_id": ["MR1"], "bike_id": ["BK1"], "bike_type": ["classic"],
+            "date": ["2024-01-05"], "maintenance_type": ["paint"], "cost": [5.0],
+        })
+        with pytest.raises(ValueError, match="maintenance_type must be one of"):
+            create_maintenance_records_bulk(maintenance)
+
+
+class TestTrustedBulkFactories:
+
+    def test_trusted_matches_strict(self, trips, stations) -> None:
+        strict = create_trips_bulk(trips, stations)
+        trusted = create_trips_bulk(trips, stations, trusted=True)
+        for a, b in zip(strict, trusted):
+            assert (a.trip_id, a.user.id, a.bike.id, a.start_station.id) == (
+                b.trip_id, b.user.id, b.bike.id, b.start_station.id)
+            assert type(a.bike) is type(b.bike)
+            assert a.duration_minutes == b.duration_minutes
+
+    def test_trusted_still_reports_bad_rows(self, trips, stations) -> None:
+        trips.loc[2, "distance_km"] = -5.0
+        with pytest.raises(ValueError, match=r"distance_km must be non-negative at rows \[2\]"):
+            create_trips_bulk(trips, stations, trusted=True)
+
+    def test_trusted_rejects_empty_ids(self, trips, stations) -> None:
+        trips.loc[1, "bike_id"] = ""
+        with pytest.raises(ValueError, match=r"bike_id must be a non-empty string at rows \[1\]"):
+            create_trips_bulk(trips, stations, trusted=True)
+
+    def test_trusted_member_dates_checked(self) -> None:
+        users = pd.DataFrame({
+            "user_id": ["U1"], "user_type": ["member"],
+            "membership_start": [pd.Timestamp("2024-02-01")],
+            "membership_end": [pd.Timestamp("2024-01-01")],
+        })
+        with pytest.raises(ValueError, match="membership_end must be after start"):
+            create_users_bulk(users, trusted=True)
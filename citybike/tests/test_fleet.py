@@ -0,0 +1,186 @@
+"""
+Unit tests for the live fleet state.
+
+Covers:
+    - FleetState construction and validation
+    - apply_trip_start / apply_trip_end / apply_maintenance / release
+    - availability, battery and conflict bookkeeping
+    - from_history parity with applying events in time order
+"""
+
+import pandas as pd
+import pytest
+
+from fleet import FleetState
+from generate_data import REALISTIC_DEMAND, GeneratorConfig, generate_tables
+from models import ClassicBike, ElectricBike
+from replay import EventLog
+
+
+@pytest.fixture
+def fleet() -> FleetState:
+    return FleetState(["B1", "B2", "E1", "E2"],
+                      ["classic", "classic", "electric", "electric"],
+                      ["S1", "S2"])
+
+
+def dock(fleet: FleetState, bike_id: str, station_id: str) -> None:
+    fleet.apply_trip_start(bike_id)
+    fleet.apply_trip_end(bike_id, station_id)
+
+
+# ---------------------------------------------------------------------------
+# Construction
+# ---------------------------------------------------------------------------
+
+class TestConstruction:
+
+    def test_new_bikes_are_available_nowhere(self, fleet) -> None:
+        assert fleet.status_counts() == {"available": 4, "in_use": 0, "maintenance": 0}
+        assert fleet.location_of("B1") is None
+        assert fleet.battery_of("E1") == 100.0
+        assert fleet.battery_of("B1") is None
+        assert fleet.available_count("S1") == 0
+
+    @pytest.mark.parametrize("ids, types", [
+        (["B1"], ["scooter"]), (["B1", "B1"], ["classic", "classic"]), (["B1"], []),
+    ])
+    def test_rejects_bad_input(self, ids, types) -> None:
+        with pytest.raises(ValueError):
+            FleetState(ids, types)
+
+    def test_from_bikes_round_trip(self) -> None:
+        fleet = FleetState.from_bikes([
+            ClassicBike("B1", status="maintenance"),
+            ElectricBike("E1", battery_level=40.0, max_range_km=80.0),
+        ])
+        assert fleet.status_of("B1") == "maintenance"
+        bike = fleet.to_bike("E1")
+        assert isinstance(bike, ElectricBike)
+        assert bike.battery_level == 40.0 and bike.max_range_km == 80.0
+
+
+# ---------------------------------------------------------------------------
+# Transitions
+# ---------------------------------------------------------------------------
+
+class TestTransitions:
+
+    def test_trip_moves_bike_and_counts(self, fleet) -> None:
+        dock(fleet, "E1", "S1")
+        dock(fleet, "B1", "S1")
+        assert fleet.available_count("S1") == 2
+        assert fleet.available_count("S1", "electric") == 1
+        fleet.apply_trip_start("E1", "S1")
+        assert fleet.status_of("E1") == "in_use"
+        assert fleet.location_of("E1") is None
+        assert fleet.available_count("S1", "electric") == 0
+        fleet.apply_trip_end("E1", "S2", distance_km=10.0)
+        assert fleet.location_of("E1") == "S2"
+        assert fleet.available_bikes("S2") == ["E1"]
+
+    def test_battery_drains_and_floors(self, fleet) -> None:
+        fleet.apply_trip_start("E1")
+        fleet.apply_trip_end("E1", "S1", distance_km=10.0)
+        assert fleet.battery_of("E1") == pytest.approx(80.0)
+        fleet.apply_trip_start("E1")
+        fleet.apply_trip_end("E1", "S1", distance_km=500.0)
+        assert fleet.battery_of("E1") == 0.0
+        assert fleet.low_battery(20.0) == ["E1"]
+        assert fleet.available_bikes("S1", "electric", min_battery=10) == []
+
+    def test_maintenance_and_release(self, fleet) -> None:
+        fleet.apply_trip_start("E1")
+        fleet.apply_trip_end("E1", "S1", distance_km=40.0)
+        fleet.apply_maintenance("E1", "battery_replacement")
+        assert fleet.status_of("E1") == "maintenance"
+        assert fleet.battery_of("E1") == 100.0
+        assert fleet.available_count("S1") == 0
+        fleet.release("E1")
+        assert fleet.available_bikes("S1", "electric") == ["E1"]
+        with pytest.raises(ValueError):
+            fleet.release("E1")
+
+    def test_conflicts_are_counted_not_rejected(self, fleet) -> None:
+        fleet.apply_trip_start("B1")
+        fleet.apply_trip_start("B1")
+        fleet.apply_trip_end("B2", "S1")
+        assert fleet.conflicts == {"start_while_in_use": 1, "end_while_available": 1}
+        assert fleet.status_of("B1") == "in_use"
+
+    def test_unknown_bikes_and_stations_are_added(self, fleet) -> None:
+        fleet.apply_trip_end("E9", "S9", bike_type="electric")
+        assert fleet.available_count("S9", "electric") == 1
+        with pytest.raises(KeyError):
+            fleet.apply_trip_start("X1")
+
+    def test_apply_event_dicts(self, fleet) -> None:
+        fleet.apply_event({"event": "trip_start", "bike_id": "E1",
+                           "start_station_id": "S1", "time": "2024-01-01 08:00:00"})
+        fleet.apply_event({"event": "trip_end", "bike_id": "E1", "end_station_id": "S2",
+                           "distance_km": None, "time": "2024-01-01 08:30:00"})
+        fleet.apply_event({"bike_id": "B1", "maintenance_type": "tire_repair",
+                           "date": "2024-01-02"})
+        assert fleet.location_of("E1") == "S2" and fleet.battery_of("E1") == 100.0
+        assert fleet.status_of("B1") == "maintenance"
+        with pytest.raises(ValueError):
+            fleet.apply_event({"event": "teleport", "bike_id": "B1"})
+
+
+# ---------------------------------------------------------------------------
+# from_history
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="module")
+def history():
+    config = GeneratorConfig(n_trips=6_000, n_bikes=120, n_maintenance=150, missing_rate=0,
+                             duplicate_rate=0, demand=REALISTIC_DEMAND, seed=9)
+    trips, stations, maintenance = generate_tables(config)
+    return trips, stations, maintenance
+
+
+def replay_in_order(trips, maintenance, until=None) -> FleetState:
+    """Apply trip events and maintenance records one by one, in time order."""
+    log = EventLog.from_trips(trips)
+    keyed = [(int(log.epochs[i]), 0, i, log.event(i)) for i in range(len(log))]
+    for i, record in enumerate(maintenance.to_dict("records")):
+        epoch = int(pd.Timestamp(record["date"]).value // 10**9)
+        keyed.append((epoch, 1, i, {**record, "event": "maintenance"}))
+    keyed.sort(key=lambda k: k[:3])
+    limit = None if until is None else pd.Timestamp(until).value // 10**9
+    fleet = FleetState()
+    for epoch, _, _, event in keyed:
+        if limit is None or epoch <= limit:
+            fleet.apply_event(event)
+    return fleet
+
+
+class TestFromHistory:
+
+    @pytest.mark.parametrize("until", [None, "2024-06-15 12:00:00"])
+    def test_matches_event_by_event(self, history, until) -> None:
+        trips, _, maintenance = history
+        live = replay_in_order(trips, maintenance, until)
+        rebuilt = FleetState.from_history(trips, maintenance, until=until)
+        assert sorted(rebuilt.bike_ids) == sorted(live.bike_ids)
+        assert rebuilt.status_counts() == live.status_counts()
+        for bike_id in rebuilt.bike_ids:
+            assert rebuilt.status_of(bike_id) == live.status_of(bike_id)
+            assert rebuilt.location_of(bike_id) == live.location_of(bike_id)
+            assert rebuilt.battery_of(bike_id) == pytest.approx(live.battery_of(bike_id),
+                                                                abs=1e-3)
+        for station_id in rebuilt.station_ids:
+            for bike_type in ("classic", "electric"):
+                assert rebuilt.available_count(station_id, bike_type) == \
+                    live.available_count(station_id, bike_type)
+
+    def test_until_before_any_event(self, history) -> None:
+        trips, _, maintenance = history
+        assert len(FleetState.from_history(trips, maintenance, until="2000-01-01")) == 0
+
+    def test_trips_only(self, history) -> None:
+        trips, _, _ = history
+        fleet = FleetState.from_history(trips)
+        assert fleet.status_counts()["maintenance"] == 0
+        assert fleet.station_availability()[["classic", "electric"]].to_numpy().sum() == \
+            fleet.status_counts()["available"]
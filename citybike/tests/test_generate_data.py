@@ -0,0 +1,262 @@
+"""
+Unit tests for the synthetic data generator.
+
+Covers:
+    - GeneratorConfig validation
+    - generate_trip_chunk / generate_tables
+    - write_dataset determinism and the CLI
+    - shard_ranges / write_partitioned (multi-process shards + manifest)
+    - DemandProfile (skewed stations / users, daily, weekly and seasonal shape)
+"""
+
+import hashlib
+import json
+
+import pandas as pd
+import pytest
+
+from generate_data import (
+    REALISTIC_DEMAND,
+    TRIP_COLUMNS,
+    DemandProfile,
+    GeneratorConfig,
+    chunk_bounds,
+    generate_tables,
+    generate_trip_chunk,
+    main,
+    shard_ranges,
+    write_dataset,
+    write_partitioned,
+)
+
+
+SMALL = GeneratorConfig(n_trips=5_000, n_users=300, n_bikes=100, chunk_size=1_200, seed=7)
+
+
+# ---------------------------------------------------------------------------
+# GeneratorConfig
+# ---------------------------------------------------------------------------
+
+class TestGeneratorConfig:
+
+    def test_defaults_are_valid(self) -> None:
+        GeneratorConfig().validate()
+
+    @pytest.mark.parametrize("field, value", [
+        ("n_stations", 0), ("chunk_size", 0), ("n_trips", -1), ("missing_rate", 1.5),
+    ])
+    def test_rejects_bad_values(self, field: str, value) -> None:
+        with pytest.raises(ValueError, match=field):
+            GeneratorConfig()._replace(**{field: value}).validate()
+
+
+# ---------------------------------------------------------------------------
+# Trip chunks
+# ---------------------------------------------------------------------------
+
+class TestTripChunks:
+
+    def test_chunk_bounds_cover_all_trips(self) -> None:
+        bounds = chunk_bounds(SMALL)
+        assert bounds[0][0] == 0 and bounds[-1][1] == SMALL.n_trips
+        assert all(hi - lo <= SMALL.chunk_size for lo, hi in bounds)
+
+    def test_chunk_is_reproducible_on_its_own(self) -> None:
+        assert generate_trip_chunk(SMALL, 2).equals(generate_trip_chunk(SMALL, 2))
+
+    def test_trip_ids_follow_chunk_offsets(self) -> None:
+        chunk = generate_trip_chunk(SMALL, 1)
+        assert chunk["trip_id"].iloc[0] == f"TR{10_000 + SMALL.chunk_size}"
+
+    def test_columns_and_references(self) -> None:
+        trips, stations, maintenance = generate_tables(SMALL)
+        assert list(trips.columns) == TRIP_COLUMNS
+        assert set(trips["start_station_id"]) <= set(stations["station_id"])
+        assert trips["user_id"].nunique() <= SMALL.n_users
+        assert len(maintenance) == SMALL.n_maintenance
+        assert (trips["end_time"] >= trips["start_time"]).all()
+
+    def test_messiness(self) -> None:
+        trips, _, _ = generate_tables(SMALL._replace(missing_rate=0.1, duplicate_rate=0.05))
+        assert trips["trip_id"].duplicated().sum() > 0
+        assert 0.05 < trips["duration_minutes"].isna().mean() < 0.15
+        assert trips["status"].isna().any()
+
+    def test_no_messiness(self) -> None:
+        clean = SMALL._replace(missing_rate=0, zero_length_rate=0, duplicate_rate=0,
+                               status_missing_rate=0)
+        trips, _, _ = generate_tables(clean)
+        assert len(trips) == clean.n_trips
+        assert not trips.isna().any().any()
+
+    def test_empty(self) -> None:
+        trips, _, _ = generate_tables(SMALL._replace(n_trips=0))
+        assert trips.empty
+
+
+# ---------------------------------------------------------------------------
+# Writing
+# ---------------------------------------------------------------------------
+
+class TestWriteDataset:
+
+    def test_byte_identical_for_same_seed(self, tmp_path) -> None:
+        write_dataset(SMALL, tmp_path / "a")
+        write_dataset(SMALL, tmp_path / "b")
+        for name in ("trips.csv", "stations.csv", "maintenance.csv"):
+            assert (tmp_path / "a" / name).read_bytes() == (tmp_path / "b" / name).read_bytes()
+
+    def test_seed_changes_output(self, tmp_path) -> None:
+        write_dataset(SMALL, tmp_path / "a")
+        write_dataset(SMALL._replace(seed=8), tmp_path / "b")
+        assert (tmp_path / "a" / "trips.csv").read_bytes() != (tmp_path / "b" / "trips.csv").read_bytes()
+
+    def test_csv_matches_original_layout(self, tmp_path) -> None:
+        counts = write_dataset(SMALL, tmp_path)
+        trips = pd.read_csv(tmp_path / "trips.csv")
+        assert len(trips) == counts["trips"]
+        assert list(trips.columns) == TRIP_COLUMNS
+        assert trips["start_time"].str.fullmatch(r"\d{4}-\d\d-\d\d \d\d:\d\d:\d\d").all()
+
+    def test_cli(self, tmp_path, capsys) -> None:
+        main(["--trips", "300", "--stations", "20", "--seed", "1", "--out-dir", str(tmp_path)])
+        assert len(pd.read_csv(tmp_path / "stations.csv")) == 20
+        assert "trips.csv" in capsys.readouterr().out
+
+
+# ---------------------------------------------------------------------------
+# Multi-process shards
+# ---------------------------------------------------------------------------
+
+class TestShards:
+
+    def test_shard_ranges_are_contiguous(self) -> None:
+        ranges = shard_ranges(SMALL, shards=3)
+        assert ranges[0][0] == 0 and ranges[-1][1] == len(chunk_bounds(SMALL))
+        assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+        assert len(shard_ranges(SMALL)) == len(chunk_bounds(SMALL))
+        assert len(shard_ranges(SMALL, shards=100)) == len(chunk_bounds(SMALL))
+
+    def test_parallel_single_file_is_identical(self, tmp_path) -> None:
+        write_dataset(SMALL, tmp_path / "serial")
+        write_dataset(SMALL, tmp_path / "parallel", workers=2)
+        serial = (tmp_path / "serial" / "trips.csv").read_bytes()
+        assert (tmp_path / "parallel" / "trips.csv").read_bytes() == serial
+        assert sorted(p.name for p in (tmp_path / "parallel").iterdir()) == [
+            "maintenance.csv", "stations.csv", "trips.csv"]
+
+    def test_partitions_independent_of_workers(self, tmp_path) -> None:
+        one = write_partitioned(SMALL, tmp_path / "one", shards=2, workers=1)
+        two = write_partitioned(SMALL, tmp_path / "two", shards=2, workers=2)
+        assert one == two
+        for part in one["trips"]["partitions"]:
+            assert (tmp_path / "one" / part["file"]).read_bytes() == \
+                (tmp_path / "two" / part["file"]).read_bytes()
+
+    def test_manifest_describes_partitions(self, tmp_path) -> None:
+        write_partitioned(SMALL, tmp_path, shards=2)
+        manifest = json.loads((tmp_path / "manifest.json").read_text())
+        parts = manifest["trips"]["partitions"]
+        assert [p["file"] for p in parts] == ["trips/part-00000.csv", "trips/part-00001.csv"]
+        frames = [pd.read_csv(tmp_path / p["file"]) for p in parts]
+        assert [len(f) for f in frames] == [p["rows"] for p in parts]
+        assert manifest["trips"]["rows"] == sum(len(f) for f in frames)
+        assert frames[1]["trip_id"].iloc[0] == f"TR{10_000 + parts[1]['first_trip']}"
+        assert manifest["config"]["seed"] == SMALL.seed
+        assert [p["sha256"] for p in parts] == [
+            hashlib.sha256((tmp_path / p["file"]).read_bytes()).hexdigest() for p in parts]
+
+    def test_partitions_concatenate_to_single_file(self, tmp_path) -> None:
+        write_dataset(SMALL, tmp_path / "single")
+        manifest = write_partitioned(SMALL, tmp_path / "parts", shards=3)
+        frames = [pd.read_csv(tmp_path / "parts" / p["file"])
+                  for p in manifest["trips"]["partitions"]]
+        single = pd.read_csv(tmp_path / "single" / "trips.csv")
+        assert pd.concat(frames, ignore_index=True).equals(single)
+
+    def test_cli_partitioned(self, tmp_path) -> None:
+        main(["--trips", "2500", "--chunk-size", "1000", "--partitioned",
+              "--workers", "2", "--out-dir", str(tmp_path)])
+        assert len(list((tmp_path / "trips").glob("part-*.csv"))) == 3
+
+
+# ---------------------------------------------------------------------------
+# Demand profiles
+# ---------------------------------------------------------------------------
+
+REALISTIC = GeneratorConfig(n_trips=40_000, n_users=1_000, chunk_size=15_000, seed=3,
+                            demand=REALISTIC_DEMAND)
+
+
+@pytest.fixture(scope="module")
+def realistic_trips() -> pd.DataFrame:
+    trips, _, _ = generate_tables(REALISTIC)
+    return trips
+
+
+class TestDemandProfile:
+
+    @pytest.mark.parametrize("field, value", [
+        ("station_zipf", -1.0), ("member_share", 1.5), ("seasonal_amplitude", 1.0),
+        ("peak_month", 13), ("weekend_duration", 0.0),
+    ])
+    def test_rejects_bad_values(self, field: str, value) -> None:
+        with pytest.raises(ValueError, match=field.split("_")[-1]):
+            SMALL._replace(demand=DemandProfile()._replace(**{field: value})).validate()
+
+    def test_station_popularity_is_skewed(self, realistic_trips) -> None:
+        counts = realistic_trips["start_station_id"].value_counts()
+        assert counts.iloc[0] > 3 * counts.mean()
+        assert counts.iloc[0] > 10 * counts.iloc[-1]
+
+    def test_heavy_user_tail(self, realistic_trips) -> None:
+        counts = realistic_trips["user_id"].value_counts()
+        top_share = counts.iloc[:len(counts) // 100].sum() / counts.sum()
+        assert top_share > 0.2
+
+    def test_user_type_is_per_user(self, realistic_trips) -> None:
+        assert (realistic_trips.groupby("user_id")["user_type"].nunique() == 1).all()
+
+    def test_weekday_commute_peaks(self, realistic_trips) -> None:
+        start = realistic_trips["start_time"]
+        hours = start[start.dt.dayofweek < 5].dt.hour.value_counts()
+        assert hours[8] > 3 * hours[12] and hours[17] > 3 * hours[12]
+        assert hours.get(3, 0) == 0
+
+    def test_weekend_is_quieter_and_later(self, realistic_trips) -> None:
+        start = realistic_trips["start_time"]
+        weekend = start.dt.dayofweek >= 5
+        assert weekend.mean() < 2 / 7
+        assert start[weekend].dt.hour.value_counts().idxmax() in range(12, 17)
+
+    def test_seasonal_curve(self, realistic_trips) -> None:
+        months = realistic_trips["start_time"].dt.month.value_counts()
+        assert months[7] > 2 * months[1]
+
+    def test_messiness_is_preserved(self, realistic_trips) -> None:
+        uniform, _, _ = generate_tables(REALISTIC._replace(demand=None))
+        assert realistic_trips["duration_minutes"].isna().sum() == \
+            uniform["duration_minutes"].isna().sum()
+        assert (realistic_trips["end_time"] >= realistic_trips["start_time"]).all()
+
+    def test_deterministic_and_chunk_independent(self, realistic_trips) -> None:
+        chunk = generate_trip_chunk(REALISTIC, 1)
+        assert chunk.equals(generate_trip_chunk(REALISTIC, 1))
+        assert not chunk.equals(generate_trip_chunk(REALISTIC._replace(demand=None), 1))
+
+    def test_uniform_columns_untouched(self) -> None:
+        uniform = generate_trip_chunk(REALISTIC._replace(demand=None), 0)
+        realistic = generate_trip_chunk(REALISTIC, 0)
+        for column in ("trip_id", "bike_id", "distance_km", "status"):
+            assert realistic[column].equals(uniform[column])
+
+    def test_manifest_records_profile(self, tmp_path) -> None:
+        write_partitioned(SMALL._replace(demand=REALISTIC_DEMAND), tmp_path, shards=1)
+        manifest = json.loads((tmp_path / "manifest.json").read_text())
+        assert manifest["config"]["demand"]["station_zipf"] == REALISTIC_DEMAND.station_zipf
+
+    def test_cli_realistic(self, tmp_path) -> None:
+        main(["--trips", "2000", "--demand", "realistic", "--station-zipf", "2",
+              "--out-dir", str(tmp_path)])
+        trips = pd.read_csv(tmp_path / "trips.csv")
+        assert trips["start_station_id"].value_counts(normalize=True).iloc[0] > 0.4
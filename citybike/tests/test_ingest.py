@@ -0,0 +1,238 @@
+"""
+Unit tests for the streaming ingest service.
+
+Covers:
+    - LiveAggregates parity with BikeShareSystem after clean_data
+    - validation, de-duplication and duration moments
+    - IngestService micro-batching, latency and trips in progress
+    - replay -> ingest end to end, and the socket source
+"""
+
+import asyncio
+import contextlib
+import io
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks import _system, make_dataset
+from ingest import IngestService, LatencyRecorder, LiveAggregates
+from replay import EventLog, QueueSink, replay
+
+
+SERIES_QUESTIONS = ["peak_usage_hours", "busiest_day_of_week",
+                    "avg_distance_by_user_type", "monthly_trip_trend"]
+FRAME_QUESTIONS = ["top_start_stations", "top_active_users", "top_routes"]
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    trips, stations, maintenance = make_dataset(5_000, seed=11)
+    with contextlib.redirect_stdout(io.StringIO()):
+        system = _system(trips.copy(), stations, maintenance)
+        system.clean_data(export=False)
+    return trips, stations, system
+
+
+def ingest_in_batches(trips: pd.DataFrame, stations: pd.DataFrame,
+                      size: int) -> LiveAggregates:
+    aggregates = LiveAggregates(stations)
+    for start in range(0, len(trips), size):
+        aggregates.update(trips.iloc[start:start + size])
+    return aggregates
+
+
+def assert_same_answers(aggregates: LiveAggregates, system) -> None:
+    assert aggregates.total_trips_summary() == system.total_trips_summary()
+    for question in SERIES_QUESTIONS:
+        pd.testing.assert_series_equal(getattr(aggregates, question)(),
+                                       getattr(system, question)())
+    for question in FRAME_QUESTIONS:
+        pd.testing.assert_frame_equal(getattr(aggregates, question)(),
+                                      getattr(system, question)().reset_index(drop=True))
+
+
+# ---------------------------------------------------------------------------
+# LiveAggregates
+# ---------------------------------------------------------------------------
+
+class TestLiveAggregates:
+
+    @pytest.mark.parametrize("size", [1, 700, 100_000])
+    def test_matches_analyzer(self, dataset, size) -> None:
+        trips, stations, system = dataset
+        if size == 1:
+            trips = trips.iloc[:300]
+            with contextlib.redirect_stdout(io.StringIO()):
+                system = _system(trips.copy(), stations, system.maintenance)
+                system.clean_data(export=False)
+        assert_same_answers(ingest_in_batches(trips, stations, size), system)
+
+    def test_rejects_and_duplicates(self, dataset) -> None:
+        trips, stations, system = dataset
+        aggregates = ingest_in_batches(trips, stations, 1_000)
+        assert aggregates.duplicates == trips["trip_id"].duplicated().sum()
+        assert aggregates.n_trips + aggregates.duplicates + \
+            sum(aggregates.rejected.values()) == len(trips)
+        assert aggregates.rejected["duration_minutes:numeric"] > 0
+
+    def test_negative_values_kept_like_clean_data(self, dataset) -> None:
+        trips, stations, system = dataset
+        frame = trips.dropna(subset=["duration_minutes", "distance_km"]).iloc[:3].copy()
+        frame["trip_id"] = ["N1", "N2", "N3"]
+        frame.loc[frame.index[0], "duration_minutes"] = -4.0
+        frame.loc[frame.index[1], "distance_km"] = -1.5
+        with contextlib.redirect_stdout(io.StringIO()):
+            expected = _system(frame.copy(), stations, system.maintenance)
+            expected.clean_data(export=False)
+        aggregates = LiveAggregates()
+        aggregates.update(frame)
+        assert aggregates.total_trips_summary() == expected.total_trips_summary()
+        assert aggregates.total_trips_summary()["total_trips"] == 3
+
+    def test_non_numeric_rejected(self) -> None:
+        aggregates = LiveAggregates()
+        aggregates.update(pd.DataFrame({
+            "trip_id": ["A"], "user_id": ["U"], "user_type": ["member"],
+            "start_station_id": ["S1"], "end_station_id": ["S2"],
+            "start_time": ["2024-01-01 09:00:00"], "end_time": ["2024-01-01 10:00:00"],
+            "duration_minutes": ["sixty"], "distance_km": [1.0],
+        }))
+        assert aggregates.n_trips == 0
+        assert aggregates.rejected == {"duration_minutes:numeric": 1}
+
+    def test_reversed_times_rejected(self) -> None:
+        aggregates = LiveAggregates()
+        aggregates.update(pd.DataFrame({
+            "trip_id": ["A"], "user_id": ["U"], "user_type": ["member"],
+            "start_station_id": ["S1"], "end_station_id": ["S2"],
+            "start_time": ["2024-01-01 10:00:00"], "end_time": ["2024-01-01 09:00:00"],
+            "duration_minutes": [5.0], "distance_km": [1.0],
+        }))
+        assert aggregates.n_trips == 0
+        assert aggregates.rejected == {"end_time:after_start": 1}
+
+    def test_duration_moments(self, dataset) -> None:
+        trips, stations, system = dataset
+        moments = ingest_in_batches(trips, stations, 333).duration_moments()
+        durations = system.trips["duration_minutes"]
+        assert moments["count"] == len(durations)
+        assert moments["mean"] == pytest.approx(durations.mean())
+        assert moments["std"] == pytest.approx(durations.std())
+        assert moments["max"] == durations.max()
+
+    def test_empty(self) -> None:
+        aggregates = LiveAggregates()
+        assert aggregates.total_trips_summary()["total_trips"] == 0
+        assert aggregates.peak_usage_hours().empty
+        assert aggregates.top_routes().empty
+        assert aggregates.duration_moments()["count"] == 0
+
+
+# ---------------------------------------------------------------------------
+# IngestService
+# ---------------------------------------------------------------------------
+
+def trip_event(i: int, kind: str = "trip_end", **fields) -> dict:
+    return {
+        "event": kind, "trip_id": f"T{i}", "user_id": "U1", "user_type": "member",
+        "start_station_id": "S1", "end_station_id": "S2",
+        "start_time": "2024-03-01 08:00:00", "end_time": "2024-03-01 08:20:00",
+        "duration_minutes": 20.0, "distance_km": 3.0, **fields,
+    }
+
+
+class TestIngestService:
+
+    def test_batches_by_size(self) -> None:
+        async def scenario():
+            service = IngestService(batch_size=10, max_delay=10)
+            for i in range(25):
+                service.queue.put_nowait(trip_event(i))
+            service.queue.put_nowait(None)
+            return await service.run(), service
+
+        stats, service = asyncio.run(scenario())
+        assert stats["batches"] == 3
+        assert stats["applied"] == service.aggregates.n_trips == 25
+
+    def test_flushes_after_max_delay(self) -> None:
+        async def scenario():
+            service = IngestService(batch_size=1_000, max_delay=0.01)
+            consumer = asyncio.create_task(service.run())
+            await service.queue.put(trip_event(1))
+            await asyncio.sleep(0.1)
+            visible = service.aggregates.n_trips
+            await service.queue.put(None)
+            await consumer
+            return visible
+
+        assert asyncio.run(scenario()) == 1
+
+    def test_starts_tracked_as_in_progress(self) -> None:
+        service = IngestService()
+        service.apply([trip_event(1, "trip_start"), trip_event(2, "trip_start"),
+                       trip_event(1)])
+        stats = service.stats()
+        assert stats["in_progress"] == 1
+        assert stats["trip_starts"] == 2 and stats["applied"] == 1
+
+    def test_latency_from_sent_at(self) -> None:
+        service = IngestService()
+        service.apply([trip_event(1, sent_at=0.0)], arrived=[0.0])
+        assert service.stats()["latency_ms"]["max"] > 1e6
+
+    def test_rejects_bad_settings(self) -> None:
+        with pytest.raises(ValueError):
+            IngestService(batch_size=0)
+
+    def test_replay_end_to_end(self, dataset) -> None:
+        trips, stations, system = dataset
+
+        async def scenario():
+            service = IngestService(LiveAggregates(stations), batch_size=512)
+            consumer = asyncio.create_task(service.run())
+            await replay(EventLog.from_trips(trips), QueueSink(service.queue), speedup=0)
+            return await consumer, service.aggregates
+
+        stats, aggregates = asyncio.run(scenario())
+        assert stats["trip_ends"] == stats["trip_starts"] == len(trips)
+        assert stats["in_progress"] == 0
+        assert stats["latency_ms"]["p99"] < 1_000
+        assert_same_answers(aggregates, system)
+
+    def test_socket_source(self) -> None:
+        async def scenario():
+            service = IngestService(batch_size=2)
+            server = await service.serve("tcp://127.0.0.1:0")
+            port = server.sockets[0].getsockname()[1]
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            lines = [json.dumps(trip_event(i)) for i in range(3)] + ["not json"]
+            writer.write(("\n".join(lines) + "\n").encode())
+            await writer.drain()
+            writer.close()
+            consumer = asyncio.create_task(service.run())
+            while service.counts["bad_lines"] == 0:
+                await asyncio.sleep(0.01)
+            await service.queue.put(None)
+            server.close()
+            return await consumer, service
+
+        stats, service = asyncio.run(scenario())
+        assert stats["applied"] == 3
+        assert service.counts["bad_lines"] == 1
+
+
+class TestLatencyRecorder:
+
+    def test_window_keeps_latest_samples(self) -> None:
+        recorder = LatencyRecorder(window=4)
+        recorder.record(np.array([9.0, 9.0, 9.0]))
+        recorder.record(np.array([0.001] * 5))
+        assert recorder.percentiles()["max"] == 1.0
+        assert recorder.count == 8
+
+    def test_empty(self) -> None:
+        assert LatencyRecorder().percentiles() is None
@@ -10,11 +10,14 @@ Covers:
 import pytest
 from datetime import datetime
 
+import models
 from models import (
     Bike,
     ClassicBike,
     ElectricBike,
     Entity,
+    Station,
+    MaintenanceRecord,
 )
 
 
@@ -140,3 +143,63 @@ class TestClassicBike:
         assert "BK015" in r
         assert "gear_count=7" in r
         assert "available" in r
+
+
+# ---------------------------------------------------------------------------
+# Trusted construction
+# ---------------------------------------------------------------------------
+
+class TestFromTrusted:
+    """from_trusted builds equivalent objects without re-validating."""
+
+    def test_classic_bike(self) -> None:
+        bike = ClassicBike.from_trusted("BK020", gear_count=21)
+        assert isinstance(bike, ClassicBike)
+        assert bike.id == "BK020"
+        assert bike.bike_type == "classic"
+        assert bike.gear_count == 21
+        assert bike.status == "available"
+        assert isinstance(bike.created_at, datetime)
+
+    def test_electric_bike(self) -> None:
+        bike = ElectricBike.from_trusted("BK021", battery_level=55.0)
+        assert str(bike) == "ElectricBike(BK021, battery=55.0%)"
+        assert bike.max_range_km == 50.0
+
+    def test_shared_created_at(self) -> None:
+        ts = datetime(2024, 1, 1)
+        bike = ClassicBike.from_trusted("BK022", created_at=ts)
+        assert bike.created_at == ts
+
+    def test_created_at_is_lazy(self, monkeypatch) -> None:
+        calls = []
+
+        class Clock(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                calls.append(1)
+                return datetime(2024, 5, 1)
+
+        monkeypatch.setattr(models, "datetime", Clock)
+        bikes = [ClassicBike.from_trusted(f"BK{i}") for i in range(3)]
+        assert calls == []
+        assert bikes[0].created_at == datetime(2024, 5, 1)
+        assert bikes[0].created_at is bikes[0].created_at
+        assert len(calls) == 1
+
+    def test_skips_validation(self) -> None:
+        station = Station.from_trusted("ST1", "Central", 0, 48.8, 9.2)
+        assert station.id == "ST1"
+
+    def test_status_setter_still_validates(self) -> None:
+        bike = Bike.from_trusted("BK023", "classic")
+        with pytest.raises(ValueError, match="Invalid status"):
+            bike.status = "broken"
+
+    def test_maintenance_record(self) -> None:
+        bike = ClassicBike.from_trusted("BK024")
+        record = MaintenanceRecord.from_trusted(
+            "MR1", bike, datetime(2024, 1, 1), "tire_repair", 12.5
+        )
+        assert record.bike is bike
+        assert record.cost == 12.5
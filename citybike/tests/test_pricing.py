@@ -4,11 +4,21 @@ Unit tests for the pricing module.
 Covers:
     - CasualPricing (fully implemented)
     - PricingStrategy cannot be instantiated directly
+    - CompiledTariff (vectorized routing of casual / member / peak rates)
 """
 
+import numpy as np
+import pandas as pd
 import pytest
 
-from pricing import PricingStrategy, CasualPricing
+from pricing import (
+    PricingStrategy,
+    CasualPricing,
+    MemberPricing,
+    PeakHourPricing,
+    CompiledTariff,
+    linear_rates,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -57,3 +67,70 @@ class TestCasualPricing:
 
     def test_is_pricing_strategy(self) -> None:
         assert isinstance(self.pricing, PricingStrategy)
+
+
+# ---------------------------------------------------------------------------
+# CompiledTariff
+# ---------------------------------------------------------------------------
+
+class TestCompiledTariff:
+
+    def setup_method(self) -> None:
+        self.tariff = CompiledTariff.from_strategies()
+
+    def test_linear_rates_of_casual(self) -> None:
+        assert linear_rates(CasualPricing()) == pytest.approx((1.00, 0.15, 0.10))
+
+    def test_rejects_non_linear_strategy(self) -> None:
+        class Squared(PricingStrategy):
+            def calculate_cost(self, duration_minutes, distance_km):
+                return duration_minutes ** 2
+
+        with pytest.raises(ValueError, match="not linear"):
+            linear_rates(Squared())
+
+    def test_rates_shape(self) -> None:
+        assert self.tariff.rates.shape == (2 * 24 * 7, 3)
+
+    def test_matches_strategy_objects(self) -> None:
+        trips = pd.DataFrame({
+            "user_type": ["casual", "casual", "member", "member", "casual"],
+            "start_time": pd.to_datetime([
+                "2024-03-04 08:10:00",  # Monday, peak
+                "2024-03-04 12:00:00",  # Monday, off-peak
+                "2024-03-04 08:10:00",  # member, peak hour
+                "2024-03-09 17:30:00",  # Saturday
+                "2024-03-09 17:30:00",  # Saturday, casual
+            ]),
+            "duration_minutes": [20.0, 20.0, 30.0, 10.0, 15.0],
+            "distance_km": [5.0, 5.0, 4.0, 2.0, 3.0],
+        })
+        expected = [
+            PeakHourPricing().calculate_cost(20, 5),
+            CasualPricing().calculate_cost(20, 5),
+            MemberPricing().calculate_cost(30, 4),
+            MemberPricing().calculate_cost(10, 2),
+            CasualPricing().calculate_cost(15, 3),
+        ]
+        assert self.tariff.price_trips(trips) == pytest.approx(expected)
+
+    def test_accepts_string_timestamps(self) -> None:
+        trips = pd.DataFrame({
+            "user_type": ["casual"],
+            "start_time": ["2024-03-04 12:00:00"],
+            "duration_minutes": [20.0],
+            "distance_km": [5.0],
+        })
+        assert self.tariff.price_trips(trips) == pytest.approx([4.50])
+
+    def test_unknown_user_type_raises(self) -> None:
+        with pytest.raises(ValueError, match="Unknown user_type"):
+            self.tariff.encode_user_types(["casual", "tourist"])
+
+    def test_custom_peak_window(self) -> None:
+        tariff = CompiledTariff.from_strategies(peak_hours=frozenset({12}))
+        fares = tariff.price(
+            np.array([0, 0]), np.array([12, 8]), np.array([0, 0]),
+            np.array([20.0, 20.0]), np.array([5.0, 5.0]),
+        )
+        assert fares == pytest.approx([4.50 * 1.5, 4.50])
@@ -0,0 +1,202 @@
+"""
+Unit tests for the trip event replay.
+
+Covers:
+    - EventLog.from_trips (ordering, skipped rows, event records)
+    - replay pacing, rate and lag reporting
+    - QueueSink, FileSink, StreamSink (TCP)
+    - load_trips and the CLI
+"""
+
+import asyncio
+import io
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from generate_data import GeneratorConfig, write_partitioned
+from replay import (
+    EventLog,
+    FileSink,
+    NullSink,
+    QueueSink,
+    StreamSink,
+    load_trips,
+    main,
+    replay,
+)
+
+
+def trips_frame() -> pd.DataFrame:
+    return pd.DataFrame({
+        "trip_id": ["T1", "T2", "T3", "T4"],
+        "start_station_id": ["S1", "S2", "S1", "S3"],
+        "start_time": ["2024-01-01 08:00:00", "2024-01-01 08:10:00",
+                       "not a time", "2024-01-01 08:05:00"],
+        "end_time": ["2024-01-01 08:10:00", "2024-01-01 08:30:00",
+                     "2024-01-01 09:00:00", None],
+        "duration_minutes": [10.0, np.nan, 5.0, 1.0],
+    })
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+# ---------------------------------------------------------------------------
+# EventLog
+# ---------------------------------------------------------------------------
+
+class TestEventLog:
+
+    def test_events_in_timestamp_order(self) -> None:
+        log = EventLog.from_trips(trips_frame())
+        events = [log.event(i) for i in range(len(log))]
+        assert [(e["event"], e["trip_id"]) for e in events] == [
+            ("trip_start", "T1"), ("trip_start", "T4"), ("trip_end", "T1"),
+            ("trip_start", "T2"), ("trip_end", "T2"),
+        ]
+        assert np.all(np.diff(log.epochs) >= 0)
+
+    def test_end_sorts_before_start_at_same_time(self) -> None:
+        events = [(e["event"], e["trip_id"]) for e in map(
+            EventLog.from_trips(trips_frame()).event, range(5))]
+        assert events.index(("trip_end", "T1")) < events.index(("trip_start", "T2"))
+
+    def test_zero_length_trip_ends_after_its_start(self) -> None:
+        frame = trips_frame().iloc[[0, 1]].assign(end_time=lambda f: f["start_time"])
+        log = EventLog.from_trips(frame)
+        assert [log.event(i)["event"] for i in range(4)] == [
+            "trip_start", "trip_end", "trip_start", "trip_end"]
+
+    def test_unparseable_start_is_skipped(self) -> None:
+        log = EventLog.from_trips(trips_frame())
+        assert log.skipped == 1
+        assert "T3" not in {log.event(i)["trip_id"] for i in range(len(log))}
+
+    def test_event_records_are_json_ready(self) -> None:
+        log = EventLog.from_trips(trips_frame())
+        event = next(log.event(i) for i in range(len(log))
+                     if log.event(i)["trip_id"] == "T2")
+        assert event["time"] == "2024-01-01 08:10:00"
+        assert event["duration_minutes"] is None
+        assert event["start_station_id"] == "S2"
+        json.dumps(event)
+
+    def test_parsed_datetimes_are_formatted(self) -> None:
+        frame = trips_frame().iloc[[0, 1]].assign(
+            start_time=lambda f: pd.to_datetime(f["start_time"]),
+            end_time=lambda f: pd.to_datetime(f["end_time"]))
+        assert EventLog.from_trips(frame).event(0)["start_time"] == "2024-01-01 08:00:00"
+
+    def test_missing_columns(self) -> None:
+        with pytest.raises(ValueError, match="end_time"):
+            EventLog.from_trips(trips_frame().drop(columns="end_time"))
+
+
+# ---------------------------------------------------------------------------
+# replay
+# ---------------------------------------------------------------------------
+
+class TestReplay:
+
+    def test_queue_sink_delivers_everything(self) -> None:
+        log = EventLog.from_trips(trips_frame())
+
+        async def scenario():
+            queue = asyncio.Queue(maxsize=2)
+            received = []
+
+            async def consume():
+                while (event := await queue.get()) is not None:
+                    received.append(event)
+
+            consumer = asyncio.create_task(consume())
+            report = await replay(log, QueueSink(queue), speedup=0)
+            await consumer
+            return report, received
+
+        report, received = run(scenario())
+        assert report["events"] == len(received) == 5
+        assert report["trip_starts"] == 3 and report["trip_ends"] == 2
+        assert [e["seq"] for e in received] == list(range(5))
+        assert report["lag_ms"] is None
+
+    def test_speedup_paces_emission(self) -> None:
+        log = EventLog.from_trips(trips_frame())  # 30 minutes of events
+        report = run(replay(log, NullSink(), speedup=1800 / 0.2))
+        assert 0.18 <= report["elapsed_s"] < 1.0
+        assert report["target_rate_eps"] == pytest.approx(5 / 0.2)
+        assert set(report["lag_ms"]) == {"mean", "p50", "p95", "p99", "max"}
+
+    def test_limit(self) -> None:
+        report = run(replay(EventLog.from_trips(trips_frame()), NullSink(), 0, limit=2))
+        assert report["events"] == 2
+
+    def test_empty_log(self) -> None:
+        log = EventLog.from_trips(trips_frame().iloc[:0])
+        assert run(replay(log, NullSink()))["events"] == 0
+
+    def test_rejects_negative_speedup(self) -> None:
+        with pytest.raises(ValueError):
+            run(replay(EventLog.from_trips(trips_frame()), NullSink(), speedup=-1))
+
+
+# ---------------------------------------------------------------------------
+# Sinks
+# ---------------------------------------------------------------------------
+
+class TestSinks:
+
+    def test_file_sink_writes_json_lines(self) -> None:
+        out = io.StringIO()
+        run(replay(EventLog.from_trips(trips_frame()), FileSink(out), speedup=0))
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert [line["seq"] for line in lines] == list(range(5))
+
+    def test_stream_sink_over_tcp(self) -> None:
+        async def scenario():
+            lines = []
+            done = asyncio.Event()
+
+            async def handle(reader, writer):
+                while line := await reader.readline():
+                    lines.append(json.loads(line))
+                writer.close()
+                done.set()
+
+            server = await asyncio.start_server(handle, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            await replay(EventLog.from_trips(trips_frame()),
+                         StreamSink(writer, drain_every=2), speedup=0)
+            await done.wait()
+            server.close()
+            return lines
+
+        lines = run(scenario())
+        assert [line["trip_id"] for line in lines] == ["T1", "T4", "T1", "T2", "T2"]
+
+
+# ---------------------------------------------------------------------------
+# Loading / CLI
+# ---------------------------------------------------------------------------
+
+class TestLoadAndCli:
+
+    def test_load_partitioned_directory(self, tmp_path) -> None:
+        config = GeneratorConfig(n_trips=900, chunk_size=400, seed=2)
+        manifest = write_partitioned(config, tmp_path, shards=2)
+        assert len(load_trips(tmp_path)) == manifest["trips"]["rows"]
+
+    def test_cli_generate_to_file(self, tmp_path, capsys) -> None:
+        out = tmp_path / "events.jsonl"
+        report = main(["--generate", "300", "--speedup", "0", "--sink", str(out)])
+        assert report["events"] == len(out.read_text().splitlines())
+        assert json.loads(capsys.readouterr().err)["events"] == report["events"]
+
+    def test_cli_needs_one_source(self) -> None:
+        with pytest.raises(SystemExit):
+            main(["--speedup", "0"])
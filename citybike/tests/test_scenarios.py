@@ -0,0 +1,86 @@
+"""
+Unit tests for the what-if pricing scenario runner.
+
+Covers:
+    - scenario_grid / build_tariff
+    - run_scenarios (in-process and with a process pool)
+"""
+
+import pandas as pd
+import pytest
+
+from pricing import CasualPricing, MemberPricing, PeakHourPricing
+from scenarios import build_tariff, run_scenarios, scenario_grid
+
+
+@pytest.fixture
+def trips() -> pd.DataFrame:
+    return pd.DataFrame({
+        "user_type": ["casual", "member", "casual", "member"],
+        "start_station_id": ["ST100", "ST101", "ST100", "ST102"],
+        "start_time": pd.to_datetime([
+            "2024-01-08 08:00:00",  # Monday peak
+            "2024-01-08 12:00:00",
+            "2024-02-10 12:00:00",  # Saturday
+            "2024-02-12 17:00:00",  # Monday peak, member
+        ]),
+        "duration_minutes": [20.0, 30.0, 10.0, 15.0],
+        "distance_km": [5.0, 4.0, 2.0, 3.0],
+    })
+
+
+# ---------------------------------------------------------------------------
+# Scenario definition
+# ---------------------------------------------------------------------------
+
+class TestScenarioDefinition:
+
+    def test_grid_is_cartesian_product(self) -> None:
+        grid = scenario_grid({"A.X": [1, 2], "B.Y": [3, 4, 5]})
+        assert len(grid) == 6
+        assert {"A.X": 2, "B.Y": 5} in grid
+
+    def test_unknown_parameter_raises(self) -> None:
+        with pytest.raises(ValueError, match="Unknown pricing parameter"):
+            build_tariff({"MemberPricing.DISCOUNT": 0.5})
+
+    def test_overrides_do_not_mutate_strategies(self) -> None:
+        build_tariff({"MemberPricing.PER_MINUTE": 0.5})
+        assert MemberPricing.PER_MINUTE == 0.08
+
+    def test_peak_follows_casual_override(self) -> None:
+        tariff = build_tariff({"CasualPricing.UNLOCK_FEE": 2.0,
+                               "PeakHourPricing.MULTIPLIER": 2.0})
+        fare = tariff.price([0], [8], [0], [0.0], [0.0])
+        assert fare[0] == pytest.approx(4.0)
+
+
+# ---------------------------------------------------------------------------
+# run_scenarios
+# ---------------------------------------------------------------------------
+
+class TestRunScenarios:
+
+    def test_baseline_matches_strategies(self, trips) -> None:
+        result = run_scenarios(trips, [{}], max_workers=1)
+        expected_casual = (PeakHourPricing().calculate_cost(20, 5)
+                           + CasualPricing().calculate_cost(10, 2))
+        expected_member = (MemberPricing().calculate_cost(30, 4)
+                           + MemberPricing().calculate_cost(15, 3))
+        row = result["by_user_type"].loc["baseline"]
+        assert row["casual"] == pytest.approx(expected_casual)
+        assert row["member"] == pytest.approx(expected_member)
+
+    def test_breakdowns_sum_to_total(self, trips) -> None:
+        grid = scenario_grid({"MemberPricing.PER_MINUTE": [0.07, 0.09]})
+        result = run_scenarios(trips, grid, max_workers=1)
+        total = result["total"]
+        assert result["by_station"].sum(axis=1).values == pytest.approx(total.values)
+        assert result["by_month"].sum(axis=1).values == pytest.approx(total.values)
+        assert list(result["by_month"].columns) == ["2024-01", "2024-02"]
+
+    def test_process_pool_matches_inline(self, trips) -> None:
+        grid = scenario_grid({"PeakHourPricing.MULTIPLIER": [1.0, 1.3, 1.5]})
+        inline = run_scenarios(trips, grid, max_workers=1)
+        pooled = run_scenarios(trips, grid, max_workers=2)
+        pd.testing.assert_frame_equal(inline["by_station"], pooled["by_station"])
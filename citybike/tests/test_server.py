@@ -0,0 +1,233 @@
+"""
+Unit tests for the local query server.
+
+Covers:
+    - parse_filters validation and normalization
+    - filtered_system against a manually filtered analyzer
+    - LRUCache eviction and QueryEngine caching
+    - snapshot versions in the cache key and refresh
+    - HTTP routing, error codes, /stats latency (known endpoints only)
+      and concurrent requests
+"""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from analyzer import BikeShareSystem
+from snapshot import SnapshotStore
+from server import (
+    ENDPOINTS,
+    LRUCache,
+    QueryEngine,
+    filtered_system,
+    load_system,
+    parse_filters,
+    serve,
+    to_json,
+)
+
+
+@pytest.fixture(scope="module")
+def system() -> BikeShareSystem:
+    return load_system()
+
+
+@pytest.fixture(scope="module")
+def server(system):
+    store = SnapshotStore(loader=lambda: system, system=system)
+    server = serve(store, port=0, workers=4)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def get(server, path: str, method: str = "GET") -> tuple[int, dict]:
+    url = f"http://127.0.0.1:{server.server_address[1]}{path}"
+    try:
+        request = urllib.request.Request(url, method=method)
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as exc:
+        return exc.code, json.loads(exc.read())
+
+
+# ---------------------------------------------------------------------------
+# Filters
+# ---------------------------------------------------------------------------
+
+class TestParseFilters:
+
+    def test_normalizes_values(self) -> None:
+        filters = parse_filters({"start": ["2024-03-01"], "station": ["S2,S1"],
+                                 "user_type": ["member"], "n": ["5"]})
+        assert filters == {"start": "2024-03-01 00:00:00", "station": ("S1", "S2"),
+                           "user_type": "member", "n": 5}
+
+    @pytest.mark.parametrize("query", [
+        {"colour": ["red"]},
+        {"start": ["yesterday-ish"]},
+        {"start": ["2024-03-01T00:00:00Z"]},
+        {"end": ["2024-03-01 00:00:00+02:00"]},
+        {"user_type": ["tourist"]},
+        {"bike_type": ["tandem"]},
+        {"n": ["five"]},
+        {"n": ["0"]},
+    ])
+    def test_rejects_invalid(self, query) -> None:
+        with pytest.raises(ValueError):
+            parse_filters(query)
+
+
+class TestFilteredSystem:
+
+    def test_matches_manual_filter(self, system) -> None:
+        filters = parse_filters({"start": ["2024-06-01"], "end": ["2024-09-01"],
+                                 "user_type": ["casual"]})
+        view = filtered_system(system, filters)
+
+        trips = system.trips
+        expected = BikeShareSystem()
+        expected.trips = trips[(trips["start_time"] >= "2024-06-01")
+                               & (trips["start_time"] < "2024-09-01")
+                               & (trips["user_type"] == "casual")].copy()
+        expected.stations = system.stations
+        assert len(view.trips) == len(expected.trips) > 0
+        assert view.total_trips_summary() == expected.total_trips_summary()
+        pd.testing.assert_frame_equal(view.top_start_stations(5),
+                                      expected.top_start_stations(5))
+
+    def test_bike_type_filters_maintenance(self, system) -> None:
+        view = filtered_system(system, {"bike_type": "electric"})
+        assert set(view.maintenance["bike_type"]) == {"electric"}
+        assert set(view.trips["bike_type"]) == {"electric"}
+
+    def test_does_not_touch_shared_trips(self, system) -> None:
+        columns = list(system.trips.columns)
+        filtered_system(system, {"user_type": "member"}).busiest_day_of_week()
+        assert list(system.trips.columns) == columns
+
+    def test_string_maintenance_dates(self, system) -> None:
+        raw = BikeShareSystem()
+        raw.trips, raw.stations = system.trips, system.stations
+        raw.maintenance = system.maintenance.assign(
+            date=system.maintenance["date"].dt.strftime("%Y-%m-%d"))
+        filters = {"start": "2024-06-01 00:00:00", "end": "2024-09-01 00:00:00"}
+        pd.testing.assert_series_equal(
+            filtered_system(raw, filters).maintenance_cost_by_bike_type(),
+            filtered_system(system, filters).maintenance_cost_by_bike_type())
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+class TestQueryEngine:
+
+    def test_lru_evicts_oldest(self) -> None:
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1 and len(cache) == 2
+
+    def test_second_query_is_cached(self, system) -> None:
+        engine = QueryEngine(system)
+        first, cached, version = engine.query("top_routes", {"n": 3})
+        assert not cached and version == 1
+        second, cached, _ = engine.query("top_routes", {"n": 3})
+        assert cached and second == first
+        assert engine.cache.hits == 1
+
+    def test_cache_disabled(self, system) -> None:
+        engine = QueryEngine(system, cache_size=0)
+        engine.query("total_trips_summary", {})
+        assert not engine.query("total_trips_summary", {})[1]
+
+    def test_results_match_analyzer(self, system) -> None:
+        engine = QueryEngine(system)
+        for method, params in ENDPOINTS.items():
+            result, _, _ = engine.query(method, {})
+            assert result == to_json(getattr(system, method)())
+
+    def test_refresh_publishes_new_version(self, system) -> None:
+        store = SnapshotStore(loader=lambda: system, system=system)
+        engine = QueryEngine(store)
+        engine.query("total_trips_summary", {})
+        assert engine.refresh()["version"] == 2
+        _, cached, version = engine.query("total_trips_summary", {})
+        assert not cached and version == 2
+
+    def test_unknown_method(self, system) -> None:
+        with pytest.raises(KeyError):
+            QueryEngine(system).query("drop_tables", {})
+
+
+# ---------------------------------------------------------------------------
+# HTTP
+# ---------------------------------------------------------------------------
+
+class TestHttp:
+
+    def test_health_and_index(self, server) -> None:
+        assert get(server, "/health") == (200, {"status": "ok"})
+        status, body = get(server, "/api")
+        assert status == 200 and set(body["endpoints"]) == set(ENDPOINTS)
+
+    def test_query_reports_cache_and_latency(self, server) -> None:
+        path = "/api/top_start_stations?n=3&start=2024-06-01&end=2024-09-01"
+        status, first = get(server, path)
+        assert status == 200 and len(first["result"]) == 3
+        assert not first["cached"] and first["elapsed_ms"] >= 0
+        _, second = get(server, path)
+        assert second["cached"] and second["result"] == first["result"]
+
+    def test_error_codes(self, server) -> None:
+        assert get(server, "/api/top_routes?n=bad")[0] == 400
+        assert get(server, "/api/top_routes?start=2024-03-01T00:00:00Z")[0] == 400
+        assert get(server, "/api/drop_tables")[0] == 404
+        assert get(server, "/nowhere")[0] == 404
+
+    def test_stats_track_endpoints(self, server) -> None:
+        get(server, "/api/peak_usage_hours")
+        get(server, "/api/peak_usage_hours?user_type=bogus")
+        _, stats = get(server, "/stats")
+        entry = stats["endpoints"]["/api/peak_usage_hours"]
+        assert entry["requests"] >= 2 and entry["errors"] >= 1
+        assert set(entry["latency_ms"]) == {"p50", "p95", "p99", "max"}
+
+    def test_stats_skip_unknown_endpoints(self, server) -> None:
+        assert get(server, "/api/no_such_method")[0] == 404
+        _, stats = get(server, "/stats")
+        assert "/api/no_such_method" not in stats["endpoints"]
+
+    def test_concurrent_requests(self, server) -> None:
+        paths = [f"/api/{method}?user_type={user}"
+                 for method in ENDPOINTS for user in ("casual", "member")] * 2
+        with ThreadPoolExecutor(8) as pool:
+            responses = list(pool.map(lambda p: get(server, p), paths))
+        assert all(status == 200 for status, _ in responses)
+        half = len(paths) // 2
+        assert [b["result"] for _, b in responses[:half]] == \
+               [b["result"] for _, b in responses[half:]]
+
+    def test_refresh_during_queries(self, server) -> None:
+        paths = [f"/api/{method}" for method in ENDPOINTS] * 3
+        with ThreadPoolExecutor(8) as pool:
+            futures = [pool.submit(get, server, p) for p in paths]
+            status, refreshed = get(server, "/refresh", method="POST")
+            responses = [f.result() for f in futures]
+        assert status == 200 and refreshed["trips"] > 0
+        assert all(code == 200 for code, _ in responses)
+        _, body = get(server, "/api/total_trips_summary?bike_type=classic")
+        assert body["version"] == refreshed["version"]
+        assert get(server, "/nowhere", method="POST")[0] == 404
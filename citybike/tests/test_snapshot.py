@@ -0,0 +1,118 @@
+"""
+Unit tests for copy-on-write snapshots.
+
+Covers:
+    - analytics methods leave the trips frame untouched
+    - Snapshot freezing and reader isolation
+    - SnapshotStore versioning, refresh and concurrent readers
+"""
+
+import threading
+
+import pandas as pd
+import pytest
+
+from analyzer import BikeShareSystem
+from server import load_system
+from snapshot import Snapshot, SnapshotStore
+
+
+METHODS = ["total_trips_summary", "top_start_stations", "peak_usage_hours",
+           "busiest_day_of_week", "avg_distance_by_user_type",
+           "monthly_trip_trend", "top_active_users",
+           "maintenance_cost_by_bike_type", "top_routes"]
+
+
+@pytest.fixture(scope="module")
+def system() -> BikeShareSystem:
+    return load_system()
+
+
+# ---------------------------------------------------------------------------
+# Read-only analytics
+# ---------------------------------------------------------------------------
+
+class TestReadOnlyAnalytics:
+
+    def test_methods_do_not_mutate_trips(self, system) -> None:
+        before = system.trips.copy()
+        for method in METHODS:
+            getattr(system, method)()
+        pd.testing.assert_frame_equal(system.trips, before)
+
+    def test_result_labels_unchanged(self, system) -> None:
+        assert system.busiest_day_of_week().index.name == "day"
+        assert system.monthly_trip_trend().index.name == "year_month"
+        assert system.peak_usage_hours().index.name == "hour"
+
+
+# ---------------------------------------------------------------------------
+# Snapshot
+# ---------------------------------------------------------------------------
+
+class TestSnapshot:
+
+    def test_publisher_changes_do_not_leak(self, system) -> None:
+        source = BikeShareSystem()
+        source.trips = system.trips.copy()
+        source.stations, source.maintenance = system.stations, system.maintenance
+        snapshot = Snapshot.from_system(source, 1)
+        source.trips.loc[:, "distance_km"] = 0.0
+        assert snapshot.trips["distance_km"].sum() > 0
+
+    def test_reader_writes_are_private(self, system) -> None:
+        snapshot = Snapshot.from_system(system, 1)
+        reader = snapshot.system()
+        reader.trips["scratch"] = 1
+        reader.trips.loc[:, "distance_km"] = 0.0
+        assert "scratch" not in snapshot.trips
+        assert snapshot.system().total_trips_summary() == system.total_trips_summary()
+
+    def test_requires_loaded_frames(self) -> None:
+        with pytest.raises(ValueError):
+            Snapshot.from_system(BikeShareSystem(), 1)
+
+
+# ---------------------------------------------------------------------------
+# SnapshotStore
+# ---------------------------------------------------------------------------
+
+class TestSnapshotStore:
+
+    def test_versions_increase_and_old_snapshots_survive(self, system) -> None:
+        store = SnapshotStore(loader=lambda: system)
+        assert store.version == 0
+        first = store.refresh()
+        second = store.refresh()
+        assert (first.version, second.version) == (1, 2)
+        assert store.current() is second
+        assert first.system().total_trips_summary() == second.system().total_trips_summary()
+
+    def test_current_before_publish(self) -> None:
+        with pytest.raises(ValueError):
+            SnapshotStore().current()
+
+    def test_refresh_needs_loader(self, system) -> None:
+        with pytest.raises(ValueError):
+            SnapshotStore(system=system).refresh()
+
+    def test_concurrent_readers_during_refresh(self, system) -> None:
+        store = SnapshotStore(loader=lambda: system, system=system)
+        expected = {m: repr(getattr(system, m)()) for m in METHODS}
+        errors: list[str] = []
+
+        def reader() -> None:
+            for _ in range(3):
+                view = store.current().system()
+                for method in METHODS:
+                    if repr(getattr(view, method)()) != expected[method]:
+                        errors.append(method)
+
+        threads = [threading.Thread(target=reader) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for _ in range(3):
+            store.refresh()
+        for thread in threads:
+            thread.join()
+        assert errors == [] and store.version == 4
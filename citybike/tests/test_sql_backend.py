@@ -0,0 +1,147 @@
+"""
+Unit tests for the SQLite analytics backend.
+
+Covers:
+    - bulk load (row counts, NULLs, epoch timestamps, indexes)
+    - parity of every analytics method with the pandas BikeShareSystem,
+      unfiltered and through filtered() views
+    - index use for window queries
+    - on-disk databases and the CLI
+"""
+
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from server import filtered_system, load_system
+from sql_backend import INDEXES, SQLiteSystem, main
+
+
+METHODS = ["total_trips_summary", "top_start_stations", "peak_usage_hours",
+           "busiest_day_of_week", "avg_distance_by_user_type",
+           "monthly_trip_trend", "top_active_users",
+           "maintenance_cost_by_bike_type", "top_routes"]
+
+FILTERS = [
+    {"start": "2024-06-01", "end": "2024-09-01"},
+    {"user_type": "member", "bike_type": "electric"},
+    {"station": ("ST101", "ST104")},
+    {"start": "2030-01-01"},
+]
+
+
+@pytest.fixture(scope="module")
+def system():
+    return load_system()
+
+
+@pytest.fixture(scope="module")
+def backend(system):
+    backend = SQLiteSystem.from_system(system)
+    yield backend
+    backend.close()
+
+
+def assert_same(expected, actual) -> None:
+    if isinstance(expected, pd.DataFrame):
+        pd.testing.assert_frame_equal(actual, expected)
+    elif isinstance(expected, pd.Series):
+        pd.testing.assert_series_equal(actual, expected)
+    else:
+        assert actual == pytest.approx(expected, nan_ok=True)
+
+
+# ---------------------------------------------------------------------------
+# Loading
+# ---------------------------------------------------------------------------
+
+class TestLoad:
+
+    def test_row_counts_and_indexes(self, system, backend) -> None:
+        counts = backend.fetch("SELECT COUNT(*) AS n FROM trips")["n"].iloc[0]
+        assert counts == len(system.trips)
+        names = set(backend.fetch(
+            "SELECT name FROM sqlite_master WHERE type = 'index'")["name"])
+        assert set(INDEXES) <= names
+
+    def test_missing_values_are_null(self) -> None:
+        frame = pd.DataFrame({
+            "trip_id": ["T1", None],
+            "start_time": pd.to_datetime(["2024-01-01 08:00:00", None]),
+            "distance_km": [1.5, float("nan")],
+        })
+        db = SQLiteSystem()
+        db.load(frame, pd.DataFrame({"station_id": ["S1"]}),
+                pd.DataFrame({"bike_id": ["B1"], "date": ["2024-01-02"]}))
+        rows = db.fetch("SELECT * FROM trips ORDER BY trip_id")
+        assert rows["start_time"].iloc[1] == 1704096000
+        assert rows.iloc[0].isna().all()
+        assert db.fetch("SELECT date FROM maintenance")["date"].iloc[0] == 1704153600
+
+    def test_reload_replaces_tables(self, system) -> None:
+        db = SQLiteSystem.from_system(system)
+        db.load(system.trips.iloc[:10], system.stations, system.maintenance)
+        assert db.total_trips_summary()["total_trips"] == 10
+
+
+# ---------------------------------------------------------------------------
+# Parity with pandas
+# ---------------------------------------------------------------------------
+
+class TestParity:
+
+    @pytest.mark.parametrize("method", METHODS)
+    def test_unfiltered(self, system, backend, method) -> None:
+        assert_same(getattr(system, method)(), getattr(backend, method)())
+
+    @pytest.mark.parametrize("filters", FILTERS)
+    def test_filtered(self, system, backend, filters) -> None:
+        view = filtered_system(system, filters)
+        sql_view = backend.filtered(**filters)
+        for method in METHODS:
+            assert_same(getattr(view, method)(), getattr(sql_view, method)())
+
+    def test_top_n(self, system, backend) -> None:
+        for n in (1, 3, 1000):
+            assert_same(system.top_routes(n), backend.top_routes(n))
+            assert_same(system.top_active_users(n), backend.top_active_users(n))
+
+    def test_filtered_views_stack(self, backend) -> None:
+        view = backend.filtered(user_type="member").filtered(bike_type="classic")
+        assert view.filters == {"user_type": "member", "bike_type": "classic"}
+        assert backend.filters == {}
+
+    def test_unknown_filter(self, backend) -> None:
+        with pytest.raises(ValueError):
+            backend.filtered(colour="red")
+
+
+# ---------------------------------------------------------------------------
+# Query plans / storage
+# ---------------------------------------------------------------------------
+
+class TestStorage:
+
+    def test_window_query_uses_start_time_index(self, backend) -> None:
+        where, params = backend.filtered(start="2024-06-01", end="2024-06-08")._where("trips")
+        plan = " ".join(backend.fetch(
+            f"EXPLAIN QUERY PLAN SELECT COUNT(*) FROM trips{where}", params)["detail"])
+        assert "idx_trips_start_time" in plan
+
+    def test_on_disk_database(self, system, tmp_path) -> None:
+        path = tmp_path / "citybike.sqlite"
+        SQLiteSystem.from_system(system, path).close()
+        reopened = SQLiteSystem(path)
+        assert_same(system.top_start_stations(5), reopened.top_start_stations(5))
+        with sqlite3.connect(path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM stations").fetchone()[0] == \
+                   len(system.stations)
+
+    def test_cli_query(self, tmp_path, capsys) -> None:
+        path = str(tmp_path / "cli.sqlite")
+        main(["--db", path])
+        main(["--db", path, "--no-load", "--method", "top_start_stations",
+              "--n", "2", "--user-type", "member"])
+        out = capsys.readouterr().out
+        assert "Loaded" in out and "station_name" in out
@@ -0,0 +1,142 @@
+"""
+Unit tests for the array-backed TripTable and its row views.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from datetime import datetime
+
+from factories import IdentityMap, create_stations_bulk
+from models import Trip
+from trip_table import TRIP_COLUMNS, TripTable, TripView
+
+
+@pytest.fixture
+def trips() -> pd.DataFrame:
+    return pd.DataFrame({
+        "trip_id": ["TR1", "TR2", "TR3"],
+        "user_id": ["U2", "U1", "U2"],
+        "user_type": ["member", "casual", "member"],
+        "bike_id": ["BK1", "BK2", "BK1"],
+        "bike_type": ["classic", "electric", "classic"],
+        "start_station_id": ["ST100", "ST101", "ST100"],
+        "end_station_id": ["ST101", "ST102", "ST100"],
+        "start_time": ["2024-01-01 08:00:00", "2024-01-01 09:00:00",
+                       "2024-01-02 10:00:00"],
+        "end_time": ["2024-01-01 08:20:00", "2024-01-01 09:30:30",
+                     "2024-01-02 10:05:00"],
+        "distance_km": [3.0, 5.5, 1.0],
+        "status": ["completed", "completed", "cancelled"],
+    })
+
+
+@pytest.fixture
+def stations() -> pd.DataFrame:
+    return pd.DataFrame({
+        "station_id": ["ST100", "ST101", "ST102"],
+        "station_name": ["Central", "Harbor", "Old Town"],
+        "capacity": [20, 15, 10],
+        "latitude": [48.8, 48.9, 48.85],
+        "longitude": [9.2, 9.3, 9.25],
+    })
+
+
+class TestTripTable:
+
+    def test_length_and_dtypes(self, trips) -> None:
+        table = TripTable.from_frame(trips)
+        assert len(table) == 3
+        assert table.start_epoch.dtype == np.int64
+        assert table.distance_km.dtype == np.float32
+        assert table.user_codes.dtype == np.int32
+        assert table.trip_ids.dtype == np.dtype("S3")
+        assert table.nbytes == 3 * (38 + 3)
+
+    def test_view_matches_trip_attributes(self, trips) -> None:
+        view = TripTable.from_frame(trips)[1]
+        assert isinstance(view, TripView)
+        assert view.trip_id == "TR2"
+        assert view.user_id == "U1"
+        assert view.user_type == "casual"
+        assert view.bike_id == "BK2"
+        assert view.start_station_id == "ST101"
+        assert view.end_station_id == "ST102"
+        assert view.start_time == datetime(2024, 1, 1, 9, 0)
+        assert view.duration_minutes == pytest.approx(30.5)
+        assert view.distance_km == pytest.approx(5.5)
+
+    def test_negative_index_and_bounds(self, trips) -> None:
+        table = TripTable.from_frame(trips)
+        assert table[-1].trip_id == "TR3"
+        with pytest.raises(IndexError):
+            table[3]
+
+    def test_mask_returns_sub_table(self, trips) -> None:
+        table = TripTable.from_frame(trips)
+        sub = table[table.bike_type_codes == 0]
+        assert [v.trip_id for v in sub] == ["TR1", "TR3"]
+        assert sub[0].bike_type == "classic"
+
+    def test_duration_column(self, trips) -> None:
+        table = TripTable.from_frame(trips)
+        assert table.duration_minutes == pytest.approx([20.0, 30.5, 5.0])
+
+    def test_round_trip_frame(self, trips) -> None:
+        frame = TripTable.from_frame(trips).to_frame()
+        assert frame["trip_id"].tolist() == ["TR1", "TR2", "TR3"]
+        assert frame["end_station_id"].tolist() == ["ST101", "ST102", "ST100"]
+
+    def test_to_trip_materializes(self, trips, stations) -> None:
+        identity_map = IdentityMap()
+        create_stations_bulk(stations, identity_map)
+        table = TripTable.from_frame(trips)
+        trip = table[0].to_trip(identity_map=identity_map)
+        assert isinstance(trip, Trip)
+        assert trip.trip_id == "TR1"
+        assert trip.duration_minutes == pytest.approx(20.0)
+        assert trip.start_station is identity_map.stations["ST100"]
+
+    def test_materialize_all(self, trips, stations) -> None:
+        objs = TripTable.from_frame(trips).materialize(stations=stations)
+        assert [t.trip_id for t in objs] == ["TR1", "TR2", "TR3"]
+        assert objs[0].user is objs[2].user
+
+    def test_non_ascii_trip_ids(self, trips) -> None:
+        table = TripTable.from_frame(trips.assign(trip_id=["TRé1", "TR2", "TR3"]))
+        assert table[0].trip_id == "TRé1"
+        assert table.to_frame()["trip_id"].tolist() == ["TRé1", "TR2", "TR3"]
+
+
+    @pytest.mark.parametrize("column", [
+        "trip_id", "user_id", "user_type", "bike_id", "bike_type",
+        "start_station_id", "end_station_id", "start_time",
+    ])
+    def test_rejects_missing_values(self, trips, column) -> None:
+        trips.loc[1, column] = None
+        with pytest.raises(ValueError, match=f"Missing {column} at rows \\[1\\]"):
+            TripTable.from_frame(trips)
+
+class TestFromCsv:
+
+    def test_chunks_match_whole_frame(self, trips, tmp_path) -> None:
+        path = tmp_path / "trips.csv"
+        trips.assign(trip_id=["TRé1", "TR2", "TR3"]).to_csv(path, index=False)
+        whole = TripTable.from_frame(pd.read_csv(path))
+        chunked = TripTable.from_csv(path, chunksize=1)
+        for name, values in whole._columns().items():
+            np.testing.assert_array_equal(getattr(chunked, name), values)
+        for name, values in whole._labels().items():
+            assert chunked._labels()[name].tolist() == values.tolist()
+        assert chunked[0].trip_id == "TRé1"
+
+    def test_rejects_missing_values(self, trips, tmp_path) -> None:
+        path = tmp_path / "trips.csv"
+        trips.assign(user_type=["member", None, "member"]).to_csv(path, index=False)
+        with pytest.raises(ValueError, match="Missing user_type"):
+            TripTable.from_csv(path, chunksize=2)
+
+    def test_empty_csv(self, tmp_path) -> None:
+        path = tmp_path / "trips.csv"
+        path.write_text(",".join(TRIP_COLUMNS) + "\n")
+        assert len(TripTable.from_csv(path)) == 0
@@ -7,7 +7,24 @@ Covers all validation, parsing, and formatting helpers.
 import pytest
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
+
 from utils import (
+    ColumnReport,
+    audit_maintenance,
+    audit_trips,
+    check_email,
+    check_in,
+    check_non_negative,
+    check_numeric,
+    check_positive,
+    check_time_order,
+    summarize_reports,
+    validate_positive_column,
+    validate_non_negative_column,
+    validate_email_column,
+    validate_in_column,
     validate_positive,
     validate_non_negative,
     validate_email,
@@ -150,3 +167,124 @@ class TestFmtCurrency:
 
     def test_large_amount(self) -> None:
         assert fmt_currency(1234.567) == "€1234.57"
+
+
+# ---------------------------------------------------------------------------
+# Column validators
+# ---------------------------------------------------------------------------
+
+class TestColumnValidators:
+
+    def test_positive_column_ok(self) -> None:
+        values = np.array([1.0, 2.5])
+        assert validate_positive_column(values) is values
+
+    def test_positive_column_reports_positions(self) -> None:
+        with pytest.raises(ValueError, match=r"capacity must be positive at rows \[1, 3\]"):
+            validate_positive_column([5, 0, 2, -1], name="capacity")
+
+    def test_nan_is_invalid(self) -> None:
+        with pytest.raises(ValueError, match=r"at rows \[0\]"):
+            validate_non_negative_column([np.nan, 0.0])
+
+    def test_series_reports_index_labels(self) -> None:
+        series = pd.Series([1.0, -2.0], index=[10, 20])
+        with pytest.raises(ValueError, match=r"at rows \[20\]"):
+            validate_non_negative_column(series, name="cost")
+
+    def test_email_column(self) -> None:
+        validate_email_column(["a@x.com", "b@y.org"])
+        with pytest.raises(ValueError, match=r"Invalid email at rows \[1, 2\]"):
+            validate_email_column(["a@x.com", "nope", None])
+
+    def test_email_column_matches_scalar_validator(self) -> None:
+        emails = ["john smith@mail.com", "a@", "@x.com", "a@x.com"]
+        for email in emails:
+            validate_email(email)
+        validate_email_column(pd.Series(emails))
+        assert check_email(emails).rows.tolist() == [0, 1, 2]
+
+    def test_in_column(self) -> None:
+        validate_in_column(["casual", "member"], {"casual", "member"})
+        with pytest.raises(ValueError, match=r"user_type must be one of .* at rows \[2\]"):
+            validate_in_column(["casual", "member", "guest"],
+                               {"casual", "member"}, name="user_type")
+
+    def test_many_rows_are_truncated(self) -> None:
+        with pytest.raises(ValueError, match=r"\(\+5 more\)"):
+            validate_positive_column(np.zeros(15))
+
+
+# ---------------------------------------------------------------------------
+# Column reports and audits
+# ---------------------------------------------------------------------------
+
+class TestColumnReports:
+
+    def test_clean_column_is_ok(self) -> None:
+        report = check_positive(np.array([1.0, 2.0]), name="capacity")
+        assert isinstance(report, ColumnReport)
+        assert report.ok
+        assert report.n_bad == 0
+
+    def test_report_rows_and_values(self) -> None:
+        series = pd.Series([3.0, -1.0, np.nan, 0.0], index=[5, 6, 7, 8])
+        report = check_non_negative(series, name="cost")
+        assert report.column == "cost"
+        assert report.rows.tolist() == [6, 7]
+        assert report.values[0] == -1.0
+        assert np.isnan(report.values[1])
+
+    def test_non_numeric_values_are_bad(self) -> None:
+        report = check_positive(["1.5", "abc", 2])
+        assert report.rows.tolist() == [1]
+
+    def test_numeric_allows_negatives(self) -> None:
+        report = check_numeric(pd.Series([-1.0, "2", "abc", None, np.nan]))
+        assert report.rows.tolist() == [2, 3, 4]
+        assert report.rule == "numeric"
+
+    def test_email_regex(self) -> None:
+        report = check_email(["a@x.com", "@x.com", "a@", "a b@x.com", None])
+        assert report.rows.tolist() == [1, 2, 3, 4]
+
+    def test_in_via_isin(self) -> None:
+        report = check_in(pd.Series(["casual", "Member", "member"]),
+                          {"casual", "member"}, name="user_type")
+        assert report.rows.tolist() == [1]
+        assert report.values.tolist() == ["Member"]
+
+    def test_time_order(self) -> None:
+        start = pd.Series(["2024-01-01 10:00:00", "2024-01-01 10:00:00"])
+        end = pd.Series(["2024-01-01 10:30:00", "2024-01-01 09:00:00"])
+        assert check_time_order(start, end).rows.tolist() == [1]
+
+
+class TestAudits:
+
+    def test_audit_trips(self) -> None:
+        trips = pd.DataFrame({
+            "trip_id": ["TR1", "TR2", None],
+            "user_type": ["casual", "member", "guest"],
+            "start_time": ["2024-01-01 08:00:00", "2024-01-01 09:00:00", "oops"],
+            "end_time": ["2024-01-01 08:10:00", "2024-01-01 08:00:00",
+                         "2024-01-01 09:00:00"],
+            "distance_km": [1.0, np.nan, 2.0],
+        })
+        summary = summarize_reports(audit_trips(trips)).set_index(["column", "rule"])
+        assert summary.loc[("trip_id", "not_null"), "n_bad"] == 1
+        assert summary.loc[("start_time", "datetime"), "rows"] == [2]
+        assert summary.loc[("end_time", "after_start"), "rows"] == [1]
+        assert summary.loc[("distance_km", "non_negative"), "rows"] == [1]
+        assert summary["n_bad"].sum() == 5
+
+    def test_audit_maintenance(self) -> None:
+        maintenance = pd.DataFrame({
+            "record_id": ["MR1", "MR2"],
+            "maintenance_type": ["tire_repair", "paint_job"],
+            "cost": [-3.0, 12.0],
+        })
+        reports = {r.column: r for r in audit_maintenance(maintenance)}
+        assert reports["maintenance_type"].rows.tolist() == [1]
+        assert reports["cost"].rows.tolist() == [0]
+        assert "date" not in reports
@@ -0,0 +1,358 @@
+"""
+Array-backed trip storage (struct of arrays).
+
+A TripTable keeps every trip column as one NumPy array:
+
+    trip_id             UTF-8 fixed-width bytes
+    user / bike /       int32 codes into sorted label arrays
+    station columns
+    user_type,          int8 codes
+    bike_type
+    start / end         int64 epoch seconds
+    distance_km         float32
+
+That is 38 bytes per trip plus the width of the longest trip ID (48
+bytes for IDs like 'TR10000000'), against several hundred for a
+models.Trip graph. User, bike and station labels are shared, so they
+grow with the number of distinct IDs, not with the number of trips.
+`TripTable.from_csv` encodes the file chunk by chunk and merges the
+per-chunk labels, so the whole CSV is never held as a DataFrame.
+
+Indexing a table returns a TripView: a two-slot object exposing the
+same attributes as models.Trip (including duration_minutes) that reads
+straight from the arrays. A real Trip is only built on request through
+`TripView.to_trip` / `TripTable.materialize`.
+"""
+
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from factories import IdentityMap, create_trips_bulk
+from models import Trip
+from utils import check_not_null
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+# Code column -> label set it indexes into.
+_CODE_LABELS = {
+    "user_codes": "user",
+    "bike_codes": "bike",
+    "start_station_codes": "station",
+    "end_station_codes": "station",
+    "user_type_codes": "user_type",
+    "bike_type_codes": "bike_type",
+}
+
+_ID_COLUMNS = ["trip_id", "user_id", "bike_id", "start_station_id", "end_station_id"]
+
+# Columns stored as codes or epochs, which have no slot for a missing value.
+_REQUIRED_COLUMNS = _ID_COLUMNS + ["user_type", "bike_type", "start_time", "end_time"]
+
+TRIP_COLUMNS = [
+    "trip_id", "user_id", "user_type", "bike_id", "bike_type",
+    "start_station_id", "end_station_id", "start_time", "end_time",
+    "distance_km",
+]
+
+
+def _to_datetime(seconds: int) -> datetime:
+    return _EPOCH + timedelta(seconds=seconds)
+
+
+def _encode(trips: pd.DataFrame) -> tuple[dict[str, np.ndarray], dict[str, np.ndarray]]:
+    """Encode one trips frame into (columns, labels) with sorted labels.
+
+    Raises:
+        ValueError: If an ID, type or time is missing.
+    """
+    for column in _REQUIRED_COLUMNS:
+        check_not_null(trips[column], column).raise_if_bad(f"Missing {column}")
+
+    def codes(values, dtype) -> tuple[np.ndarray, np.ndarray]:
+        code, labels = pd.factorize(values, sort=True)
+        return code.astype(dtype), np.asarray(labels, dtype=object)
+
+    def epoch(column: pd.Series) -> np.ndarray:
+        if not pd.api.types.is_datetime64_any_dtype(column):
+            column = pd.to_datetime(column)
+        return column.to_numpy().astype("datetime64[s]").astype(np.int64)
+
+    user_codes, user_labels = codes(trips["user_id"], np.int32)
+    bike_codes, bike_labels = codes(trips["bike_id"], np.int32)
+    user_type_codes, user_type_labels = codes(trips["user_type"], np.int8)
+    bike_type_codes, bike_type_labels = codes(trips["bike_type"], np.int8)
+    station_labels = np.asarray(
+        np.union1d(trips["start_station_id"].astype(str),
+                   trips["end_station_id"].astype(str)),
+        dtype=object,
+    )
+    station_index = pd.Index(station_labels)
+
+    columns = {
+        "trip_ids": trips["trip_id"].astype(str).str.encode("utf-8")
+                    .to_numpy().astype(np.bytes_),
+        "user_codes": user_codes,
+        "bike_codes": bike_codes,
+        "start_station_codes": station_index.get_indexer(
+            trips["start_station_id"].astype(str)).astype(np.int32),
+        "end_station_codes": station_index.get_indexer(
+            trips["end_station_id"].astype(str)).astype(np.int32),
+        "user_type_codes": user_type_codes,
+        "bike_type_codes": bike_type_codes,
+        "start_epoch": epoch(trips["start_time"]),
+        "end_epoch": epoch(trips["end_time"]),
+        "distance_km": trips["distance_km"].to_numpy(dtype=np.float32),
+    }
+    labels = {
+        "user": user_labels,
+        "bike": bike_labels,
+        "station": station_labels,
+        "user_type": user_type_labels,
+        "bike_type": bike_type_labels,
+    }
+    return columns, labels
+
+
+def _merge(
+    parts: list[tuple[dict[str, np.ndarray], dict[str, np.ndarray]]],
+) -> tuple[dict[str, np.ndarray], dict[str, np.ndarray]]:
+    """Merge encoded chunks: union the labels, remap codes, concatenate arrays."""
+    labels = {
+        name: np.asarray(np.unique(np.concatenate([part[name] for _, part in parts])),
+                         dtype=object)
+        for name in parts[0][1]
+    }
+    indexes = {name: pd.Index(values) for name, values in labels.items()}
+    columns = {}
+    for column in parts[0][0]:
+        arrays = []
+        for part_columns, part_labels in parts:
+            values = part_columns[column]
+            name = _CODE_LABELS.get(column)
+            if name is not None:
+                remap = indexes[name].get_indexer(part_labels[name])
+                values = remap[values].astype(values.dtype)
+            arrays.append(values)
+        columns[column] = np.concatenate(arrays)
+    return columns, labels
+
+
+class TripView:
+    """Lightweight read-only view of one row of a TripTable."""
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: "TripTable", row: int) -> None:
+        self._table = table
+        self._row = row
+
+    @property
+    def trip_id(self) -> str:
+        return self._table.trip_ids[self._row].decode()
+
+    @property
+    def user_id(self) -> str:
+        return self._table.user_labels[self._table.user_codes[self._row]]
+
+    @property
+    def user_type(self) -> str:
+        return self._table.user_type_labels[self._table.user_type_codes[self._row]]
+
+    @property
+    def bike_id(self) -> str:
+        return self._table.bike_labels[self._table.bike_codes[self._row]]
+
+    @property
+    def bike_type(self) -> str:
+        return self._table.bike_type_labels[self._table.bike_type_codes[self._row]]
+
+    @property
+    def start_station_id(self) -> str:
+        return self._table.station_labels[self._table.start_station_codes[self._row]]
+
+    @property
+    def end_station_id(self) -> str:
+        return self._table.station_labels[self._table.end_station_codes[self._row]]
+
+    @property
+    def start_time(self) -> datetime:
+        return _to_datetime(int(self._table.start_epoch[self._row]))
+
+    @property
+    def end_time(self) -> datetime:
+        return _to_datetime(int(self._table.end_epoch[self._row]))
+
+    @property
+    def distance_km(self) -> float:
+        return float(self._table.distance_km[self._row])
+
+    @property
+    def duration_minutes(self) -> float:
+        """Trip duration in minutes, computed like models.Trip."""
+        t = self._table
+        return int(t.end_epoch[self._row] - t.start_epoch[self._row]) / 60
+
+    def to_trip(
+        self,
+        stations: pd.DataFrame | None = None,
+        identity_map: IdentityMap | None = None,
+    ) -> Trip:
+        """Materialize a full models.Trip for this row."""
+        return self._table.materialize([self._row], stations, identity_map)[0]
+
+    def __str__(self) -> str:
+        return f"Trip({self.trip_id})"
+
+    def __repr__(self) -> str:
+        return f"TripView(trip_id={self.trip_id!r})"
+
+
+class TripTable:
+    """Trips stored as parallel NumPy arrays.
+
+    Attributes:
+        trip_ids: UTF-8 encoded trip IDs as a fixed-width bytes array.
+        user_codes, bike_codes: int32 codes into user_labels / bike_labels.
+        start_station_codes, end_station_codes: int32 codes into
+            station_labels.
+        user_type_codes, bike_type_codes: int8 codes into the type labels.
+        start_epoch, end_epoch: int64 seconds since 1970-01-01.
+        distance_km: float32 distances.
+    """
+
+    def __init__(self, columns: dict[str, np.ndarray], labels: dict[str, np.ndarray]) -> None:
+        self.trip_ids = columns["trip_ids"]
+        self.user_codes = columns["user_codes"]
+        self.bike_codes = columns["bike_codes"]
+        self.start_station_codes = columns["start_station_codes"]
+        self.end_station_codes = columns["end_station_codes"]
+        self.user_type_codes = columns["user_type_codes"]
+        self.bike_type_codes = columns["bike_type_codes"]
+        self.start_epoch = columns["start_epoch"]
+        self.end_epoch = columns["end_epoch"]
+        self.distance_km = columns["distance_km"]
+        self.user_labels = labels["user"]
+        self.bike_labels = labels["bike"]
+        self.station_labels = labels["station"]
+        self.user_type_labels = labels["user_type"]
+        self.bike_type_labels = labels["bike_type"]
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_frame(cls, trips: pd.DataFrame) -> "TripTable":
+        """Build a table from a trips DataFrame (columns of trips_clean.csv).
+
+        Raises:
+            ValueError: If a column is missing, or an ID, type or time
+                is missing in some row.
+        """
+        missing = [c for c in TRIP_COLUMNS if c not in trips.columns]
+        if missing:
+            raise ValueError(f"Missing columns: {missing}")
+        return cls(*_encode(trips))
+
+    @classmethod
+    def from_csv(cls, path, chunksize: int = 1_000_000) -> "TripTable":
+        """Load a trips CSV chunk by chunk into a table.
+
+        Each chunk is encoded to arrays as soon as it is read; only the
+        per-chunk arrays and labels are kept, then merged once. The
+        result equals ``from_frame`` on the whole file.
+        """
+        chunks = pd.read_csv(path, usecols=TRIP_COLUMNS, chunksize=chunksize,
+                             dtype=dict.fromkeys(_ID_COLUMNS, str))
+        parts = [_encode(chunk) for chunk in chunks]
+        if not parts:
+            return cls.from_frame(pd.DataFrame(columns=TRIP_COLUMNS))
+        return cls(*_merge(parts))
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+
+    def _columns(self) -> dict[str, np.ndarray]:
+        return {
+            "trip_ids": self.trip_ids,
+            "user_codes": self.user_codes,
+            "bike_codes": self.bike_codes,
+            "start_station_codes": self.start_station_codes,
+            "end_station_codes": self.end_station_codes,
+            "user_type_codes": self.user_type_codes,
+            "bike_type_codes": self.bike_type_codes,
+            "start_epoch": self.start_epoch,
+            "end_epoch": self.end_epoch,
+            "distance_km": self.distance_km,
+        }
+
+    def _labels(self) -> dict[str, np.ndarray]:
+        return {
+            "user": self.user_labels,
+            "bike": self.bike_labels,
+            "station": self.station_labels,
+            "user_type": self.user_type_labels,
+            "bike_type": self.bike_type_labels,
+        }
+
+    def __len__(self) -> int:
+        return len(self.trip_ids)
+
+    def __getitem__(self, key):
+        """Return a TripView for an int, or a sub-table for a slice / mask / index array."""
+        if isinstance(key, (int, np.integer)):
+            n = len(self)
+            row = int(key) + n if key < 0 else int(key)
+            if not 0 <= row < n:
+                raise IndexError("TripTable index out of range")
+            return TripView(self, row)
+        columns = {name: arr[key] for name, arr in self._columns().items()}
+        return TripTable(columns, self._labels())
+
+    def __iter__(self) -> Iterator[TripView]:
+        for row in range(len(self)):
+            yield TripView(self, row)
+
+    @property
+    def duration_minutes(self) -> np.ndarray:
+        """Durations of all trips in minutes (float32)."""
+        return ((self.end_epoch - self.start_epoch) / 60).astype(np.float32)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the per-trip arrays (label arrays excluded)."""
+        return sum(arr.nbytes for arr in self._columns().values())
+
+    def to_frame(self) -> pd.DataFrame:
+        """Decode the table back to a trips DataFrame."""
+        return pd.DataFrame({
+            "trip_id": np.char.decode(self.trip_ids, "utf-8"),
+            "user_id": self.user_labels[self.user_codes],
+            "user_type": self.user_type_labels[self.user_type_codes],
+            "bike_id": self.bike_labels[self.bike_codes],
+            "bike_type": self.bike_type_labels[self.bike_type_codes],
+            "start_station_id": self.station_labels[self.start_station_codes],
+            "end_station_id": self.station_labels[self.end_station_codes],
+            "start_time": self.start_epoch.astype("datetime64[s]"),
+            "end_time": self.end_epoch.astype("datetime64[s]"),
+            "distance_km": self.distance_km.astype(np.float64),
+        }, columns=TRIP_COLUMNS)
+
+    def materialize(
+        self,
+        rows=None,
+        stations: pd.DataFrame | None = None,
+        identity_map: IdentityMap | None = None,
+    ) -> list[Trip]:
+        """Build full models.Trip objects for *rows* (all rows if None).
+
+        Stations must be supplied through *stations* or already be present
+        in *identity_map*.
+        """
+        table = self if rows is None else self[np.asarray(rows, dtype=np.intp)]
+        return create_trips_bulk(table.to_frame(), stations, identity_map)
@@ -7,7 +7,10 @@ Keep I/O-free — these are pure helper functions.
 
 import re
 from datetime import datetime
-from typing import Any
+from typing import Any, NamedTuple
+
+import numpy as np
+import pandas as pd
 
 
 # ---------------------------------------------------------------------------
@@ -75,6 +78,241 @@ def validate_in(value: Any, allowed: set, name: str = "value") -> Any:
     return value
 
 
+# ---------------------------------------------------------------------------
+# Column validation helpers (vectorized)
+# ---------------------------------------------------------------------------
+
+EMAIL_PATTERN = r"[^@\s]+@[^@\s]+"
+
+
+class ColumnReport(NamedTuple):
+    """Offending rows of one column for one validation rule.
+
+    Attributes:
+        column: Column name.
+        rule: Short description of the rule that was checked.
+        rows: Index labels (Series) or positions (arrays) of bad rows.
+        values: The offending values, aligned with *rows*.
+    """
+
+    column: str
+    rule: str
+    rows: np.ndarray
+    values: np.ndarray
+
+    @property
+    def ok(self) -> bool:
+        return len(self.rows) == 0
+
+    @property
+    def n_bad(self) -> int:
+        return len(self.rows)
+
+    def raise_if_bad(self, message: str) -> None:
+        """Raise ValueError with *message* and the first offending rows."""
+        if self.ok:
+            return
+        shown = ", ".join(map(str, self.rows[:10].tolist()))
+        more = f" (+{self.n_bad - 10} more)" if self.n_bad > 10 else ""
+        raise ValueError(f"{message} at rows [{shown}]{more}")
+
+
+def _report(bad: np.ndarray, values: Any, column: str, rule: str) -> ColumnReport:
+    """Build a ColumnReport from a boolean mask over *values*."""
+    bad = np.asarray(bad, dtype=bool)
+    if isinstance(values, (pd.Series, pd.DataFrame)):
+        rows = values.index.to_numpy()[bad]
+        offending = values.to_numpy()[bad]
+    else:
+        rows = np.flatnonzero(bad)
+        offending = np.asarray(values, dtype=object)[bad]
+    return ColumnReport(column, rule, rows, offending.astype(object))
+
+
+def _series(values: Any) -> pd.Series:
+    return values if isinstance(values, pd.Series) else pd.Series(values, dtype=object)
+
+
+def _numeric(values: Any) -> np.ndarray:
+    """Return *values* as floats, with non-numeric entries as NaN."""
+    series = _series(values)
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+    return pd.to_numeric(series, errors="coerce").to_numpy(dtype=np.float64)
+
+
+def raise_for_rows(bad: np.ndarray, values: Any, message: str) -> None:
+    """Raise ValueError naming the rows flagged in the boolean mask *bad*.
+
+    Rows are reported by index label for a Series or DataFrame and by
+    position for arrays and lists.
+    """
+    if np.any(bad):
+        _report(bad, values, "", message).raise_if_bad(message)
+
+
+def check_positive(values: Any, name: str = "value") -> ColumnReport:
+    """Report values that are not > 0 (NaN and non-numeric included)."""
+    return _report(~(_numeric(values) > 0), values, name, "positive")
+
+
+def check_non_negative(values: Any, name: str = "value") -> ColumnReport:
+    """Report values that are not >= 0 (NaN and non-numeric included)."""
+    return _report(~(_numeric(values) >= 0), values, name, "non_negative")
+
+
+def check_numeric(values: Any, name: str = "value") -> ColumnReport:
+    """Report values that are missing or not numbers (negatives allowed)."""
+    return _report(np.isnan(_numeric(values)), values, name, "numeric")
+
+
+def check_email(
+    values: Any, name: str = "email", pattern: str = EMAIL_PATTERN
+) -> ColumnReport:
+    """Report values that are not strings fully matching *pattern*."""
+    series = _series(values)
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        ok = np.zeros(len(series), dtype=bool)
+    else:
+        ok = series.str.fullmatch(pattern).fillna(False).to_numpy(dtype=bool)
+    return _report(~ok, values, name, "email")
+
+
+def check_in(values: Any, allowed: set, name: str = "value") -> ColumnReport:
+    """Report values outside *allowed*, using a single isin() call."""
+    ok = _series(values).isin(list(allowed)).to_numpy()
+    return _report(~ok, values, name, f"in {sorted(allowed)}")
+
+
+def check_not_null(values: Any, name: str = "value") -> ColumnReport:
+    """Report missing values."""
+    return _report(_series(values).isna().to_numpy(), values, name, "not_null")
+
+
+def check_datetime(values: Any, name: str = "value") -> ColumnReport:
+    """Report values that do not parse as YYYY-MM-DD[ HH:MM:SS]."""
+    parsed = pd.to_datetime(_series(values), errors="coerce", format="ISO8601")
+    return _report(parsed.isna().to_numpy(), values, name, "datetime")
+
+
+def check_time_order(
+    start: pd.Series, end: pd.Series, name: str = "end_time"
+) -> ColumnReport:
+    """Report rows where *end* is before *start* (unparseable rows skipped)."""
+    t0 = pd.to_datetime(start, errors="coerce", format="ISO8601")
+    t1 = pd.to_datetime(end, errors="coerce", format="ISO8601")
+    return _report((t1 < t0).to_numpy(), end, name, "after_start")
+
+
+def validate_positive_column(values: Any, name: str = "value") -> Any:
+    """Column version of validate_positive; NaN counts as invalid."""
+    check_positive(values, name).raise_if_bad(f"{name} must be positive")
+    return values
+
+
+def validate_non_negative_column(values: Any, name: str = "value") -> Any:
+    """Column version of validate_non_negative; NaN counts as invalid."""
+    check_non_negative(values, name).raise_if_bad(f"{name} must be non-negative")
+    return values
+
+
+def validate_email_column(values: Any, name: str = "email") -> Any:
+    """Column version of validate_email (string containing '@').
+
+    Accepts exactly what validate_email accepts; use check_email for the
+    stricter EMAIL_PATTERN audit.
+    """
+    ok = pd.Series(values, dtype=object).str.contains("@", regex=False)
+    raise_for_rows(~ok.fillna(False).to_numpy(dtype=bool), values, f"Invalid {name}")
+    return values
+
+
+def validate_in_column(values: Any, allowed: set, name: str = "value") -> Any:
+    """Column version of validate_in, using a single isin() call."""
+    check_in(values, allowed, name).raise_if_bad(f"{name} must be one of {allowed}")
+    return values
+
+
+# ---------------------------------------------------------------------------
+# Data-quality audits
+# ---------------------------------------------------------------------------
+
+TRIP_RULES: list[tuple] = [
+    ("not_null", "trip_id"),
+    ("not_null", "user_id"),
+    ("in", "user_type", VALID_USER_TYPES),
+    ("in", "bike_type", VALID_BIKE_TYPES),
+    ("not_null", "start_station_id"),
+    ("not_null", "end_station_id"),
+    ("datetime", "start_time"),
+    ("datetime", "end_time"),
+    ("time_order", "start_time", "end_time"),
+    ("non_negative", "duration_minutes"),
+    ("non_negative", "distance_km"),
+    ("in", "status", VALID_TRIP_STATUSES),
+]
+
+MAINTENANCE_RULES: list[tuple] = [
+    ("not_null", "record_id"),
+    ("not_null", "bike_id"),
+    ("in", "bike_type", VALID_BIKE_TYPES),
+    ("datetime", "date"),
+    ("in", "maintenance_type", VALID_MAINTENANCE_TYPES),
+    ("non_negative", "cost"),
+]
+
+_CHECKS = {
+    "positive": check_positive,
+    "non_negative": check_non_negative,
+    "numeric": check_numeric,
+    "email": check_email,
+    "not_null": check_not_null,
+    "datetime": check_datetime,
+}
+
+
+def audit_frame(frame: pd.DataFrame, rules: list[tuple]) -> list[ColumnReport]:
+    """Run every rule against *frame* and return one report per rule.
+
+    Each rule is a tuple (kind, column, *args) where kind is one of
+    'positive', 'non_negative', 'email', 'not_null', 'datetime',
+    'in' (args: allowed set) or 'time_order' (args: end column).
+    Rules on columns missing from *frame* are skipped.
+    """
+    reports = []
+    for kind, column, *args in rules:
+        if column not in frame.columns:
+            continue
+        if kind == "in":
+            reports.append(check_in(frame[column], args[0], column))
+        elif kind == "time_order":
+            reports.append(check_time_order(frame[column], frame[args[0]], args[0]))
+        else:
+            reports.append(_CHECKS[kind](frame[column], column))
+    return reports
+
+
+def audit_trips(trips: pd.DataFrame) -> list[ColumnReport]:
+    """Audit a raw or cleaned trips DataFrame against TRIP_RULES."""
+    return audit_frame(trips, TRIP_RULES)
+
+
+def audit_maintenance(maintenance: pd.DataFrame) -> list[ColumnReport]:
+    """Audit a maintenance DataFrame against MAINTENANCE_RULES."""
+    return audit_frame(maintenance, MAINTENANCE_RULES)
+
+
+def summarize_reports(reports: list[ColumnReport], sample: int = 5) -> pd.DataFrame:
+    """Tabulate reports: column, rule, bad-row count and a sample of each."""
+    return pd.DataFrame({
+        "column": [r.column for r in reports],
+        "rule": [r.rule for r in reports],
+        "n_bad": [r.n_bad for r in reports],
+        "rows": [r.rows[:sample].tolist() for r in reports],
+        "values": [r.values[:sample].tolist() for r in reports],
+    })
+
+
 # ---------------------------------------------------------------------------
 # Parsing helpers
 # ---------------------------------------------------------------------------